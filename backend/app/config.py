@@ -23,6 +23,14 @@ def _get_env_int(key: str, default: int) -> int:
         return default
 
 
+def _get_env_bool(key: str, default: bool) -> bool:
+    """Get boolean value from environment variable with fallback."""
+    value = os.getenv(key)
+    if value is None or not value.strip():
+        return default
+    return value.strip().lower() in ("1", "true", "yes", "on")
+
+
 def _get_env_list(key: str, default: list[str], separator: str = ",") -> list[str]:
     """Get list value from environment variable with fallback."""
     value = os.getenv(key)
@@ -37,11 +45,100 @@ OPENAI_API_KEY: str = os.getenv("OPENAI_API_KEY", "")
 # News Collection Settings
 DEFAULT_LOOKBACK_DAYS: int = _get_env_int("LOOKBACK_DAYS", 5)
 MAX_ITEMS: int = _get_env_int("MAX_ITEMS", 40)
+# Longest lookback a request may ask for; feeds are parsed and cached with it
+MAX_LOOKBACK_DAYS: int = 14
+
+# Near-duplicate dedup: stories whose title+summary word sets reach this Jaccard
+# similarity, and move in the same direction, are collapsed to the most
+# credible source (1.0 disables it)
+DEDUP_SIMILARITY_THRESHOLD: float = min(1.0, max(0.0, _get_env_float("DEDUP_SIMILARITY_THRESHOLD", 0.8)))
+DEDUP_MINHASH_PERMUTATIONS: int = 64
+DEDUP_LSH_BANDS: int = 16
+# Resolved canonical article URLs kept in memory
+CANONICAL_URL_CACHE_SIZE: int = max(0, _get_env_int("CANONICAL_URL_CACHE_SIZE", 8192))
 
 # Sentiment Analysis Settings
 HALF_LIFE_HOURS: float = _get_env_float("HALF_LIFE_HOURS", 24.0)
 DEFAULT_SOURCE_WEIGHT: float = _get_env_float("DEFAULT_SOURCE_WEIGHT", 0.75)
 
+# Sentiment Model Settings
+SENTIMENT_MODEL_NAME: str = os.getenv("SENTIMENT_MODEL_NAME", "yiyanghkust/finbert-tone")
+SENTIMENT_MODEL_REVISION: str = os.getenv("SENTIMENT_MODEL_REVISION", "main")
+
+# Inference backend: "torch" (default) or "onnx" (requires an exported model)
+SENTIMENT_BACKEND: str = os.getenv("SENTIMENT_BACKEND", "torch").strip().lower()
+SENTIMENT_ONNX_DIR: str = os.getenv("SENTIMENT_ONNX_DIR", "models/finbert-onnx")
+
+# Opt-in int8 dynamic quantization of the torch model's Linear layers.
+# If SENTIMENT_QUANTIZED_PATH points to a state_dict saved by
+# scripts.evaluate_quantization --save it is loaded instead.
+SENTIMENT_QUANTIZE: bool = _get_env_bool("SENTIMENT_QUANTIZE", False)
+SENTIMENT_QUANTIZED_PATH: str = os.getenv("SENTIMENT_QUANTIZED_PATH", "")
+
+# Max number of scored texts kept in the in-memory sentiment result cache
+SENTIMENT_CACHE_SIZE: int = max(0, _get_env_int("SENTIMENT_CACHE_SIZE", 10000))
+
+# Optional persistent SQLite store behind the result cache (empty disables it)
+SENTIMENT_STORE_PATH: str = os.getenv("SENTIMENT_STORE_PATH", "")
+SENTIMENT_STORE_TTL_HOURS: float = _get_env_float("SENTIMENT_STORE_TTL_HOURS", 168.0)
+
+# Per-ticker index of analyzed items: items seen on an earlier poll reuse their
+# sentiment, weights and rationale. Persisted to SEEN_INDEX_PATH, which falls
+# back to the sentiment store file when unset or empty (memory only if both are)
+SEEN_INDEX_SIZE: int = max(0, _get_env_int("SEEN_INDEX_SIZE", 20000))
+SEEN_INDEX_PATH: str = os.getenv("SEEN_INDEX_PATH") or SENTIMENT_STORE_PATH
+
+# Max texts per forward pass; inputs are sorted by token length and run in
+# buckets of this size so short headlines are not padded to long summaries
+SENTIMENT_BATCH_SIZE: int = max(1, _get_env_int("SENTIMENT_BATCH_SIZE", 16))
+
+# Inference Executor Settings
+# Workers default to one per CPU core; torch threads split the cores between them
+CPU_COUNT: int = os.cpu_count() or 1
+INFERENCE_WORKERS: int = max(1, _get_env_int("INFERENCE_WORKERS", CPU_COUNT))
+TORCH_NUM_THREADS: int = max(1, _get_env_int("TORCH_NUM_THREADS", CPU_COUNT // INFERENCE_WORKERS))
+
+# Cross-request micro-batching: a batch runs when it is full or its oldest text
+# has waited MICROBATCH_MAX_WAIT_MS. Requests that would push more than
+# MICROBATCH_MAX_QUEUED_TEXTS texts into the queue get a 503
+MICROBATCH_MAX_SIZE: int = max(1, _get_env_int("MICROBATCH_MAX_SIZE", 32))
+MICROBATCH_MAX_WAIT_MS: float = max(0.0, _get_env_float("MICROBATCH_MAX_WAIT_MS", 10.0))
+MICROBATCH_MAX_QUEUED_TEXTS: int = max(
+    1, _get_env_int("MICROBATCH_MAX_QUEUED_TEXTS", 4 * INFERENCE_WORKERS * MICROBATCH_MAX_SIZE)
+)
+
+# /sentiment response cache: responses are fresh for the TTL, then served stale
+# for up to RESPONSE_CACHE_STALE_SECONDS while one background refresh rebuilds them
+RESPONSE_CACHE_TTL_SECONDS: float = max(0.0, _get_env_float("RESPONSE_CACHE_TTL_SECONDS", 30.0))
+RESPONSE_CACHE_STALE_SECONDS: float = max(0.0, _get_env_float("RESPONSE_CACHE_STALE_SECONDS", 120.0))
+RESPONSE_CACHE_SIZE: int = max(0, _get_env_int("RESPONSE_CACHE_SIZE", 512))
+
+# POST /sentiment/batch limits: tickers per call and concurrent feed fetches
+BATCH_MAX_TICKERS: int = max(1, _get_env_int("BATCH_MAX_TICKERS", 50))
+BATCH_FETCH_CONCURRENCY: int = max(1, _get_env_int("BATCH_FETCH_CONCURRENCY", 8))
+
+# Background prefetch of popular tickers. PREFETCH_WATCHLIST is always refreshed;
+# up to PREFETCH_MAX_LEARNED more tickers are learned from request frequency.
+PREFETCH_ENABLED: bool = _get_env_bool("PREFETCH_ENABLED", True)
+PREFETCH_WATCHLIST: list[str] = [t.upper() for t in _get_env_list("PREFETCH_WATCHLIST", [])]
+PREFETCH_MAX_LEARNED: int = max(0, _get_env_int("PREFETCH_MAX_LEARNED", 20))
+PREFETCH_INTERVAL_SECONDS: float = max(5.0, _get_env_float("PREFETCH_INTERVAL_SECONDS", 300.0))
+PREFETCH_JITTER: float = min(0.9, max(0.0, _get_env_float("PREFETCH_JITTER", 0.2)))
+PREFETCH_CONCURRENCY: int = max(1, _get_env_int("PREFETCH_CONCURRENCY", 2))
+PREFETCH_POPULARITY_HALF_LIFE_SECONDS: float = max(
+    1.0, _get_env_float("PREFETCH_POPULARITY_HALF_LIFE_SECONDS", 3600.0)
+)
+
+# Adaptive per-(ticker, source) poll intervals: back off while a feed shows no
+# new items, speed up when it does, always within [MIN, MAX]
+PREFETCH_MIN_INTERVAL_SECONDS: float = max(5.0, _get_env_float("PREFETCH_MIN_INTERVAL_SECONDS", 60.0))
+PREFETCH_MAX_INTERVAL_SECONDS: float = max(
+    PREFETCH_MIN_INTERVAL_SECONDS, _get_env_float("PREFETCH_MAX_INTERVAL_SECONDS", 3600.0)
+)
+PREFETCH_BACKOFF_FACTOR: float = max(1.0, _get_env_float("PREFETCH_BACKOFF_FACTOR", 1.5))
+PREFETCH_SPEEDUP_FACTOR: float = max(1.0, _get_env_float("PREFETCH_SPEEDUP_FACTOR", 2.0))
+PREFETCH_BOOST_MINUTES: float = max(1.0, _get_env_float("PREFETCH_BOOST_MINUTES", 480.0))
+
 # Source Credibility Weights (0.0 to 1.0)
 # Higher values indicate more credible sources
 SOURCE_BASE_WEIGHTS: Dict[str, float] = {
@@ -78,6 +175,21 @@ USER_AGENT = (
     "(KHTML, like Gecko) Chrome/120.0 Safari/537.36"
 )
 HTTP_HEADERS = {"User-Agent": USER_AGENT}
+HTTP_TIMEOUT_SECONDS: float = _get_env_float("HTTP_TIMEOUT_SECONDS", 10.0)
+HTTP_MAX_CONNECTIONS: int = _get_env_int("HTTP_MAX_CONNECTIONS", 100)
+HTTP_MAX_KEEPALIVE_CONNECTIONS: int = _get_env_int("HTTP_MAX_KEEPALIVE_CONNECTIONS", 20)
+HTTP_MAX_CONNECTIONS_PER_HOST: int = _get_env_int("HTTP_MAX_CONNECTIONS_PER_HOST", 10)
+HTTP_KEEPALIVE_EXPIRY_SECONDS: float = _get_env_float("HTTP_KEEPALIVE_EXPIRY_SECONDS", 30.0)
+
+# Parsed-feed cache per (source, ticker); Google News changes more slowly than Yahoo
+FEED_CACHE_SIZE: int = max(0, _get_env_int("FEED_CACHE_SIZE", 1024))
+GOOGLE_NEWS_CACHE_TTL_SECONDS: float = max(0.0, _get_env_float("GOOGLE_NEWS_CACHE_TTL_SECONDS", 600.0))
+YAHOO_FINANCE_CACHE_TTL_SECONDS: float = max(0.0, _get_env_float("YAHOO_FINANCE_CACHE_TTL_SECONDS", 180.0))
+
+# Max feed URLs whose ETag/Last-Modified validators and parsed items are kept
+FEED_VALIDATOR_CACHE_SIZE: int = max(0, _get_env_int("FEED_VALIDATOR_CACHE_SIZE", 2048))
+# Parse RSS incrementally as it downloads; false falls back to feedparser
+FEED_STREAMING: bool = _get_env_bool("FEED_STREAMING", True)
 
 # CORS Configuration
 CORS_ALLOW_ORIGINS: list[str] = _get_env_list("CORS_ALLOW_ORIGINS", ["*"])
@@ -0,0 +1,215 @@
+"""
+Incrementally maintained overall sentiment scores.
+
+An item's weight is RECENCY_SHARE * r + static, where static is its source
+and engagement part and r = 2 ** (-age / HALF_LIFE_HOURS). Every recency term
+decays by the same factor over time, so the weighted sums can be kept relative
+to a reference time and rescaled to any later time in closed form:
+
+    sum(r_i(t) * x_i) = 2 ** (-(t - t_ref) / H) * sum(r_i(t_ref) * x_i)
+
+Adding or removing an item is O(1), and the overall score at any time costs
+one exponentiation however many items are aggregated. An update diffs the
+batch's ids against the aggregated ones with set operations and does
+per-item work only for items that joined or left.
+"""
+from __future__ import annotations
+
+import threading
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Dict, Optional, Tuple
+
+import numpy as np
+
+from app.config import HALF_LIFE_HOURS
+from app.core.batch import UNSCORED, NewsBatch
+from app.core.cache import LRUCache
+from app.core.weighting import RECENCY_SHARE, combine_weight_arrays
+
+# Sums are re-based to the current time once the reference is this many
+# half-lives old, which keeps the decay terms in a well-conditioned range
+_REBASE_HALF_LIVES = 16.0
+
+# (ticker, lookback_days, limit): one aggregate per distinct item window
+AggregateKey = Tuple[str, int, int]
+
+
+@dataclass(frozen=True)
+class _Contribution:
+    """Weight parts of one aggregated item."""
+
+    published_ts: float
+    static_weight: float  # source and engagement part of the item weight
+    score: float
+
+
+class SentimentAggregate:
+    """Running weighted sums of one set of items, decayed in closed form."""
+
+    def __init__(self, half_life_hours: float = HALF_LIFE_HOURS):
+        """
+        Args:
+            half_life_hours: Recency half-life, as in calculate_recency_weight
+        """
+        self.half_life_seconds = max(1e-6, half_life_hours) * 3600.0
+        self._items: Dict[str, _Contribution] = {}
+        self._lock = threading.Lock()
+        self._reference_ts: Optional[float] = None
+        self._decayed_score = 0.0   # sum of r_i(t_ref) * score_i
+        self._decayed_weight = 0.0  # sum of r_i(t_ref)
+        self._static_score = 0.0    # sum of static_i * score_i
+        self._static_weight = 0.0   # sum of static_i
+        self._removals = 0
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def _recency_at_reference(self, published_ts: float) -> float:
+        """Recency of an item at the reference time (above 1 if published after it)."""
+        return 2.0 ** ((published_ts - self._reference_ts) / self.half_life_seconds)
+
+    def _apply(self, contribution: _Contribution, sign: float) -> None:
+        """Add (sign 1) or subtract (sign -1) one item's terms from the sums."""
+        recency = self._recency_at_reference(contribution.published_ts)
+        self._decayed_score += sign * recency * contribution.score
+        self._decayed_weight += sign * recency
+        self._static_score += sign * contribution.static_weight * contribution.score
+        self._static_weight += sign * contribution.static_weight
+
+    def _rebase(self, reference_ts: float) -> None:
+        """Recompute the sums from scratch relative to a new reference time."""
+        self._reference_ts = reference_ts
+        self._decayed_score = self._decayed_weight = 0.0
+        self._static_score = self._static_weight = 0.0
+        self._removals = 0
+        for contribution in self._items.values():
+            self._apply(contribution, 1.0)
+
+    def _add(self, item_id: str, contribution: _Contribution) -> None:
+        self._items[item_id] = contribution
+        self._apply(contribution, 1.0)
+
+    def _remove(self, item_id: str) -> None:
+        contribution = self._items.pop(item_id, None)
+        if contribution is not None:
+            self._apply(contribution, -1.0)
+            self._removals += 1
+
+    def _sync(self, batch: NewsBatch, now_ts: float) -> int:
+        """Make the sums cover exactly the scored items of a batch; caller holds the lock."""
+        if self._reference_ts is None:
+            self._reference_ts = now_ts
+
+        # Membership is diffed with set operations over the id keys, so the
+        # per-item work below is only for items that joined or left
+        scored = np.flatnonzero(batch.labels != UNSCORED).tolist()
+        current = dict(zip(map(batch.ids.__getitem__, scored), scored))
+        gone = self._items.keys() - current.keys()
+        new = current.keys() - self._items.keys()
+
+        for item_id in gone:
+            self._remove(item_id)
+
+        if new:
+            new_ids = list(new)
+            positions = np.fromiter(map(current.__getitem__, new_ids), dtype=np.intp, count=len(new_ids))
+            # Items dated in the future count as just published, as in calculate_recency_weight
+            published_ts = np.minimum(batch.published_ts[positions], now_ts).tolist()
+            # The static part is the combined weight of the item at zero recency
+            static_weight = combine_weight_arrays(
+                0.0, batch.source_w[positions].astype(np.float64), batch.engage_w[positions].astype(np.float64)
+            ).tolist()
+            scores = batch.scores[positions].tolist()
+            for item_id, published, static, score in zip(new_ids, published_ts, static_weight, scores):
+                self._add(item_id, _Contribution(float(published), static, score))
+
+        # Subtraction accumulates rounding error; recompute once it adds up
+        if self._removals > max(16, len(self._items)):
+            self._rebase(self._reference_ts)
+        return len(new) + len(gone)
+
+    def _score(self, as_of_ts: float) -> float:
+        """Weighted average of the current sums at a time; caller holds the lock."""
+        if not self._items:
+            return 0.0
+        elapsed = as_of_ts - self._reference_ts
+        if elapsed > _REBASE_HALF_LIVES * self.half_life_seconds:
+            self._rebase(as_of_ts)
+            elapsed = 0.0
+        decay = 2.0 ** (-max(0.0, elapsed) / self.half_life_seconds)
+        numerator = RECENCY_SHARE * decay * self._decayed_score + self._static_score
+        denominator = RECENCY_SHARE * decay * self._decayed_weight + self._static_weight
+        return round(numerator / denominator, 4) if denominator > 0 else 0.0
+
+    def update(self, batch: NewsBatch, as_of: datetime) -> Tuple[int, float]:
+        """
+        Make the aggregate cover exactly the scored items of a batch and score it.
+
+        Both steps run under one lock, so concurrent requests for the same key
+        each get the score of their own items. Only items that joined or left
+        since the last update touch the sums; analysis results of items
+        already aggregated are assumed unchanged.
+
+        Args:
+            batch: Analyzed news batch
+            as_of: Current time, used to clamp future publication dates and
+                to evaluate recency weights
+
+        Returns:
+            Number of items added or removed, and the overall sentiment score
+            between -1.0 and 1.0
+        """
+        as_of_ts = as_of.timestamp()
+        with self._lock:
+            changed = self._sync(batch, as_of_ts)
+            return changed, self._score(as_of_ts)
+
+
+class SentimentAggregates:
+    """Size-bounded registry of aggregates, one per ticker and request window."""
+
+    def __init__(self, max_size: int):
+        """
+        Args:
+            max_size: Maximum number of aggregates kept
+        """
+        self._aggregates: LRUCache[AggregateKey, SentimentAggregate] = LRUCache(max_size)
+        self._lock = threading.Lock()
+        self.updates = 0
+        self.builds = 0
+
+    def overall_score(self, key: AggregateKey, batch: NewsBatch, as_of: datetime) -> float:
+        """
+        Bring a key's aggregate up to date with its items and score it.
+
+        Args:
+            key: (ticker, lookback_days, limit)
+            batch: Analyzed news batch of the response
+            as_of: Response time
+
+        Returns:
+            Overall sentiment score between -1.0 and 1.0
+        """
+        with self._lock:
+            aggregate = self._aggregates.get(key)
+            if aggregate is None:
+                aggregate = SentimentAggregate()
+                self._aggregates.put(key, aggregate)
+                self.builds += 1
+        changed, score = aggregate.update(batch, as_of)
+        with self._lock:
+            self.updates += changed
+        return score
+
+    def get_stats(self) -> Dict[str, int]:
+        """
+        Get registry size and item update counters.
+
+        Returns:
+            Dictionary with aggregates held, aggregates built and item updates
+        """
+        return {"size": len(self._aggregates), "builds": self.builds, "item_updates": self.updates}
+
+
+__all__ = ["AggregateKey", "SentimentAggregate", "SentimentAggregates"]
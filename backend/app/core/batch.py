@@ -0,0 +1,248 @@
+"""
+Columnar (struct-of-arrays) container for news items moving through analysis.
+
+A NewsBatch keeps one array or list per field instead of one object per item:
+interned source ids, int64 publication epochs and float32 sentiment and
+weight columns, with titles, URLs, texts and raw metadata held by reference.
+Collection produces a batch, sentiment scoring, weighting and the seen-item
+index write its columns in place, and NewsItem objects are only built for
+the response.
+"""
+from __future__ import annotations
+
+from datetime import datetime, timezone
+from typing import Dict, Iterable, List, Optional, Sequence
+
+import numpy as np
+
+from app.models import JsonDict, NewsItem, SentimentResult
+
+# Label codes of the `labels` column; -1 marks an item not yet scored
+LABELS = ("positive", "neutral", "negative")
+LABEL_CODES: Dict[str, int] = {label: code for code, label in enumerate(LABELS)}
+UNSCORED = -1
+
+# Positions into a batch; None means every item
+Positions = Optional[np.ndarray]
+
+# Decimal places float32 columns carry for values in [-1, 1]
+_FLOAT32_DECIMALS = 7
+
+
+def _floats(column: np.ndarray) -> list:
+    """Python floats of a float32 column, without float32-to-double noise (0.7, not 0.699999988)."""
+    return np.round(column.astype(np.float64), _FLOAT32_DECIMALS).tolist()
+
+
+class NewsBatch:
+    """News items of one collection, stored column by column."""
+
+    __slots__ = (
+        "ids",
+        "sources",
+        "source_ids",
+        "published_ts",
+        "titles",
+        "urls",
+        "texts",
+        "raws",
+        "rationales",
+        "fallback_rationales",
+        "labels",
+        "probabilities",
+        "scores",
+        "recency_w",
+        "source_w",
+        "engage_w",
+        "weight",
+        "weighted_score",
+    )
+
+    def __init__(
+        self,
+        ids: List[str],
+        sources: List[str],
+        source_ids: np.ndarray,
+        published_ts: np.ndarray,
+        titles: List[str],
+        urls: List[str],
+        texts: List[str],
+        raws: List[JsonDict],
+        rationales: Optional[List[str]] = None,
+    ):
+        """
+        Args:
+            ids: Stable item ids from make_news_id
+            sources: Distinct source domains
+            source_ids: int32 index into `sources` per item
+            published_ts: int64 publication time per item, epoch seconds
+            titles: Item titles
+            urls: Item URLs
+            texts: Item summaries or texts
+            raws: Source metadata per item (shared, never mutated)
+            rationales: Item rationales (defaults to empty strings)
+        """
+        count = len(ids)
+        self.ids = ids
+        self.sources = sources
+        self.source_ids = source_ids
+        self.published_ts = published_ts
+        self.titles = titles
+        self.urls = urls
+        self.texts = texts
+        self.raws = raws
+        self.rationales = rationales if rationales is not None else [""] * count
+        # Rationales that are rule-based fallbacks, shown but never persisted
+        self.fallback_rationales = np.zeros(count, dtype=bool)
+
+        # Sentiment and weight columns, filled by analysis
+        self.labels = np.full(count, UNSCORED, dtype=np.int8)
+        self.probabilities = np.zeros((count, len(LABELS)), dtype=np.float32)
+        self.scores = np.zeros(count, dtype=np.float32)
+        self.recency_w = np.zeros(count, dtype=np.float32)
+        self.source_w = np.zeros(count, dtype=np.float32)
+        self.engage_w = np.zeros(count, dtype=np.float32)
+        self.weight = np.zeros(count, dtype=np.float32)
+        self.weighted_score = np.zeros(count, dtype=np.float32)
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    @classmethod
+    def from_items(cls, items: Iterable[NewsItem]) -> "NewsBatch":
+        """
+        Build a batch from NewsItem objects, keeping their strings and raw metadata by reference.
+
+        Analysis results already set on the items are carried over.
+
+        Args:
+            items: News items, e.g. from the parsed-feed cache
+
+        Returns:
+            New batch in item order
+        """
+        items = list(items)
+        source_index: Dict[str, int] = {}
+        batch = cls(
+            ids=[item.id for item in items],
+            sources=[],
+            source_ids=np.fromiter(
+                (source_index.setdefault(item.source, len(source_index)) for item in items),
+                dtype=np.int32,
+                count=len(items),
+            ),
+            published_ts=np.fromiter(
+                (int(item.published_at.timestamp()) for item in items), dtype=np.int64, count=len(items)
+            ),
+            titles=[item.title for item in items],
+            urls=[item.url for item in items],
+            texts=[item.text for item in items],
+            raws=[item.raw for item in items],
+            rationales=[item.rationale for item in items],
+        )
+        batch.sources = list(source_index)
+
+        scored = [position for position, item in enumerate(items) if item.label is not None]
+        for position in scored:
+            item = items[position]
+            batch.labels[position] = LABEL_CODES.get(item.label, UNSCORED)
+            batch.probabilities[position] = (
+                item.prob_positive or 0.0, item.prob_neutral or 0.0, item.prob_negative or 0.0
+            )
+            batch.scores[position] = item.score or 0.0
+            batch.recency_w[position] = item.recency_w or 0.0
+            batch.source_w[position] = item.source_w or 0.0
+            batch.engage_w[position] = item.engage_w or 0.0
+            batch.weight[position] = item.weight or 0.0
+            batch.weighted_score[position] = item.weighted_score or 0.0
+        return batch
+
+    def positions(self, positions: Positions = None) -> np.ndarray:
+        """Resolve optional positions to an index array (None selects every item)."""
+        if positions is None:
+            return np.arange(len(self), dtype=np.intp)
+        return np.asarray(positions, dtype=np.intp)
+
+    def source_domains(self, positions: Positions = None) -> List[str]:
+        """Source domain per selected item."""
+        return [self.sources[source_id] for source_id in self.source_ids[self.positions(positions)].tolist()]
+
+    def model_inputs(self, positions: Positions = None) -> List[str]:
+        """FinBERT input strings (title and summary) of the selected items."""
+        return [f"{self.titles[i]}. {self.texts[i]}".strip() for i in self.positions(positions).tolist()]
+
+    def set_sentiment(self, positions: Positions, results: Sequence[SentimentResult]) -> None:
+        """
+        Store FinBERT results for items.
+
+        Args:
+            positions: Items the results belong to, in order
+            results: One (label, p_pos, p_neu, p_neg, score) tuple per position
+        """
+        positions = self.positions(positions)
+        if not len(positions):
+            return
+        self.labels[positions] = [LABEL_CODES.get(label, UNSCORED) for label, *_ in results]
+        self.probabilities[positions] = [(p_pos, p_neu, p_neg) for _, p_pos, p_neu, p_neg, _ in results]
+        self.scores[positions] = [score for *_, score in results]
+
+    def sentiment_results(self, positions: Positions = None) -> List[SentimentResult]:
+        """(label, p_pos, p_neu, p_neg, score) tuples of scored items."""
+        positions = self.positions(positions)
+        return [
+            (LABELS[label], p_pos, p_neu, p_neg, score)
+            for label, (p_pos, p_neu, p_neg), score in zip(
+                self.labels[positions].tolist(),
+                _floats(self.probabilities[positions]),
+                _floats(self.scores[positions]),
+            )
+        ]
+
+    def to_items(self, positions: Positions = None) -> List[NewsItem]:
+        """
+        Materialize NewsItem objects, e.g. for the API response or the rationale model.
+
+        Args:
+            positions: Items to materialize (defaults to all)
+
+        Returns:
+            New NewsItem objects in position order
+        """
+        positions = self.positions(positions)
+        sources = self.source_domains(positions)
+        published_ts = self.published_ts[positions].tolist()
+        labels = self.labels[positions].tolist()
+        probabilities = _floats(self.probabilities[positions])
+        scores = _floats(self.scores[positions])
+        recency_w = _floats(self.recency_w[positions])
+        source_w = _floats(self.source_w[positions])
+        engage_w = _floats(self.engage_w[positions])
+        weight = _floats(self.weight[positions])
+        weighted_score = _floats(self.weighted_score[positions])
+
+        items: List[NewsItem] = []
+        for j, i in enumerate(positions.tolist()):
+            item = NewsItem(
+                id=self.ids[i],
+                source=sources[j],
+                title=self.titles[i],
+                url=self.urls[i],
+                published_at=datetime.fromtimestamp(published_ts[j], tz=timezone.utc),
+                text=self.texts[i],
+                raw=self.raws[i],
+                rationale=self.rationales[i],
+            )
+            if labels[j] != UNSCORED:
+                item.label = LABELS[labels[j]]
+                item.prob_positive, item.prob_neutral, item.prob_negative = probabilities[j]
+                item.score = scores[j]
+                item.recency_w = recency_w[j]
+                item.source_w = source_w[j]
+                item.engage_w = engage_w[j]
+                item.weight = weight[j]
+                item.weighted_score = weighted_score[j]
+            items.append(item)
+        return items
+
+
+__all__ = ["LABELS", "LABEL_CODES", "NewsBatch", "Positions", "UNSCORED"]
@@ -0,0 +1,307 @@
+"""
+Result caches for the analysis pipeline.
+"""
+from __future__ import annotations
+
+import hashlib
+import logging
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Dict, Generic, Hashable, Iterable, Optional, Set, TypeVar
+
+from app.core.store import SqliteSentimentStore
+from app.models import SentimentResult
+
+logger = logging.getLogger(__name__)
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+
+class LRUCache(Generic[K, V]):
+    """Thread-safe size-bounded mapping that evicts the least recently used entry."""
+
+    def __init__(self, max_size: int):
+        """
+        Args:
+            max_size: Maximum number of entries (0 disables caching)
+        """
+        self.max_size = max(0, max_size)
+        self._data: OrderedDict[K, V] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: K) -> Optional[V]:
+        """Get a value and mark it as recently used, or None if absent."""
+        with self._lock:
+            value = self._data.get(key)
+            if value is not None:
+                self._data.move_to_end(key)
+            return value
+
+    def put(self, key: K, value: V) -> None:
+        """Insert or refresh a value, evicting the oldest entries if over capacity."""
+        if self.max_size == 0:
+            return
+        with self._lock:
+            self._data[key] = value
+            self._data.move_to_end(key)
+            while len(self._data) > self.max_size:
+                self._data.popitem(last=False)
+
+    def pop(self, key: K) -> Optional[V]:
+        """Remove and return a value, or None if absent."""
+        with self._lock:
+            return self._data.pop(key, None)
+
+    def clear(self) -> None:
+        """Remove all entries."""
+        with self._lock:
+            self._data.clear()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+
+class SentimentCache:
+    """
+    Content-addressed cache of FinBERT results.
+
+    Keys are a hash of the exact model input string plus the model name and
+    revision, so a model upgrade never serves stale scores. An optional
+    persistent store sits behind the in-memory LRU so results survive restarts.
+    """
+
+    def __init__(
+        self,
+        max_size: int,
+        model_id: str,
+        store: Optional[SqliteSentimentStore] = None,
+    ):
+        """
+        Args:
+            max_size: Maximum number of cached texts
+            model_id: Model name and revision, e.g. "yiyanghkust/finbert-tone@main"
+            store: Optional persistent store consulted on in-memory misses
+        """
+        self.model_id = model_id
+        self.store = store
+        self._entries: LRUCache[str, SentimentResult] = LRUCache(max_size)
+        self._stats_lock = threading.Lock()
+        self.hits = 0
+        self.store_hits = 0
+        self.misses = 0
+
+    def make_key(self, text: str) -> str:
+        """
+        Build the cache key for a model input string.
+
+        Args:
+            text: Exact text passed to the model
+
+        Returns:
+            32-character hexadecimal content hash
+        """
+        key = f"{self.model_id}\x00{text}".encode("utf-8", "ignore")
+        return hashlib.blake2b(key, digest_size=16).hexdigest()
+
+    def get_many(self, texts: Iterable[str]) -> Dict[str, SentimentResult]:
+        """
+        Look up cached results for several texts.
+
+        Args:
+            texts: Model input strings
+
+        Returns:
+            Mapping of text to cached result for the texts that were found
+        """
+        found: Dict[str, SentimentResult] = {}
+        missing: Dict[str, str] = {}
+        for text in dict.fromkeys(texts):
+            key = self.make_key(text)
+            result = self._entries.get(key)
+            if result is None:
+                missing[key] = text
+            else:
+                found[text] = result
+
+        memory_hits = len(found)
+        if missing and self.store is not None:
+            try:
+                stored = self.store.get_many(missing)
+            except Exception as e:
+                logger.warning("Sentiment store lookup failed: %s", e)
+                stored = {}
+            for key, result in stored.items():
+                self._entries.put(key, result)
+                found[missing.pop(key)] = result
+
+        with self._stats_lock:
+            self.hits += memory_hits
+            self.store_hits += len(found) - memory_hits
+            self.misses += len(missing)
+        return found
+
+    def put_many(self, results: Dict[str, SentimentResult]) -> None:
+        """
+        Store results for several texts.
+
+        Args:
+            results: Mapping of model input string to its result
+        """
+        keyed = {self.make_key(text): tuple(result) for text, result in results.items()}
+        for key, result in keyed.items():
+            self._entries.put(key, result)
+
+        if keyed and self.store is not None:
+            try:
+                self.store.put_many(keyed)
+            except Exception as e:
+                logger.warning("Sentiment store write failed: %s", e)
+
+    def clear(self) -> None:
+        """Remove all in-memory results and reset counters."""
+        self._entries.clear()
+        with self._stats_lock:
+            self.hits = 0
+            self.store_hits = 0
+            self.misses = 0
+
+    def get_stats(self) -> Dict[str, float]:
+        """
+        Get cache size and hit/miss counters.
+
+        Returns:
+            Dictionary of cache statistics
+        """
+        lookups = self.hits + self.store_hits + self.misses
+        return {
+            "size": len(self._entries),
+            "max_size": self._entries.max_size,
+            "persistent": self.store is not None,
+            "hits": self.hits,
+            "store_hits": self.store_hits,
+            "misses": self.misses,
+            "hit_rate": round((self.hits + self.store_hits) / lookups, 4) if lookups else 0.0,
+        }
+
+
+@dataclass
+class CachedResponse(Generic[V]):
+    """A cached value together with its freshness windows."""
+
+    value: V
+    ttl_seconds: float
+    stale_seconds: float
+    stored_at: float = field(default_factory=time.monotonic)
+
+    @property
+    def age(self) -> float:
+        """Seconds since the value was stored."""
+        return max(0.0, time.monotonic() - self.stored_at)
+
+    @property
+    def is_fresh(self) -> bool:
+        """Whether the value is within its TTL."""
+        return self.age < self.ttl_seconds
+
+    @property
+    def is_servable(self) -> bool:
+        """Whether the value is fresh or within the stale-while-revalidate window."""
+        return self.age < self.ttl_seconds + self.stale_seconds
+
+
+class ResponseCache(Generic[K, V]):
+    """
+    TTL cache with a stale-while-revalidate window and LRU eviction.
+
+    Fresh entries are served as-is. Stale entries are still served while a
+    single background refresh per key rebuilds them; callers coordinate that
+    refresh with try_begin_refresh/end_refresh.
+    """
+
+    def __init__(self, max_size: int, ttl_seconds: float, stale_seconds: float):
+        """
+        Args:
+            max_size: Maximum number of cached responses
+            ttl_seconds: Seconds a response stays fresh (0 disables caching)
+            stale_seconds: Extra seconds a stale response may be served while refreshing
+        """
+        self.ttl_seconds = max(0.0, ttl_seconds)
+        self.stale_seconds = max(0.0, stale_seconds)
+        self._entries: LRUCache[K, CachedResponse[V]] = LRUCache(max_size if self.ttl_seconds else 0)
+        self._refreshing: Set[K] = set()
+        self.hits = 0
+        self.stale_hits = 0
+        self.misses = 0
+        self.refreshes = 0
+
+    def get(self, key: K) -> Optional[CachedResponse[V]]:
+        """
+        Get a servable cached response.
+
+        Args:
+            key: Cache key
+
+        Returns:
+            Fresh or stale-but-servable entry, or None on a miss
+        """
+        entry = self._entries.get(key)
+        if entry is None or not entry.is_servable:
+            self.misses += 1
+            return None
+        if entry.is_fresh:
+            self.hits += 1
+        else:
+            self.stale_hits += 1
+        return entry
+
+    def put(self, key: K, value: V) -> CachedResponse[V]:
+        """
+        Store a freshly built response.
+
+        Args:
+            key: Cache key
+            value: Response to cache
+
+        Returns:
+            The stored entry
+        """
+        entry = CachedResponse(value, self.ttl_seconds, self.stale_seconds)
+        self._entries.put(key, entry)
+        return entry
+
+    def try_begin_refresh(self, key: K) -> bool:
+        """Claim the background refresh for a key; False if one is already running."""
+        if key in self._refreshing:
+            return False
+        self._refreshing.add(key)
+        self.refreshes += 1
+        return True
+
+    def end_refresh(self, key: K) -> None:
+        """Release the background refresh claim for a key."""
+        self._refreshing.discard(key)
+
+    def get_stats(self) -> Dict[str, float]:
+        """
+        Get cache size and hit counters.
+
+        Returns:
+            Dictionary of cache statistics
+        """
+        return {
+            "size": len(self._entries),
+            "max_size": self._entries.max_size,
+            "ttl_seconds": self.ttl_seconds,
+            "stale_seconds": self.stale_seconds,
+            "hits": self.hits,
+            "stale_hits": self.stale_hits,
+            "misses": self.misses,
+            "refreshes": self.refreshes,
+            "refreshing": len(self._refreshing),
+        }
+
+
+__all__ = ["CachedResponse", "LRUCache", "ResponseCache", "SentimentCache"]
@@ -0,0 +1,249 @@
+"""
+Near-duplicate clustering of news texts with MinHash and LSH banding.
+
+Each text becomes a set of normalized word tokens. A MinHash signature
+estimates Jaccard similarity between sets, and LSH banding over the signature
+finds candidate pairs without comparing every pair. Candidates are confirmed
+with the exact Jaccard similarity of their token sets. The cost is linear in
+the number of texts.
+
+Direction words ("jumps", "falls") are kept out of the shingles and carried
+as direction markers instead: stories that moved opposite ways share almost
+every other word, so they are never clustered unless their markers match.
+"""
+from __future__ import annotations
+
+import re
+import threading
+import zlib
+from typing import Dict, FrozenSet, List, Sequence
+
+import numpy as np
+
+# Mersenne prime modulus for the universal hash family a*x + b mod p
+_MERSENNE_PRIME = np.uint64((1 << 61) - 1)
+
+# Odd multipliers folding a band's rows into a single bucket key
+_BAND_MULTIPLIERS = np.random.default_rng(2).integers(1, 1 << 63, size=64, dtype=np.uint64) | np.uint64(1)
+
+_TAG_PATTERN = re.compile(r"<[^>]+>")
+_ENTITY_PATTERN = re.compile(r"&[a-z]+;|&#\d+;")
+_TOKEN_PATTERN = re.compile(r"[a-z0-9]+")
+
+# Words that carry no story identity in financial headlines
+_STOP_WORDS = frozenset(
+    "a an and are as at be by for from has have in into is it its of on or that the "
+    "this to was were will with after amid over says said report reports new".split()
+)
+
+# Stems of headline wording that syndicated rewrites swap freely
+_SYNONYMS = {"shar": "stock"}
+
+# Stems of price-direction words, mapped to direction markers. Markers start
+# with "+", which word tokens never do.
+_UP, _DOWN = "+up", "+down"
+_DIRECTIONS = {
+    **dict.fromkeys(
+        "ris ros jump climb gain surg soar rally rebound advanc spik up higher".split(), _UP
+    ),
+    **dict.fromkeys(
+        "fall fell drop slid slump sink sank tumbl plung declin slip dip down lower".split(), _DOWN
+    ),
+}
+
+# Titles with fewer tokens than this also use their summary
+_MIN_TITLE_TOKENS = 4
+
+
+def _stem(token: str) -> str:
+    """Reduce a word to a crude stem and map headline synonyms ("shares" -> "stock")."""
+    if token.endswith("ies") and len(token) > 4:
+        token = token[:-3] + "y"
+    elif token.endswith("s") and not token.endswith("ss") and len(token) > 3:
+        token = token[:-1]
+    for suffix in ("ing", "ed"):
+        if token.endswith(suffix) and len(token) - len(suffix) >= 3:
+            token = token[: -len(suffix)]
+            break
+    if token.endswith("e") and len(token) > 3:
+        token = token[:-1]
+    return _SYNONYMS.get(token, token)
+
+
+def _words(text: str) -> List[str]:
+    """Stemmed, stop-word-free words of a text with HTML removed."""
+    plain = _ENTITY_PATTERN.sub(" ", _TAG_PATTERN.sub(" ", text.lower()))
+    return [_stem(token) for token in _TOKEN_PATTERN.findall(plain) if token not in _STOP_WORDS]
+
+
+def text_tokens(title: str, summary: str = "") -> FrozenSet[str]:
+    """
+    Get the token set identifying a story: its word unigrams and bigrams plus direction markers.
+
+    Words are lowercased, stemmed and mapped to a common synonym, with HTML
+    and stop words removed. Direction words become markers rather than
+    shingles. Only the title is used unless it is too short to be
+    distinctive, since summaries differ by source (Google News repeats the
+    headline, Yahoo Finance carries the article lead).
+
+    Args:
+        title: Story title
+        summary: Story summary or text
+
+    Returns:
+        Set of unigram and bigram shingles and direction markers
+    """
+    words = _words(title or "")
+    if len(words) < _MIN_TITLE_TOKENS and summary:
+        words += _words(summary)
+    directions = frozenset(_DIRECTIONS[word] for word in words if word in _DIRECTIONS)
+    words = [word for word in words if word not in _DIRECTIONS]
+    return frozenset(words) | frozenset(f"{a} {b}" for a, b in zip(words, words[1:])) | directions
+
+
+def directions(tokens: FrozenSet[str]) -> FrozenSet[str]:
+    """Direction markers of a token set from text_tokens."""
+    return frozenset(token for token in tokens if token in (_UP, _DOWN))
+
+
+def is_near_duplicate(a: FrozenSet[str], b: FrozenSet[str], threshold: float) -> bool:
+    """
+    Whether two token sets from text_tokens describe the same story.
+
+    Args:
+        a: First token set
+        b: Second token set
+        threshold: Minimum Jaccard similarity
+
+    Returns:
+        True if their direction markers match and their similarity reaches the threshold
+    """
+    return directions(a) == directions(b) and jaccard(a, b) >= threshold
+
+
+def jaccard(a: FrozenSet[str], b: FrozenSet[str]) -> float:
+    """Jaccard similarity of two token sets (0 if both are empty)."""
+    if not a or not b:
+        return 0.0
+    return len(a & b) / len(a | b)
+
+
+class MinHasher:
+    """MinHash signatures from a fixed, seeded family of hash permutations."""
+
+    # Token sets hashed per numpy pass, bounding the permuted-hash matrix
+    CHUNK_SIZE = 2048
+
+    def __init__(self, num_perm: int = 64, seed: int = 1):
+        """
+        Args:
+            num_perm: Signature length
+            seed: Seed of the permutation family, fixed so signatures are stable
+        """
+        rng = np.random.default_rng(seed)
+        # a, b < 2**31 and token hashes < 2**32 keep a*x + b inside uint64
+        self._a = rng.integers(1, 1 << 31, size=(num_perm, 1), dtype=np.uint64)
+        self._b = rng.integers(0, 1 << 31, size=(num_perm, 1), dtype=np.uint64)
+        self.num_perm = num_perm
+
+    def signatures(self, token_sets: Sequence[FrozenSet[str]]) -> np.ndarray:
+        """
+        Get the MinHash signatures of non-empty token sets.
+
+        Args:
+            token_sets: Non-empty token sets
+
+        Returns:
+            uint64 array of shape (len(token_sets), num_perm)
+        """
+        result = np.empty((len(token_sets), self.num_perm), dtype=np.uint64)
+        for start in range(0, len(token_sets), self.CHUNK_SIZE):
+            chunk = token_sets[start:start + self.CHUNK_SIZE]
+            lengths = np.fromiter((len(tokens) for tokens in chunk), dtype=np.int64, count=len(chunk))
+            hashes = np.fromiter(
+                (zlib.crc32(token.encode()) for tokens in chunk for token in tokens),
+                dtype=np.uint64,
+                count=int(lengths.sum()),
+            )
+            permuted = (self._a * hashes + self._b) % _MERSENNE_PRIME
+            offsets = np.concatenate(([0], np.cumsum(lengths)[:-1]))
+            result[start:start + len(chunk)] = np.minimum.reduceat(permuted, offsets, axis=1).T
+        return result
+
+
+def cluster_near_duplicates(
+    token_sets: Sequence[FrozenSet[str]],
+    threshold: float,
+    num_perm: int = 64,
+    bands: int = 16,
+) -> List[int]:
+    """
+    Group token sets that are near duplicates (see is_near_duplicate).
+
+    Each set is compared only with the first set sharing one of its LSH
+    buckets, so the work grows linearly with the number of sets. Pairs are
+    joined transitively.
+
+    Args:
+        token_sets: One token set per text
+        threshold: Minimum Jaccard similarity for two texts to be duplicates
+        num_perm: MinHash signature length
+        bands: LSH bands; num_perm must divide evenly into them
+
+    Returns:
+        Cluster id per input position (the index of the cluster's first member)
+    """
+    parent = list(range(len(token_sets)))
+
+    def find(index: int) -> int:
+        while parent[index] != index:
+            parent[index] = parent[parent[index]]
+            index = parent[index]
+        return index
+
+    positions = np.array([index for index, tokens in enumerate(token_sets) if tokens], dtype=np.int64)
+    if len(positions) < 2:
+        return parent
+
+    hasher = _get_hasher(num_perm)
+    signatures = hasher.signatures([token_sets[index] for index in positions])
+
+    # Fold each band's rows into one bucket key (uint64 arithmetic wraps)
+    rows = num_perm // bands
+    banded = signatures[:, : bands * rows].reshape(len(positions), bands, rows)
+    keys = (banded * _BAND_MULTIPLIERS[:rows]).sum(axis=2, dtype=np.uint64)
+
+    for band in range(bands):
+        _, first, inverse = np.unique(keys[:, band], return_index=True, return_inverse=True)
+        leaders = first[inverse.ravel()]
+        joined = leaders != np.arange(len(positions))
+        for member, leader in zip(positions[joined].tolist(), positions[leaders[joined]].tolist()):
+            root, other = find(member), find(leader)
+            if root != other and is_near_duplicate(token_sets[member], token_sets[leader], threshold):
+                # Keep the earlier member as root so cluster ids are stable
+                parent[max(root, other)] = min(root, other)
+
+    return [find(index) for index in range(len(token_sets))]
+
+
+_hashers: Dict[int, MinHasher] = {}
+_hashers_lock = threading.Lock()
+
+
+def _get_hasher(num_perm: int) -> MinHasher:
+    """Get the shared MinHasher for a signature length."""
+    with _hashers_lock:
+        hasher = _hashers.get(num_perm)
+        if hasher is None:
+            hasher = _hashers[num_perm] = MinHasher(num_perm)
+        return hasher
+
+
+__all__ = [
+    "MinHasher",
+    "cluster_near_duplicates",
+    "directions",
+    "is_near_duplicate",
+    "jaccard",
+    "text_tokens",
+]
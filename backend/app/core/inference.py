@@ -0,0 +1,74 @@
+"""
+Executor for running CPU-bound model inference off the event loop.
+
+Forward passes run on a dedicated thread pool (torch releases the GIL during
+its kernels). Back-pressure is applied in front of it by the micro-batcher,
+whose queue limit turns overload into fast 503 responses instead of
+unbounded latency.
+"""
+from __future__ import annotations
+
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Optional
+
+from app.config import INFERENCE_WORKERS, TORCH_NUM_THREADS
+
+
+class InferenceQueueFullError(RuntimeError):
+    """Raised when the micro-batch queue is at its configured limit."""
+
+
+_executor: Optional[ThreadPoolExecutor] = None
+
+
+def configure_torch_threads() -> None:
+    """
+    Set torch's intra-op thread count.
+
+    The setting is process-wide, so it is applied once at startup rather
+    than per inference worker.
+    """
+    try:
+        import torch
+    except ImportError:
+        return
+    torch.set_num_threads(TORCH_NUM_THREADS)
+
+
+def get_inference_executor() -> ThreadPoolExecutor:
+    """
+    Get the shared inference executor, creating it on first use.
+
+    Returns:
+        ThreadPoolExecutor sized by INFERENCE_WORKERS
+    """
+    global _executor
+    if _executor is None:
+        _executor = ThreadPoolExecutor(
+            max_workers=INFERENCE_WORKERS,
+            thread_name_prefix="inference",
+        )
+    return _executor
+
+
+def shutdown_inference_executor() -> None:
+    """Stop the inference executor, waiting for running jobs to finish."""
+    global _executor
+    if _executor is not None:
+        _executor.shutdown(wait=True, cancel_futures=True)
+        _executor = None
+
+
+def get_inference_stats() -> Dict[str, int]:
+    """
+    Get inference executor settings.
+
+    Queue depth and rejections are reported by the micro-batcher.
+
+    Returns:
+        Dictionary with worker and torch thread counts
+    """
+    return {
+        "workers": INFERENCE_WORKERS,
+        "torch_threads": TORCH_NUM_THREADS,
+    }
@@ -0,0 +1,93 @@
+"""
+Lightweight in-process metrics for tuning the inference pipeline.
+"""
+from __future__ import annotations
+
+import threading
+from bisect import bisect_left
+from typing import Any, Dict, List, Sequence
+
+
+class Histogram:
+    """Fixed-bucket histogram of observed values (e.g. batch sizes, wait times)."""
+
+    def __init__(self, bounds: Sequence[float]):
+        """
+        Args:
+            bounds: Upper bounds of the buckets; an overflow bucket is added
+        """
+        self.bounds: List[float] = sorted(bounds)
+        self.counts: List[int] = [0] * (len(self.bounds) + 1)
+        self.count = 0
+        self.total = 0.0
+
+    def observe(self, value: float) -> None:
+        """Record a single observation."""
+        self.counts[bisect_left(self.bounds, value)] += 1
+        self.count += 1
+        self.total += value
+
+    def snapshot(self) -> Dict[str, Any]:
+        """
+        Get a JSON-serializable view of the histogram.
+
+        Returns:
+            Dictionary with count, sum, mean and per-bucket counts
+        """
+        buckets = {f"le_{bound:g}": count for bound, count in zip(self.bounds, self.counts)}
+        buckets["le_inf"] = self.counts[-1]
+        return {
+            "count": self.count,
+            "sum": round(self.total, 4),
+            "mean": round(self.total / self.count, 4) if self.count else 0.0,
+            "buckets": buckets,
+        }
+
+
+class PaddingStats:
+    """Thread-safe counters of real versus padded tokens sent to the model."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.real_tokens = 0
+        self.padded_tokens = 0
+        self.unbucketed_padded_tokens = 0
+        self.forward_passes = 0
+
+    def record(self, real_tokens: int, padded_tokens: int, unbucketed_padded_tokens: int, forward_passes: int) -> None:
+        """
+        Record the token counts of one bucketed prediction call.
+
+        Args:
+            real_tokens: Non-padding tokens across all texts
+            padded_tokens: Tokens actually run, including padding
+            unbucketed_padded_tokens: Tokens the same call would have run in input order
+            forward_passes: Number of forward passes used
+        """
+        with self._lock:
+            self.real_tokens += real_tokens
+            self.padded_tokens += padded_tokens
+            self.unbucketed_padded_tokens += unbucketed_padded_tokens
+            self.forward_passes += forward_passes
+
+    def snapshot(self) -> Dict[str, Any]:
+        """
+        Get a JSON-serializable view of the counters.
+
+        Returns:
+            Dictionary with token counts and padding overhead ratios
+        """
+        with self._lock:
+            real, padded, unbucketed = self.real_tokens, self.padded_tokens, self.unbucketed_padded_tokens
+            passes = self.forward_passes
+        return {
+            "forward_passes": passes,
+            "real_tokens": real,
+            "padded_tokens": padded,
+            "unbucketed_padded_tokens": unbucketed,
+            "padding_ratio": round(padded / real, 4) if real else 0.0,
+            "unbucketed_padding_ratio": round(unbucketed / real, 4) if real else 0.0,
+        }
+
+
+__all__ = ["Histogram", "PaddingStats"]
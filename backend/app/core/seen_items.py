@@ -0,0 +1,226 @@
+"""
+Per-ticker index of analyzed news items.
+
+Feeds repeat most of their entries between polls, and make_news_id gives each
+entry a stable id. Once an item has been scored and explained, later polls
+hydrate it from this index and recompute only its recency weight, so a
+steady-state poll sends nothing to FinBERT or the rationale model.
+"""
+from __future__ import annotations
+
+import asyncio
+import logging
+import threading
+from datetime import datetime, timezone
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+from app.config import MAX_LOOKBACK_DAYS, SEEN_INDEX_PATH, SEEN_INDEX_SIZE
+from app.core.batch import UNSCORED, NewsBatch
+from app.core.cache import LRUCache
+from app.core.sentiment import sentiment_cache
+from app.core.store import SqliteSeenItemStore
+from app.core.weighting import combine_weight_arrays, recency_weights
+from app.models import SeenItem
+
+logger = logging.getLogger(__name__)
+
+
+class SeenItemIndex:
+    """
+    Analyzed items keyed by (ticker, item id), with an optional persistent store.
+
+    The in-memory LRU is consulted first; the store, shared by all workers,
+    fills its misses.
+    """
+
+    def __init__(self, max_size: int, store: Optional[SqliteSeenItemStore] = None):
+        """
+        Args:
+            max_size: Maximum number of items kept in memory
+            store: Optional persistent store consulted on in-memory misses
+        """
+        self.store = store
+        self._entries: LRUCache[Tuple[str, str], SeenItem] = LRUCache(max_size)
+        self._stats_lock = threading.Lock()
+        self.hits = 0
+        self.store_hits = 0
+        self.misses = 0
+        self.written = 0
+
+    @property
+    def enabled(self) -> bool:
+        """Whether the index can hold any items."""
+        return self._entries.max_size > 0 or self.store is not None
+
+    async def _lookup(self, ticker: str, item_ids: List[str]) -> Dict[str, SeenItem]:
+        """Get the index entries for item ids, from memory first and then the store (off the event loop)."""
+        found: Dict[str, SeenItem] = {}
+        missing: List[str] = []
+        for item_id in item_ids:
+            seen = self._entries.get((ticker, item_id))
+            if seen is None:
+                missing.append(item_id)
+            else:
+                found[item_id] = seen
+
+        memory_hits = len(found)
+        if missing and self.store is not None:
+            try:
+                stored = await asyncio.to_thread(self.store.get_many, ticker, missing)
+            except Exception as e:
+                logger.warning("Seen-item store lookup failed: %s", e)
+                stored = {}
+            for item_id, seen in stored.items():
+                self._entries.put((ticker, item_id), seen)
+                found[item_id] = seen
+
+        with self._stats_lock:
+            self.hits += memory_hits
+            self.store_hits += len(found) - memory_hits
+            self.misses += len(item_ids) - len(found)
+        return found
+
+    async def hydrate(self, ticker: str, batch: NewsBatch) -> np.ndarray:
+        """
+        Fill in items analyzed on an earlier poll and return the positions of the rest.
+
+        Hydrated items get their stored sentiment, source and engagement
+        weights and rationale; recency and the combined weight are recomputed
+        for the current time.
+
+        Args:
+            ticker: Stock ticker symbol
+            batch: Collected news batch
+
+        Returns:
+            Positions of items that still need sentiment analysis, in order
+        """
+        if not len(batch) or not self.enabled:
+            return batch.positions()
+
+        found = await self._lookup(ticker, batch.ids)
+        new_positions: List[int] = []
+        hydrated: List[int] = []
+        entries: List[SeenItem] = []
+        for position, item_id in enumerate(batch.ids):
+            seen = found.get(item_id)
+            if seen is None:
+                new_positions.append(position)
+            else:
+                hydrated.append(position)
+                entries.append(seen)
+                if not batch.rationales[position]:
+                    batch.rationales[position] = seen.rationale
+
+        if entries:
+            positions = np.asarray(hydrated, dtype=np.intp)
+            batch.set_sentiment(positions, [seen.sentiment for seen in entries])
+            source_w = np.fromiter((seen.source_w for seen in entries), dtype=np.float64, count=len(entries))
+            engage_w = np.fromiter((seen.engage_w for seen in entries), dtype=np.float64, count=len(entries))
+            # One shared `now` for every recency weight
+            recency_w = recency_weights(batch.published_ts[positions], datetime.now(timezone.utc).timestamp())
+            weight = combine_weight_arrays(recency_w, source_w, engage_w)
+            batch.recency_w[positions] = recency_w
+            batch.source_w[positions] = source_w
+            batch.engage_w[positions] = engage_w
+            batch.weight[positions] = weight
+            batch.weighted_score[positions] = weight * batch.scores[positions]
+
+        return np.asarray(new_positions, dtype=np.intp)
+
+    def record(self, ticker: str, batch: NewsBatch) -> None:
+        """
+        Remember analyzed items whose entry is missing or has gained a rationale.
+
+        Fallback rationales are not recorded, so the item is explained by the
+        model on a later poll. May block on the persistent store; call it off
+        the event loop.
+
+        Args:
+            ticker: Stock ticker symbol
+            batch: News batch with sentiment analysis and weights applied
+        """
+        if not self.enabled:
+            return
+
+        scored = np.flatnonzero(batch.labels != UNSCORED)
+        fallbacks = batch.fallback_rationales[scored].tolist()
+        results = batch.sentiment_results(scored)
+        source_w = batch.source_w[scored].tolist()
+        engage_w = batch.engage_w[scored].tolist()
+        published_ts = batch.published_ts[scored].tolist()
+
+        changed: Dict[str, SeenItem] = {}
+        for j, position in enumerate(scored.tolist()):
+            item_id = batch.ids[position]
+            key = (ticker, item_id)
+            current = self._entries.get(key)
+            rationale = "" if fallbacks[j] else batch.rationales[position]
+            rationale = rationale or (current.rationale if current else "")
+            if current is not None and current.rationale == rationale:
+                continue
+
+            seen = SeenItem(
+                sentiment=results[j],
+                source_w=source_w[j],
+                engage_w=engage_w[j],
+                rationale=rationale,
+                published_ts=float(published_ts[j]),
+            )
+            self._entries.put(key, seen)
+            changed[item_id] = seen
+
+        with self._stats_lock:
+            self.written += len(changed)
+
+        if changed and self.store is not None:
+            try:
+                self.store.put_many(ticker, changed)
+            except Exception as e:
+                logger.warning("Seen-item store write failed: %s", e)
+
+    def clear(self) -> None:
+        """Remove all in-memory items and reset counters."""
+        self._entries.clear()
+        with self._stats_lock:
+            self.hits = 0
+            self.store_hits = 0
+            self.misses = 0
+            self.written = 0
+
+    def get_stats(self) -> Dict[str, float]:
+        """
+        Get index size and hit/miss counters.
+
+        Returns:
+            Dictionary of index statistics
+        """
+        lookups = self.hits + self.store_hits + self.misses
+        return {
+            "size": len(self._entries),
+            "max_size": self._entries.max_size,
+            "persistent": self.store is not None,
+            "hits": self.hits,
+            "store_hits": self.store_hits,
+            "misses": self.misses,
+            "written": self.written,
+            "hit_rate": round((self.hits + self.store_hits) / lookups, 4) if lookups else 0.0,
+        }
+
+
+_seen_item_store = (
+    SqliteSeenItemStore(
+        SEEN_INDEX_PATH,
+        sentiment_cache.model_id,
+        # Items older than the longest lookback are never collected again
+        retention_seconds=MAX_LOOKBACK_DAYS * 86400.0,
+    )
+    if SEEN_INDEX_PATH
+    else None
+)
+seen_items = SeenItemIndex(SEEN_INDEX_SIZE, store=_seen_item_store)
+
+
+__all__ = ["SeenItemIndex", "seen_items"]
@@ -6,25 +6,104 @@ FinBERT model with sophisticated multi-factor weighting for news importance.
 """
 from __future__ import annotations
 
+import asyncio
+import functools
+import hashlib
+import inspect
 import math
+import os
+import threading
+import time
 from datetime import datetime, timezone
-from functools import lru_cache
-from typing import List, Tuple
+from typing import Any, Dict, List, Optional, Sequence, Set, Tuple
+
+import numpy as np
 
 from app.config import (
     DEFAULT_SOURCE_WEIGHT,
     HALF_LIFE_HOURS,
+    INFERENCE_WORKERS,
+    MICROBATCH_MAX_QUEUED_TEXTS,
+    MICROBATCH_MAX_SIZE,
+    MICROBATCH_MAX_WAIT_MS,
+    SENTIMENT_BACKEND,
+    SENTIMENT_BATCH_SIZE,
+    SENTIMENT_CACHE_SIZE,
+    SENTIMENT_MODEL_NAME,
+    SENTIMENT_MODEL_REVISION,
+    SENTIMENT_ONNX_DIR,
+    SENTIMENT_QUANTIZE,
+    SENTIMENT_QUANTIZED_PATH,
+    SENTIMENT_STORE_PATH,
+    SENTIMENT_STORE_TTL_HOURS,
     SOURCE_BASE_WEIGHTS,
+    TORCH_NUM_THREADS,
+)
+from app.core.batch import NewsBatch, Positions
+from app.core.cache import SentimentCache
+from app.core.inference import InferenceQueueFullError, get_inference_executor
+from app.core.metrics import Histogram, PaddingStats
+from app.core.store import SqliteSentimentStore
+from app.core.weighting import (
+    DEFAULT_ENGAGEMENT_WEIGHT,
+    apply_batch_weights,
+    combine_weight_arrays,
 )
-from app.models import NewsItem
+from app.models import NewsItem, SentimentResult
 from app.utils import clamp_to_unit_range
 
 
-@lru_cache(maxsize=1)
-def _load_sentiment_model() -> Tuple:
+# Tokenizer truncation length shared by every backend
+MAX_SEQUENCE_LENGTH = 256
+
+# Positional input order of BertForSequenceClassification.forward (used for ONNX export)
+ONNX_INPUT_NAMES = ("input_ids", "attention_mask", "token_type_ids")
+
+
+def _load_once(loader):
+    """
+    Cache a model loader's results per argument set.
+    
+    Unlike functools.lru_cache, concurrent first calls wait for a single load
+    instead of each loading their own copy, and omitted arguments share a
+    cache entry with their explicit default values.
+    """
+    signature = inspect.signature(loader)
+    results: Dict[Tuple, Any] = {}
+    lock = threading.Lock()
+
+    @functools.wraps(loader)
+    def wrapper(*args, **kwargs):
+        bound = signature.bind(*args, **kwargs)
+        bound.apply_defaults()
+        key = tuple(bound.arguments.values())
+        if key in results:
+            return results[key]
+        with lock:
+            if key not in results:
+                results[key] = loader(*args, **kwargs)
+            return results[key]
+
+    wrapper.cache_clear = results.clear
+    return wrapper
+
+
+def _quantize_dynamic(model):
+    """Quantize a torch model's Linear layers to int8 in place."""
+    import torch
+
+    return torch.ao.quantization.quantize_dynamic(model, {torch.nn.Linear}, dtype=torch.qint8, inplace=True)
+
+
+@_load_once
+def _load_sentiment_model(quantized: bool = SENTIMENT_QUANTIZE) -> Tuple:
     """
     Load the FinBERT sentiment analysis model.
     
+    Args:
+        quantized: Apply int8 dynamic quantization to the Linear layers, or load
+            the pre-quantized model at SENTIMENT_QUANTIZED_PATH if it exists
+    
     Returns:
         Tuple of (tokenizer, model) for sentiment analysis
         
@@ -32,7 +111,7 @@ def _load_sentiment_model() -> Tuple:
         RuntimeError: If required dependencies are not installed
     """
     try:
-        from transformers import AutoTokenizer, AutoModelForSequenceClassification
+        from transformers import AutoConfig, AutoTokenizer, AutoModelForSequenceClassification
         import torch
     except ImportError as e:
         raise RuntimeError(
@@ -40,20 +119,272 @@ def _load_sentiment_model() -> Tuple:
             "Try: pip install transformers && pip install --index-url https://download.pytorch.org/whl/cpu torch"
         ) from e
 
-    model_name = "yiyanghkust/finbert-tone"
-    tokenizer = AutoTokenizer.from_pretrained(model_name)
-    model = AutoModelForSequenceClassification.from_pretrained(model_name)
+    tokenizer = AutoTokenizer.from_pretrained(SENTIMENT_MODEL_NAME, revision=SENTIMENT_MODEL_REVISION)
+
+    if quantized and SENTIMENT_QUANTIZED_PATH and os.path.exists(SENTIMENT_QUANTIZED_PATH):
+        # int8 state_dict written by scripts.evaluate_quantization --save, loaded
+        # into a freshly built and quantized model; weights_only refuses pickled code
+        config = AutoConfig.from_pretrained(SENTIMENT_MODEL_NAME, revision=SENTIMENT_MODEL_REVISION)
+        model = _quantize_dynamic(AutoModelForSequenceClassification.from_config(config))
+        model.load_state_dict(torch.load(SENTIMENT_QUANTIZED_PATH, map_location="cpu", weights_only=True))
+    else:
+        model = AutoModelForSequenceClassification.from_pretrained(
+            SENTIMENT_MODEL_NAME, revision=SENTIMENT_MODEL_REVISION
+        )
+        if quantized:
+            model = _quantize_dynamic(model)
     model.eval()
     
     return tokenizer, model
 
 
-def analyze_sentiment_batch(texts: List[str]) -> List[Tuple[str, float, float, float, float]]:
+@_load_once
+def _load_onnx_model() -> Tuple:
     """
-    Analyze sentiment for a batch of texts using FinBERT.
+    Load the exported FinBERT ONNX graph into an onnxruntime CPU session.
+    
+    Returns:
+        Tuple of (tokenizer, session) for sentiment analysis
+        
+    Raises:
+        RuntimeError: If onnxruntime is not installed or the model has not been exported
+    """
+    try:
+        from transformers import AutoTokenizer
+        import onnxruntime as ort
+    except ImportError as e:
+        raise RuntimeError(
+            "ONNX backend dependencies are missing. Install transformers and onnxruntime.\n"
+            "Try: pip install transformers onnxruntime"
+        ) from e
+
+    model_path = os.path.join(SENTIMENT_ONNX_DIR, "model.onnx")
+    if not os.path.exists(model_path):
+        raise RuntimeError(
+            f"ONNX model not found at {model_path}. "
+            "Export it first with: python -m scripts.export_onnx"
+        )
+
+    options = ort.SessionOptions()
+    options.intra_op_num_threads = TORCH_NUM_THREADS
+    options.inter_op_num_threads = 1
+    options.graph_optimization_level = ort.GraphOptimizationLevel.ORT_ENABLE_ALL
+
+    session = ort.InferenceSession(model_path, options, providers=["CPUExecutionProvider"])
+    tokenizer = AutoTokenizer.from_pretrained(SENTIMENT_ONNX_DIR)
+
+    return tokenizer, session
+
+
+def _file_digest(path: str) -> str:
+    """Short SHA-256 of a model artifact file."""
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            digest.update(chunk)
+    return digest.hexdigest()[:16]
+
+
+# Results keyed by model input text hash plus model name, revision and backend;
+# a saved quantized model also adds its file hash, so re-saving invalidates results
+_MODEL_ID = f"{SENTIMENT_MODEL_NAME}@{SENTIMENT_MODEL_REVISION}"
+if SENTIMENT_BACKEND != "torch":
+    _MODEL_ID = f"{_MODEL_ID}/{SENTIMENT_BACKEND}"
+elif SENTIMENT_QUANTIZE:
+    _MODEL_ID = f"{_MODEL_ID}/int8"
+    if SENTIMENT_QUANTIZED_PATH and os.path.exists(SENTIMENT_QUANTIZED_PATH):
+        _MODEL_ID = f"{_MODEL_ID}:{_file_digest(SENTIMENT_QUANTIZED_PATH)}"
+_sentiment_store = (
+    SqliteSentimentStore(SENTIMENT_STORE_PATH, _MODEL_ID, ttl_seconds=SENTIMENT_STORE_TTL_HOURS * 3600.0)
+    if SENTIMENT_STORE_PATH
+    else None
+)
+sentiment_cache = SentimentCache(SENTIMENT_CACHE_SIZE, _MODEL_ID, store=_sentiment_store)
+
+
+def _torch_probabilities(batch: List[str], quantized: bool = SENTIMENT_QUANTIZE) -> np.ndarray:
+    """
+    Run one PyTorch forward pass and return class probabilities.
+    
+    Args:
+        batch: Texts for a single forward pass
+        quantized: Use the int8 dynamically quantized model
+        
+    Returns:
+        Array of shape (len(batch), 3) in FinBERT label order
+    """
+    import torch
+
+    tokenizer, model = _load_sentiment_model(quantized)
+    encoded = tokenizer(
+        batch,
+        padding=True,
+        truncation=True,
+        max_length=MAX_SEQUENCE_LENGTH,
+        return_tensors="pt"
+    )
+    with torch.no_grad():
+        logits = model(**encoded).logits
+        return torch.softmax(logits, dim=-1).cpu().numpy()
+
+
+def _onnx_probabilities(batch: List[str]) -> np.ndarray:
+    """
+    Run one onnxruntime forward pass and return class probabilities.
+    
+    Args:
+        batch: Texts for a single forward pass
+        
+    Returns:
+        Array of shape (len(batch), 3) in FinBERT label order
+    """
+    tokenizer, session = _load_onnx_model()
+    encoded = tokenizer(
+        batch,
+        padding=True,
+        truncation=True,
+        max_length=MAX_SEQUENCE_LENGTH,
+        return_tensors="np"
+    )
+    feeds = {
+        graph_input.name: encoded[graph_input.name].astype(np.int64)
+        for graph_input in session.get_inputs()
+    }
+    logits = session.run(None, feeds)[0]
+
+    # Numerically stable softmax
+    exp = np.exp(logits - logits.max(axis=-1, keepdims=True))
+    return exp / exp.sum(axis=-1, keepdims=True)
+
+
+_PROBABILITY_BACKENDS = {
+    "torch": _torch_probabilities,
+    "onnx": _onnx_probabilities,
+}
+
+
+def _to_sentiment_result(prob: np.ndarray) -> SentimentResult:
+    """
+    Convert one row of FinBERT probabilities to a sentiment result tuple.
+    
+    Args:
+        prob: Probabilities in FinBERT label order [neutral, positive, negative]
+        
+    Returns:
+        Tuple of (label, p_pos, p_neu, p_neg, score)
+    """
+    p_neutral, p_positive, p_negative = float(prob[0]), float(prob[1]), float(prob[2])
+    
+    # Calculate sentiment score
+    score = max(-1.0, min(1.0, p_positive - p_negative))
+    
+    # Determine label based on highest probability
+    if p_positive > max(p_neutral, p_negative):
+        label = "positive"
+    elif p_negative > max(p_positive, p_neutral):
+        label = "negative"
+    else:
+        label = "neutral"
+    
+    return (label, p_positive, p_neutral, p_negative, score)
+
+
+_MODEL_LOADERS = {
+    "torch": _load_sentiment_model,
+    "onnx": _load_onnx_model,
+}
+
+# Real vs padded token counts for every prediction call
+padding_stats = PaddingStats()
+
+
+_WARMUP_TEXT = "Company shares rise after quarterly results beat analyst estimates"
+
+# Model lifecycle: not_loaded -> loading -> ready | failed
+_model_status: Dict[str, Any] = {
+    "state": "not_loaded",
+    "backend": SENTIMENT_BACKEND,
+    "model_id": _MODEL_ID,
+    "load_seconds": None,
+    "warmup_seconds": None,
+    "ready_at": None,
+    "error": None,
+}
+
+
+def warm_up_model() -> Dict[str, Any]:
+    """
+    Load the configured model and prime it with dummy forward passes.
+    
+    Blocking; meant to run on a worker thread at startup. The dummy passes
+    at full and single batch size initialize kernels and allocator pools so
+    the first real request does not pay for them.
+    
+    Returns:
+        Model status dictionary after warm-up
+    """
+    _model_status.update(state="loading", error=None)
+    try:
+        start = time.perf_counter()
+        _MODEL_LOADERS[SENTIMENT_BACKEND]()
+        loaded = time.perf_counter()
+
+        predict_probabilities = _PROBABILITY_BACKENDS[SENTIMENT_BACKEND]
+        predict_probabilities([_WARMUP_TEXT] * SENTIMENT_BATCH_SIZE)
+        predict_probabilities([_WARMUP_TEXT])
+        warmed = time.perf_counter()
+    except Exception as e:
+        _model_status.update(state="failed", error=str(e))
+        raise
+
+    _model_status.update(
+        state="ready",
+        load_seconds=round(loaded - start, 3),
+        warmup_seconds=round(warmed - loaded, 3),
+        ready_at=datetime.now(timezone.utc).isoformat(),
+    )
+    return dict(_model_status)
+
+
+def is_model_ready() -> bool:
+    """Check whether the model has been loaded and warmed up."""
+    return _model_status["state"] == "ready"
+
+
+def get_model_status() -> Dict[str, Any]:
+    """
+    Get the model lifecycle state and load-time metrics.
+    
+    Returns:
+        Dictionary with state, backend, load/warm-up seconds and last error
+    """
+    return dict(_model_status)
+
+
+def _padded_tokens(lengths: List[int], batch_size: int) -> int:
+    """Count tokens run when lengths are chunked in order and padded per chunk."""
+    return sum(
+        max(lengths[i : i + batch_size]) * len(lengths[i : i + batch_size])
+        for i in range(0, len(lengths), batch_size)
+    )
+
+
+def _predict_sentiment(
+    texts: List[str],
+    batch_size: int = SENTIMENT_BATCH_SIZE,
+    backend: str = SENTIMENT_BACKEND,
+) -> List[SentimentResult]:
+    """
+    Run FinBERT forward passes for a list of texts, bypassing the cache.
+    
+    Texts are sorted by token length and split into buckets of at most
+    batch_size, so each forward pass is padded only to its own longest text.
+    Results are returned in input order.
     
     Args:
         texts: List of text strings to analyze
+        batch_size: Maximum number of texts per forward pass
+        backend: Inference backend, "torch" or "onnx"
         
     Returns:
         List of tuples: (label, p_pos, p_neu, p_neg, score)
@@ -62,52 +393,63 @@ def analyze_sentiment_batch(texts: List[str]) -> List[Tuple[str, float, float, f
     if not texts:
         return []
 
-    # Lazy imports to avoid startup overhead
-    from transformers import AutoTokenizer
-    import torch
+    if backend not in _PROBABILITY_BACKENDS:
+        raise ValueError(f"Unknown sentiment backend: {backend}")
+    predict_probabilities = _PROBABILITY_BACKENDS[backend]
+    batch_size = max(1, batch_size)
 
-    tokenizer, model = _load_sentiment_model()
-    results: List[Tuple[str, float, float, float, float]] = []
+    # Token lengths after truncation, without padding
+    tokenizer = _MODEL_LOADERS[backend]()[0]
+    lengths = [
+        len(ids)
+        for ids in tokenizer(texts, truncation=True, max_length=MAX_SEQUENCE_LENGTH)["input_ids"]
+    ]
+    order = sorted(range(len(texts)), key=lengths.__getitem__)
 
-    with torch.no_grad():
-        # Process in batches of 16 for memory efficiency
-        for i in range(0, len(texts), 16):
-            batch = texts[i : i + 16]
-            
-            # Tokenize batch
-            encoded = tokenizer(
-                batch,
-                padding=True,
-                truncation=True,
-                max_length=256,
-                return_tensors="pt"
-            )
-            
-            # Get model predictions
-            logits = model(**encoded).logits
-            probabilities = torch.softmax(logits, dim=-1).cpu().numpy()
-            
-            # Process each item in the batch
-            # FinBERT label order: [neutral, positive, negative]
-            for prob in probabilities:
-                p_neutral, p_positive, p_negative = float(prob[0]), float(prob[1]), float(prob[2])
-                
-                # Calculate sentiment score
-                score = max(-1.0, min(1.0, p_positive - p_negative))
-                
-                # Determine label based on highest probability
-                if p_positive > max(p_neutral, p_negative):
-                    label = "positive"
-                elif p_negative > max(p_positive, p_neutral):
-                    label = "negative"
-                else:
-                    label = "neutral"
-                
-                results.append((label, p_positive, p_neutral, p_negative, score))
+    results: List[Optional[SentimentResult]] = [None] * len(texts)
+    for i in range(0, len(order), batch_size):
+        bucket = order[i : i + batch_size]
+        probabilities = predict_probabilities([texts[j] for j in bucket])
+        for j, prob in zip(bucket, probabilities):
+            results[j] = _to_sentiment_result(prob)
+
+    padding_stats.record(
+        real_tokens=sum(lengths),
+        padded_tokens=_padded_tokens([lengths[j] for j in order], batch_size),
+        unbucketed_padded_tokens=_padded_tokens(lengths, batch_size),
+        forward_passes=(len(texts) + batch_size - 1) // batch_size,
+    )
     
     return results
 
 
+def analyze_sentiment_batch(texts: List[str], batch_size: int = SENTIMENT_BATCH_SIZE) -> List[SentimentResult]:
+    """
+    Analyze sentiment for a batch of texts using FinBERT.
+    
+    Only texts missing from the result cache are sent to the model.
+    
+    Args:
+        texts: List of text strings to analyze
+        batch_size: Maximum number of texts per forward pass
+        
+    Returns:
+        List of tuples: (label, p_pos, p_neu, p_neg, score)
+        where score = p_pos - p_neg, clipped to [-1, 1]
+    """
+    if not texts:
+        return []
+
+    cached = sentiment_cache.get_many(texts)
+    misses = [text for text in dict.fromkeys(texts) if text not in cached]
+    if misses:
+        scored = dict(zip(misses, _predict_sentiment(misses, batch_size)))
+        sentiment_cache.put_many(scored)
+        cached.update(scored)
+
+    return [cached[text] for text in texts]
+
+
 def calculate_recency_weight(published_at: datetime) -> float:
     """
     Calculate recency weight using exponential decay.
@@ -157,7 +499,7 @@ def calculate_engagement_weight(item: NewsItem) -> float:
         return clamp_to_unit_range(raw_score / 10.0)
     
     # Default engagement for articles
-    return 0.5
+    return DEFAULT_ENGAGEMENT_WEIGHT
 
 
 def combine_weights(recency_weight: float, source_weight: float, engagement_weight: float) -> float:
@@ -173,54 +515,377 @@ def combine_weights(recency_weight: float, source_weight: float, engagement_weig
         Combined weight between 0.0 and 1.0
     """
     # Weighted combination: 50% recency, 30% source, 20% engagement
-    combined = 0.5 * recency_weight + 0.3 * source_weight + 0.2 * engagement_weight
-    return clamp_to_unit_range(combined)
+    return float(combine_weight_arrays(recency_weight, source_weight, engagement_weight))
 
 
 def analyze_news_items(items: List[NewsItem]) -> List[NewsItem]:
     """
     Perform complete sentiment analysis and weighting on news items.
     
+    Runs the columnar batch path synchronously; the API uses
+    analyze_batch_async instead.
+    
     Args:
         items: List of NewsItem objects to analyze
         
     Returns:
-        List of NewsItem objects with sentiment analysis and weights applied
+        New NewsItem objects with sentiment analysis and weights applied
     """
     if not items:
         return []
 
-    # Prepare texts for sentiment analysis
-    texts = [f"{item.title}. {item.text}".strip() for item in items]
+    batch = NewsBatch.from_items(items)
+    batch.set_sentiment(None, analyze_sentiment_batch(batch.model_inputs()))
+    apply_batch_weights(batch)
+    return batch.to_items()
+
+
+# Queue entry: (text, enqueue time from time.perf_counter(), result future)
+_QueueEntry = Tuple[str, float, "asyncio.Future[SentimentResult]"]
+
+
+class MicroBatcher:
+    """
+    Cross-request dynamic batching scheduler for FinBERT.
+
+    Concurrent callers submit texts to one shared queue. The scheduler forms a
+    batch once it holds max_batch_size texts or its oldest text has waited
+    max_wait_ms, runs it on the inference executor as length-bucketed forward
+    passes and resolves each caller's futures. At most max_concurrent_batches
+    batches run at once; while they are busy the queue keeps filling, so
+    batches grow under load.
+    """
+
+    def __init__(
+        self,
+        max_batch_size: int = MICROBATCH_MAX_SIZE,
+        max_wait_ms: float = MICROBATCH_MAX_WAIT_MS,
+        max_concurrent_batches: int = INFERENCE_WORKERS,
+        max_queued_texts: int = MICROBATCH_MAX_QUEUED_TEXTS,
+    ):
+        self.max_batch_size = max(1, max_batch_size)
+        self.max_wait_ms = max(0.0, max_wait_ms)
+        self.max_concurrent_batches = max(1, max_concurrent_batches)
+        self.max_queued_texts = max(1, max_queued_texts)
+
+        self.batch_size_histogram = Histogram([1, 2, 4, 8, 16, 32, 64, 128])
+        self.wait_ms_histogram = Histogram([1, 2, 5, 10, 20, 50, 100, 250, 1000])
+        self.rejected_requests = 0
+
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._queue: Optional[asyncio.Queue[_QueueEntry]] = None
+        self._slots: Optional[asyncio.Semaphore] = None
+        self._scheduler: Optional[asyncio.Task] = None
+        self._batches: Set[asyncio.Task] = set()
+        # Entries taken off the queue for the batch being collected
+        self._collecting: List[_QueueEntry] = []
+
+    def _ensure_started(self) -> None:
+        """Start the scheduler task on the running event loop if needed."""
+        loop = asyncio.get_running_loop()
+        if self._scheduler is not None and not self._scheduler.done() and self._loop is loop:
+            return
+        self._loop = loop
+        self._queue = asyncio.Queue()
+        self._slots = asyncio.Semaphore(self.max_concurrent_batches)
+        self._scheduler = loop.create_task(self._run())
+
+    async def submit(self, texts: List[str]) -> List[SentimentResult]:
+        """
+        Queue texts for batched inference and wait for their results.
+        
+        Args:
+            texts: List of text strings to analyze
+            
+        Returns:
+            List of (label, p_pos, p_neu, p_neg, score) tuples in input order
+            
+        Raises:
+            InferenceQueueFullError: If the queue cannot take all texts
+        """
+        if not texts:
+            return []
+
+        self._ensure_started()
+        if self._queue.qsize() + len(texts) > self.max_queued_texts:
+            self.rejected_requests += 1
+            raise InferenceQueueFullError(
+                f"Micro-batch queue is full ({self._queue.qsize()} queued texts)"
+            )
+
+        enqueued_at = time.perf_counter()
+        futures = [self._loop.create_future() for _ in texts]
+        for text, future in zip(texts, futures):
+            self._queue.put_nowait((text, enqueued_at, future))
+
+        try:
+            return list(await asyncio.gather(*futures))
+        except asyncio.CancelledError:
+            # Drop our texts from any batch that has not started yet
+            for future in futures:
+                future.cancel()
+            raise
+
+    async def submit_many(self, texts: List[str]) -> List[SentimentResult]:
+        """
+        Submit an arbitrarily long list of texts in batch-sized chunks.
+        
+        Chunks are submitted with at most max_concurrent_batches in flight, so
+        large multi-ticker requests fill whole batches without tripping the
+        queue limit.
+        
+        Args:
+            texts: List of text strings to analyze
+            
+        Returns:
+            List of (label, p_pos, p_neu, p_neg, score) tuples in input order
+        """
+        if len(texts) <= self.max_batch_size:
+            return await self.submit(texts)
+
+        slots = asyncio.Semaphore(self.max_concurrent_batches)
+
+        async def submit_chunk(chunk: List[str]) -> List[SentimentResult]:
+            async with slots:
+                return await self.submit(chunk)
+
+        chunks = await asyncio.gather(*(
+            submit_chunk(texts[i : i + self.max_batch_size])
+            for i in range(0, len(texts), self.max_batch_size)
+        ))
+        return [result for chunk in chunks for result in chunk]
+
+    async def stop(self) -> None:
+        """Stop the scheduler and fail any texts still waiting for a batch."""
+        if self._scheduler is not None:
+            self._scheduler.cancel()
+            try:
+                await self._scheduler
+            except asyncio.CancelledError:
+                pass
+            self._scheduler = None
+
+        if self._batches:
+            await asyncio.gather(*self._batches, return_exceptions=True)
+
+        while self._queue is not None and not self._queue.empty():
+            _, _, future = self._queue.get_nowait()
+            if not future.done():
+                future.set_exception(RuntimeError("Micro-batcher stopped"))
+
+    async def _run(self) -> None:
+        """Scheduler loop: wait for a free slot, collect a batch, dispatch it."""
+        while True:
+            await self._slots.acquire()
+            try:
+                batch = await self._collect_batch()
+            except BaseException:
+                self._slots.release()
+                # Entries already off the queue would otherwise never resolve
+                for _, _, future in self._collecting:
+                    if not future.done():
+                        future.set_exception(RuntimeError("Micro-batcher stopped"))
+                self._collecting = []
+                raise
+            task = asyncio.create_task(self._run_batch(batch))
+            self._batches.add(task)
+            task.add_done_callback(self._batches.discard)
+
+    async def _collect_batch(self) -> List[_QueueEntry]:
+        """Collect texts until the batch is full or the wait budget runs out."""
+        batch = self._collecting = [await self._queue.get()]
+        deadline = time.perf_counter() + self.max_wait_ms / 1000.0
+
+        while len(batch) < self.max_batch_size:
+            try:
+                batch.append(self._queue.get_nowait())
+                continue
+            except asyncio.QueueEmpty:
+                pass
+
+            remaining = deadline - time.perf_counter()
+            if remaining <= 0:
+                break
+            try:
+                batch.append(await asyncio.wait_for(self._queue.get(), remaining))
+            except asyncio.TimeoutError:
+                break
+
+        self._collecting = []
+        return batch
+
+    async def _run_batch(self, batch: List[_QueueEntry]) -> None:
+        """Run inference for one batch and resolve its futures."""
+        try:
+            # Skip texts whose callers have gone away
+            live = [entry for entry in batch if not entry[2].done()]
+            if not live:
+                return
+
+            started_at = time.perf_counter()
+            self.batch_size_histogram.observe(len(live))
+            for _, enqueued_at, _ in live:
+                self.wait_ms_histogram.observe((started_at - enqueued_at) * 1000.0)
+
+            texts = [text for text, _, _ in live]
+            try:
+                results = await self._loop.run_in_executor(
+                    get_inference_executor(),
+                    functools.partial(_predict_sentiment, texts),
+                )
+            except Exception as e:
+                for _, _, future in live:
+                    if not future.done():
+                        future.set_exception(e)
+                return
+
+            for (_, _, future), result in zip(live, results):
+                if not future.done():
+                    future.set_result(result)
+        finally:
+            self._slots.release()
+
+    @property
+    def queued_texts(self) -> int:
+        """Number of texts waiting for a batch."""
+        return self._queue.qsize() if self._queue is not None else 0
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get batch-size and queue-wait histograms plus current queue state.
+        
+        Returns:
+            Dictionary of micro-batching statistics
+        """
+        return {
+            "max_batch_size": self.max_batch_size,
+            "max_wait_ms": self.max_wait_ms,
+            "queued_texts": self.queued_texts,
+            "max_queued_texts": self.max_queued_texts,
+            "running_batches": len(self._batches),
+            "rejected_requests": self.rejected_requests,
+            "batch_size": self.batch_size_histogram.snapshot(),
+            "wait_ms": self.wait_ms_histogram.snapshot(),
+        }
+
+
+_micro_batcher: Optional[MicroBatcher] = None
+
+
+def get_micro_batcher() -> MicroBatcher:
+    """
+    Get the shared micro-batcher, creating it on first use.
+    
+    Returns:
+        Process-wide MicroBatcher instance
+    """
+    global _micro_batcher
+    if _micro_batcher is None:
+        _micro_batcher = MicroBatcher()
+    return _micro_batcher
+
+
+async def stop_micro_batcher() -> None:
+    """Stop the shared micro-batcher if it was started."""
+    if _micro_batcher is not None:
+        await _micro_batcher.stop()
+
+
+async def score_texts_async(texts: List[str]) -> List[SentimentResult]:
+    """
+    Score texts through the result cache and the shared micro-batcher.
+    
+    Args:
+        texts: Model input strings
+        
+    Returns:
+        One (label, p_pos, p_neu, p_neg, score) tuple per text
+        
+    Raises:
+        InferenceQueueFullError: If the inference queue is at capacity
+    """
+    if not texts:
+        return []
+
+    # Only cache misses are queued for the model; the persistent store is
+    # read off the event loop
+    cached = await asyncio.to_thread(sentiment_cache.get_many, texts)
+    misses = [text for text in dict.fromkeys(texts) if text not in cached]
+    if misses:
+        scored = dict(zip(misses, await get_micro_batcher().submit_many(misses)))
+        # The persistent store may wait on other workers' write locks
+        await asyncio.to_thread(sentiment_cache.put_many, scored)
+        cached.update(scored)
 
-    # Analyze sentiment for all items
-    sentiment_results = analyze_sentiment_batch(texts)
+    return [cached[text] for text in texts]
 
-    # Apply sentiment analysis and weights to each item
-    for item, (label, p_positive, p_neutral, p_negative, score) in zip(items, sentiment_results):
-        # Set sentiment analysis results
-        item.label = label
-        item.prob_positive = p_positive
-        item.prob_neutral = p_neutral
-        item.prob_negative = p_negative
-        item.score = score
 
-        # Calculate individual weights
-        recency_w = calculate_recency_weight(item.published_at)
-        source_w = calculate_source_weight(item.source)
-        engagement_w = calculate_engagement_weight(item)
+async def analyze_batches_async(selections: Sequence[Tuple[NewsBatch, Positions]]) -> None:
+    """
+    Score and weigh items of several batches in one pass through the model.
+    
+    Every selected text is submitted together, so items of different
+    tickers share forward passes. Results are written into each batch's
+    columns.
+    
+    Args:
+        selections: (batch, positions) pairs; None positions select every item
+        
+    Raises:
+        InferenceQueueFullError: If the inference queue is at capacity
+    """
+    selections = [(batch, batch.positions(positions)) for batch, positions in selections]
+    texts = [text for batch, positions in selections for text in batch.model_inputs(positions)]
+    if not texts:
+        return
+
+    results = await score_texts_async(texts)
+    now = datetime.now(timezone.utc)
+    offset = 0
+    for batch, positions in selections:
+        batch.set_sentiment(positions, results[offset : offset + len(positions)])
+        apply_batch_weights(batch, positions, now)
+        offset += len(positions)
 
-        # Store individual weights
-        item.recency_w = recency_w
-        item.source_w = source_w
-        item.engage_w = engagement_w
 
-        # Calculate combined weight and weighted score
-        item.weight = combine_weights(recency_w, source_w, engagement_w)
-        item.weighted_score = (item.weight or 0.0) * (item.score or 0.0)
+async def analyze_batch_async(batch: NewsBatch, positions: Positions = None) -> NewsBatch:
+    """
+    Score and weigh items of a batch in place.
+    
+    Args:
+        batch: Collected news batch
+        positions: Items to analyze (defaults to all)
+        
+    Returns:
+        The same batch
+        
+    Raises:
+        InferenceQueueFullError: If the inference queue is at capacity
+    """
+    await analyze_batches_async([(batch, positions)])
+    return batch
+
+
+async def analyze_news_items_async(items: List[NewsItem]) -> List[NewsItem]:
+    """
+    Analyze news items through the shared micro-batcher without blocking the event loop.
+    
+    Args:
+        items: List of NewsItem objects to analyze
+        
+    Returns:
+        New NewsItem objects with sentiment analysis and weights applied
+        
+    Raises:
+        InferenceQueueFullError: If the inference queue is at capacity
+    """
+    if not items:
+        return []
 
-    return items
+    batch = await analyze_batch_async(NewsBatch.from_items(items))
+    return batch.to_items()
 
 
-# Backward compatibility alias
-analyze_items = analyze_news_items
\ No newline at end of file
+# Backward compatibility aliases
+analyze_items = analyze_news_items
+analyze_items_async = analyze_news_items_async
@@ -0,0 +1,90 @@
+"""
+Single-flight coalescing of concurrent identical async computations.
+"""
+from __future__ import annotations
+
+import asyncio
+from typing import Awaitable, Callable, Dict, Generic, Hashable, TypeVar
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+
+class SingleFlight(Generic[K, V]):
+    """
+    Share one in-flight computation between concurrent callers with the same key.
+
+    The first caller for a key (the leader) starts the computation as its own
+    task; later callers await that same task. Every caller awaits it through
+    asyncio.shield, so a caller that is cancelled (e.g. its client
+    disconnected) stops waiting without cancelling the work for the others.
+    """
+
+    def __init__(self):
+        self._calls: Dict[K, asyncio.Future] = {}
+        self.leaders = 0
+        self.coalesced = 0
+
+    def start(self, key: K, func: Callable[[], Awaitable[V]]) -> "asyncio.Future[V]":
+        """
+        Start func for key unless a call for key is already in flight.
+
+        Unlike run, this does not wait: the returned future is the one
+        func() produced if this caller leads, or the in-flight call's.
+
+        Args:
+            key: Identity of the computation
+            func: Zero-argument function producing a coroutine or future
+
+        Returns:
+            Future of the shared computation
+        """
+        call = self._calls.get(key)
+        if call is None:
+            call = asyncio.ensure_future(func())
+            self._calls[key] = call
+            call.add_done_callback(lambda done: self._finish(key, done))
+            self.leaders += 1
+        else:
+            self.coalesced += 1
+        return call
+
+    async def run(self, key: K, func: Callable[[], Awaitable[V]]) -> V:
+        """
+        Run func for key, or join the call already in flight for key.
+
+        Args:
+            key: Identity of the computation
+            func: Zero-argument coroutine function producing the result
+
+        Returns:
+            Result of the shared computation
+
+        Raises:
+            Exception: Whatever the shared computation raised
+        """
+        return await asyncio.shield(self.start(key, func))
+
+    def _finish(self, key: K, call: asyncio.Future) -> None:
+        """Forget a finished call and mark its exception as retrieved."""
+        if self._calls.get(key) is call:
+            del self._calls[key]
+        if not call.cancelled():
+            # Avoid "exception was never retrieved" when every caller went away
+            call.exception()
+
+    def get_stats(self) -> Dict[str, int]:
+        """
+        Get coalescing counters.
+
+        Returns:
+            Dictionary with leader, coalesced and in-flight counts
+        """
+        return {
+            "leaders": self.leaders,
+            "coalesced": self.coalesced,
+            "in_flight": len(self._calls),
+        }
+
+
+__all__ = ["SingleFlight"]
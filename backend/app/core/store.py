@@ -0,0 +1,339 @@
+"""
+Persistent on-disk stores for FinBERT results and analyzed news items.
+
+Backed by SQLite in WAL mode so several uvicorn worker processes can share
+one file: readers never block on writers, and concurrent writers wait on
+the busy timeout instead of failing.
+"""
+from __future__ import annotations
+
+import logging
+import os
+import sqlite3
+import threading
+import time
+from typing import Dict, Iterable, List, Optional
+
+from app.models import SeenItem, SentimentResult
+
+logger = logging.getLogger(__name__)
+
+# SQLite's default limit on host parameters per statement is 999
+_MAX_PARAMS = 500
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS sentiment_results (
+    key TEXT PRIMARY KEY,
+    model_id TEXT NOT NULL,
+    label TEXT NOT NULL,
+    p_pos REAL NOT NULL,
+    p_neu REAL NOT NULL,
+    p_neg REAL NOT NULL,
+    score REAL NOT NULL,
+    updated_at REAL NOT NULL
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS idx_sentiment_results_updated_at
+    ON sentiment_results (updated_at);
+"""
+
+_SEEN_ITEMS_SCHEMA = """
+CREATE TABLE IF NOT EXISTS seen_items (
+    ticker TEXT NOT NULL,
+    item_id TEXT NOT NULL,
+    model_id TEXT NOT NULL,
+    label TEXT NOT NULL,
+    p_pos REAL NOT NULL,
+    p_neu REAL NOT NULL,
+    p_neg REAL NOT NULL,
+    score REAL NOT NULL,
+    source_w REAL NOT NULL,
+    engage_w REAL NOT NULL,
+    rationale TEXT NOT NULL,
+    published_ts REAL NOT NULL,
+    PRIMARY KEY (ticker, item_id, model_id)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS idx_seen_items_published_ts
+    ON seen_items (published_ts);
+"""
+
+
+class _SqliteStore:
+    """Per-thread SQLite connections to one WAL-mode database file."""
+
+    SCHEMA = ""
+
+    def __init__(self, path: str, busy_timeout_ms: int = 5000):
+        """
+        Args:
+            path: SQLite database file path
+            busy_timeout_ms: How long a writer waits for a lock held by another process
+        """
+        self.path = path
+        self.busy_timeout_ms = busy_timeout_ms
+
+        self._local = threading.local()
+        self._connections: List[sqlite3.Connection] = []
+        self._init_lock = threading.Lock()
+        self._initialized = False
+
+    def _connect(self) -> sqlite3.Connection:
+        """Get this thread's connection, opening it and the schema on first use."""
+        conn: Optional[sqlite3.Connection] = getattr(self._local, "conn", None)
+        if conn is not None:
+            return conn
+
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        conn = sqlite3.connect(self.path, timeout=self.busy_timeout_ms / 1000.0, check_same_thread=False)
+        conn.execute(f"PRAGMA busy_timeout = {int(self.busy_timeout_ms)}")
+        conn.execute("PRAGMA journal_mode = WAL")
+        conn.execute("PRAGMA synchronous = NORMAL")
+        self._local.conn = conn
+
+        with self._init_lock:
+            self._connections.append(conn)
+            if not self._initialized:
+                with conn:
+                    conn.executescript(self.SCHEMA)
+                self._initialized = True
+
+        return conn
+
+    def close(self) -> None:
+        """Close all connections opened by this store."""
+        with self._init_lock:
+            for conn in self._connections:
+                conn.close()
+            self._connections.clear()
+        self._local = threading.local()
+
+
+class SqliteSentimentStore(_SqliteStore):
+    """Key-value store of sentiment results keyed by content hash and model revision."""
+
+    SCHEMA = _SCHEMA
+
+    def __init__(
+        self,
+        path: str,
+        model_id: str,
+        ttl_seconds: float,
+        compact_interval_seconds: float = 3600.0,
+        busy_timeout_ms: int = 5000,
+    ):
+        """
+        Args:
+            path: SQLite database file path
+            model_id: Model name and revision; rows of other revisions are ignored
+                and age out with the TTL
+            ttl_seconds: Age after which stored results are discarded
+            compact_interval_seconds: Minimum time between compaction passes
+            busy_timeout_ms: How long a writer waits for a lock held by another process
+        """
+        super().__init__(path, busy_timeout_ms)
+        self.model_id = model_id
+        self.ttl_seconds = ttl_seconds
+        self.compact_interval_seconds = compact_interval_seconds
+        self._last_compacted = 0.0
+
+    def get_many(self, keys: Iterable[str]) -> Dict[str, SentimentResult]:
+        """
+        Look up stored results for several keys.
+
+        Args:
+            keys: Content-hash cache keys
+
+        Returns:
+            Mapping of key to result for keys that are present and not expired
+        """
+        unique_keys = list(dict.fromkeys(keys))
+        if not unique_keys:
+            return {}
+
+        conn = self._connect()
+        cutoff = time.time() - self.ttl_seconds
+        found: Dict[str, SentimentResult] = {}
+
+        for i in range(0, len(unique_keys), _MAX_PARAMS):
+            chunk = unique_keys[i : i + _MAX_PARAMS]
+            placeholders = ",".join("?" * len(chunk))
+            rows = conn.execute(
+                "SELECT key, label, p_pos, p_neu, p_neg, score FROM sentiment_results "
+                f"WHERE key IN ({placeholders}) AND model_id = ? AND updated_at >= ?",
+                (*chunk, self.model_id, cutoff),
+            ).fetchall()
+            for key, label, p_pos, p_neu, p_neg, score in rows:
+                found[key] = (label, p_pos, p_neu, p_neg, score)
+
+        return found
+
+    def put_many(self, results: Dict[str, SentimentResult]) -> None:
+        """
+        Store results for several keys, replacing existing rows.
+
+        Args:
+            results: Mapping of content-hash key to result
+        """
+        if not results:
+            return
+
+        conn = self._connect()
+        now = time.time()
+        rows = [
+            (key, self.model_id, label, p_pos, p_neu, p_neg, score, now)
+            for key, (label, p_pos, p_neu, p_neg, score) in results.items()
+        ]
+        with conn:
+            conn.executemany(
+                "INSERT OR REPLACE INTO sentiment_results "
+                "(key, model_id, label, p_pos, p_neu, p_neg, score, updated_at) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                rows,
+            )
+
+        if now - self._last_compacted >= self.compact_interval_seconds:
+            self.compact()
+
+    def compact(self) -> int:
+        """
+        Delete expired rows.
+
+        Rows are removed by age only: during a rolling deploy, workers on
+        different model revisions share the file and must not delete each
+        other's results.
+
+        Returns:
+            Number of rows removed
+        """
+        conn = self._connect()
+        self._last_compacted = time.time()
+        cutoff = self._last_compacted - self.ttl_seconds
+        with conn:
+            cursor = conn.execute(
+                "DELETE FROM sentiment_results WHERE updated_at < ?",
+                (cutoff,),
+            )
+        if cursor.rowcount:
+            logger.info("Compacted %d rows from sentiment store %s", cursor.rowcount, self.path)
+        return cursor.rowcount
+
+
+class SqliteSeenItemStore(_SqliteStore):
+    """Analyzed news items keyed by ticker, item id and model revision."""
+
+    SCHEMA = _SEEN_ITEMS_SCHEMA
+
+    def __init__(
+        self,
+        path: str,
+        model_id: str,
+        retention_seconds: float,
+        compact_interval_seconds: float = 3600.0,
+        busy_timeout_ms: int = 5000,
+    ):
+        """
+        Args:
+            path: SQLite database file path
+            model_id: Model name and revision; rows of other revisions are kept
+                side by side and never read or compacted by this store
+            retention_seconds: Publication age after which items are discarded
+            compact_interval_seconds: Minimum time between compaction passes
+            busy_timeout_ms: How long a writer waits for a lock held by another process
+        """
+        super().__init__(path, busy_timeout_ms)
+        self.model_id = model_id
+        self.retention_seconds = retention_seconds
+        self.compact_interval_seconds = compact_interval_seconds
+        self._last_compacted = 0.0
+
+    def get_many(self, ticker: str, item_ids: Iterable[str]) -> Dict[str, SeenItem]:
+        """
+        Look up stored items of one ticker.
+
+        Args:
+            ticker: Stock ticker symbol
+            item_ids: News item ids
+
+        Returns:
+            Mapping of item id to stored item for ids scored by the current model
+        """
+        unique_ids = list(dict.fromkeys(item_ids))
+        if not unique_ids:
+            return {}
+
+        conn = self._connect()
+        found: Dict[str, SeenItem] = {}
+
+        for i in range(0, len(unique_ids), _MAX_PARAMS):
+            chunk = unique_ids[i : i + _MAX_PARAMS]
+            placeholders = ",".join("?" * len(chunk))
+            rows = conn.execute(
+                "SELECT item_id, label, p_pos, p_neu, p_neg, score, source_w, engage_w, rationale, published_ts "
+                f"FROM seen_items WHERE ticker = ? AND item_id IN ({placeholders}) AND model_id = ?",
+                (ticker, *chunk, self.model_id),
+            ).fetchall()
+            for item_id, label, p_pos, p_neu, p_neg, score, source_w, engage_w, rationale, published_ts in rows:
+                found[item_id] = SeenItem(
+                    sentiment=(label, p_pos, p_neu, p_neg, score),
+                    source_w=source_w,
+                    engage_w=engage_w,
+                    rationale=rationale,
+                    published_ts=published_ts,
+                )
+
+        return found
+
+    def put_many(self, ticker: str, items: Dict[str, SeenItem]) -> None:
+        """
+        Store items of one ticker, replacing this revision's existing rows.
+
+        Args:
+            ticker: Stock ticker symbol
+            items: Mapping of item id to analyzed item
+        """
+        if not items:
+            return
+
+        conn = self._connect()
+        rows = [
+            (ticker, item_id, self.model_id, *seen.sentiment, seen.source_w, seen.engage_w, seen.rationale, seen.published_ts)
+            for item_id, seen in items.items()
+        ]
+        with conn:
+            conn.executemany(
+                "INSERT OR REPLACE INTO seen_items "
+                "(ticker, item_id, model_id, label, p_pos, p_neu, p_neg, score, source_w, engage_w, rationale, published_ts) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                rows,
+            )
+
+        if time.time() - self._last_compacted >= self.compact_interval_seconds:
+            self.compact()
+
+    def compact(self) -> int:
+        """
+        Delete this revision's items published before the retention window.
+
+        Rows of other model revisions are left alone, so workers on different
+        revisions sharing the file during a rolling deploy keep each other's
+        items.
+
+        Returns:
+            Number of rows removed
+        """
+        conn = self._connect()
+        self._last_compacted = time.time()
+        cutoff = self._last_compacted - self.retention_seconds
+        with conn:
+            cursor = conn.execute(
+                "DELETE FROM seen_items WHERE model_id = ? AND published_ts < ?",
+                (self.model_id, cutoff),
+            )
+        if cursor.rowcount:
+            logger.info("Compacted %d rows from seen-item store %s", cursor.rowcount, self.path)
+        return cursor.rowcount
+
+
+__all__ = ["SqliteSeenItemStore", "SqliteSentimentStore"]
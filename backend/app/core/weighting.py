@@ -0,0 +1,196 @@
+"""
+Columnar weighting engine for analyzed news items.
+
+Computes the same recency, source and engagement weights as the per-item
+functions in app.core.sentiment, but over NumPy arrays: publication epochs,
+interned source ids and engagement counts are gathered once, every weight
+is a handful of array operations against one shared `now`, and the results
+are written straight into a NewsBatch's columns.
+"""
+from __future__ import annotations
+
+from datetime import datetime, timezone
+from typing import NamedTuple, Optional, Sequence, Tuple
+
+import numpy as np
+
+from app.config import DEFAULT_SOURCE_WEIGHT, HALF_LIFE_HOURS, SOURCE_BASE_WEIGHTS
+from app.core.batch import NewsBatch, Positions
+from app.models import JsonDict
+
+# Shares of each weighting component in the combined item weight
+RECENCY_SHARE = 0.5
+SOURCE_SHARE = 0.3
+ENGAGEMENT_SHARE = 0.2
+
+# Engagement of sources without interaction counts
+DEFAULT_ENGAGEMENT_WEIGHT = 0.5
+
+
+class WeightColumns(NamedTuple):
+    """Per-item weight arrays, aligned with the input items."""
+
+    recency: np.ndarray
+    source: np.ndarray
+    engagement: np.ndarray
+    weight: np.ndarray
+    weighted_score: np.ndarray
+
+
+def recency_weights(published_ts: np.ndarray, now_ts: float, half_life_hours: float = HALF_LIFE_HOURS) -> np.ndarray:
+    """
+    Exponential-decay recency weights for publication epochs.
+
+    Args:
+        published_ts: Publication times in epoch seconds
+        now_ts: Current time in epoch seconds
+        half_life_hours: Age at which the weight halves
+
+    Returns:
+        Weights between 0.0 and 1.0
+    """
+    age_hours = np.maximum(0.0, now_ts - published_ts) / 3600.0
+    return np.clip(np.exp2(-age_hours / max(1e-6, half_life_hours)), 0.0, 1.0)
+
+
+def source_weights(source_ids: np.ndarray, sources: Sequence[str]) -> np.ndarray:
+    """
+    Credibility weights for interned source ids.
+
+    Args:
+        source_ids: Index into `sources` per item
+        sources: Distinct source domains
+
+    Returns:
+        Weights between 0.0 and 1.0
+    """
+    table = np.array(
+        [SOURCE_BASE_WEIGHTS.get(domain, DEFAULT_SOURCE_WEIGHT) for domain in sources], dtype=np.float64
+    )
+    return np.clip(table, 0.0, 1.0)[source_ids]
+
+
+def engagement_weights(is_reddit: np.ndarray, upvotes: np.ndarray, comments: np.ndarray) -> np.ndarray:
+    """
+    Engagement weights from interaction counts.
+
+    Args:
+        is_reddit: Whether each item is a Reddit post
+        upvotes: Upvote counts (ignored for other sources)
+        comments: Comment counts (ignored for other sources)
+
+    Returns:
+        Weights between 0.0 and 1.0
+    """
+    raw_score = np.log1p(np.maximum(upvotes, 0)) + 0.5 * np.log1p(np.maximum(comments, 0))
+    return np.where(is_reddit, np.clip(raw_score / 10.0, 0.0, 1.0), DEFAULT_ENGAGEMENT_WEIGHT)
+
+
+def combine_weight_arrays(recency, source, engagement):
+    """
+    Combine recency, source and engagement weights into item weights.
+
+    Works on arrays and on plain floats alike.
+
+    Args:
+        recency: Recency weights
+        source: Source credibility weights
+        engagement: Engagement weights
+
+    Returns:
+        Combined weights between 0.0 and 1.0
+    """
+    return np.clip(RECENCY_SHARE * recency + SOURCE_SHARE * source + ENGAGEMENT_SHARE * engagement, 0.0, 1.0)
+
+
+def _count(value) -> int:
+    """Interaction count from raw metadata, 0 if missing."""
+    return int(value or 0)
+
+
+def _engagement_counts(raws: Sequence[JsonDict], is_reddit: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """Upvote and comment counts, read from the raw metadata of Reddit posts only."""
+    upvotes = np.zeros(len(is_reddit), dtype=np.float64)
+    comments = np.zeros(len(is_reddit), dtype=np.float64)
+    for position in np.flatnonzero(is_reddit).tolist():
+        raw = raws[position]
+        upvotes[position] = _count(raw.get("ups", 0))
+        comments[position] = _count(raw.get("num_comments", 0))
+    return upvotes, comments
+
+
+def weigh_columns(
+    published_ts: np.ndarray,
+    scores: np.ndarray,
+    source_ids: np.ndarray,
+    sources: Sequence[str],
+    raws: Sequence[JsonDict],
+    now_ts: float,
+) -> WeightColumns:
+    """
+    Compute weights from item columns.
+
+    Args:
+        published_ts: Publication times in epoch seconds
+        scores: Sentiment scores
+        source_ids: Index into `sources` per item
+        sources: Distinct source domains
+        raws: Raw metadata per item, for engagement counts
+        now_ts: Time at which recency is evaluated, in epoch seconds
+
+    Returns:
+        Weight arrays aligned with the columns
+    """
+    # Only Reddit posts carry interaction counts
+    is_reddit = np.array([domain == "reddit.com" for domain in sources], dtype=bool)[source_ids]
+    upvotes, comments = _engagement_counts(raws, is_reddit)
+
+    recency = recency_weights(np.asarray(published_ts, dtype=np.float64), now_ts)
+    source = source_weights(source_ids, sources)
+    engagement = engagement_weights(is_reddit, upvotes, comments)
+    weight = combine_weight_arrays(recency, source, engagement)
+    return WeightColumns(recency, source, engagement, weight, weight * scores)
+
+
+def apply_batch_weights(batch: NewsBatch, positions: Positions = None, now: Optional[datetime] = None) -> None:
+    """
+    Compute weights for items of a batch and store them in its columns.
+
+    Args:
+        batch: Batch with sentiment scores set for the selected items
+        positions: Items to weigh (defaults to all)
+        now: Time at which recency is evaluated (defaults to the current time)
+    """
+    positions = batch.positions(positions)
+    if not len(positions):
+        return
+
+    now_ts = (now or datetime.now(timezone.utc)).timestamp()
+    columns = weigh_columns(
+        batch.published_ts[positions],
+        batch.scores[positions],
+        batch.source_ids[positions],
+        batch.sources,
+        [batch.raws[i] for i in positions.tolist()],
+        now_ts,
+    )
+    batch.recency_w[positions] = columns.recency
+    batch.source_w[positions] = columns.source
+    batch.engage_w[positions] = columns.engagement
+    batch.weight[positions] = columns.weight
+    batch.weighted_score[positions] = columns.weighted_score
+
+
+__all__ = [
+    "DEFAULT_ENGAGEMENT_WEIGHT",
+    "ENGAGEMENT_SHARE",
+    "RECENCY_SHARE",
+    "SOURCE_SHARE",
+    "WeightColumns",
+    "apply_batch_weights",
+    "combine_weight_arrays",
+    "engagement_weights",
+    "recency_weights",
+    "source_weights",
+    "weigh_columns",
+]
@@ -5,94 +5,143 @@ from __future__ import annotations
 
 import asyncio
 import logging
-import time
-from typing import List
+import re
+from datetime import datetime
+from typing import Dict, Set, Tuple
 
-from fastapi import FastAPI, HTTPException, Query
+import numpy as np
+from fastapi import FastAPI, HTTPException, Query, Response
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import JSONResponse
 
-from app.config import DEFAULT_LOOKBACK_DAYS
-from app.core.sentiment import analyze_items
-from app.schemas import NewsItem, SentimentResponse
-from app.sources.collector import collect_news
-from app.services.rationales import chatgpt_rationales
+from app.config import (
+    BATCH_FETCH_CONCURRENCY,
+    DEFAULT_LOOKBACK_DAYS,
+    MAX_LOOKBACK_DAYS,
+    PREFETCH_BOOST_MINUTES,
+    PREFETCH_ENABLED,
+    RESPONSE_CACHE_SIZE,
+    RESPONSE_CACHE_STALE_SECONDS,
+    RESPONSE_CACHE_TTL_SECONDS,
+)
+from app.core.aggregate import AggregateKey, SentimentAggregates
+from app.core.batch import NewsBatch
+from app.core.cache import CachedResponse, ResponseCache
+from app.core.seen_items import seen_items
+from app.core.singleflight import SingleFlight
+from app.core.inference import (
+    InferenceQueueFullError,
+    configure_torch_threads,
+    get_inference_executor,
+    get_inference_stats,
+    shutdown_inference_executor,
+)
+from app.core.sentiment import (
+    analyze_batch_async,
+    analyze_batches_async,
+    get_micro_batcher,
+    get_model_status,
+    is_model_ready,
+    padding_stats,
+    sentiment_cache,
+    stop_micro_batcher,
+    warm_up_model,
+)
+from app.schemas import (
+    BatchSentimentRequest,
+    BatchSentimentResponse,
+    SentimentResponse,
+    TickerSentimentResult,
+)
+from app.sources.collector import CollectedNews, collect_news_with_age, get_dedup_stats, get_feed_cache_stats
+from app.sources.canonical import get_canonical_url_stats
+from app.sources.common import get_feed_entry_stats
+from app.sources.http_client import close_http_client, get_conditional_stats
+from app.services.prefetch import prefetcher
+from app.services.rationales import generate_rationales
 from app.utils import now_utc
 
 # Configure logging
 logger = logging.getLogger("uvicorn")
 
+_TICKER_PATTERN = re.compile(r"^[A-Z0-9.\-^=]{1,10}$")
+
+# Item limit of a /sentiment request that does not set one
+DEFAULT_RESPONSE_LIMIT = 10
 
-def calculate_overall_sentiment(items: List[NewsItem]) -> float:
+
+def calculate_overall_sentiment(batch: NewsBatch) -> float:
     """
     Calculate weighted average sentiment score across all news items.
     
+    Responses get their score from sentiment_aggregates, which maintains it
+    incrementally; this exact recomputation is kept as the reference for
+    checking those aggregates (test and benchmark use only).
+    
     Args:
-        items: List of NewsItem objects with sentiment analysis
+        batch: News batch with sentiment analysis
         
     Returns:
         Overall sentiment score between -1.0 and 1.0
     """
-    if not items:
+    if not len(batch):
         return 0.0
     
-    numerator = sum(getattr(item, "weighted_score", 0.0) for item in items)
-    denominator = sum(getattr(item, "weight", 1.0) for item in items)
+    numerator = float(batch.weighted_score.sum(dtype=np.float64))
+    denominator = float(batch.weight.sum(dtype=np.float64))
     
     return round(numerator / denominator, 4) if denominator else 0.0
 
 
-def attach_rationales_to_items(items: List[NewsItem], rationales: List[str] | None) -> None:
-    """
-    Attach AI-generated rationales to news items.
-    
-    Args:
-        items: List of NewsItem objects
-        rationales: List of rationale strings (can be None)
-    """
-    if not items:
-        return
-    
-    rationale_list = rationales or []
-    
-    for i, item in enumerate(items):
-        if i < len(rationale_list) and isinstance(rationale_list[i], str):
-            item.rationale = rationale_list[i].strip()
-        else:
-            item.rationale = getattr(item, "rationale", "").strip()
-        
-        # Ensure rationale is always a string
-        if not item.rationale:
-            item.rationale = ""
+# Running overall-score aggregates, one per response cache key shape
+sentiment_aggregates = SentimentAggregates(RESPONSE_CACHE_SIZE)
 
 
 def build_sentiment_response(
     ticker: str,
-    items: List[NewsItem],
-    rationales: List[str] | None,
+    batch: NewsBatch,
+    include_rationales: bool,
     lookback_days: int,
+    limit: int,
+    news_fetched_at: datetime | None = None,
 ) -> SentimentResponse:
     """
     Build the final API response with sentiment analysis results.
     
+    This is where per-item objects are materialized from the batch.
+    
     Args:
         ticker: Stock ticker symbol
-        items: List of analyzed NewsItem objects
-        rationales: List of rationale strings
+        batch: Analyzed news batch
+        include_rationales: Whether to show item rationales
         lookback_days: Number of days looked back
+        limit: Item limit of the request; the overall score is maintained
+            incrementally across responses for the same window
+        news_fetched_at: When the oldest feed behind the items was downloaded
         
     Returns:
         SentimentResponse object
     """
-    # Attach rationales before building response
-    attach_rationales_to_items(items, rationales)
+    items = batch.to_items()
+    if not include_rationales:
+        # Rationales stored in the seen-item index are only shown on request
+        for item in items:
+            item.rationale = ""
     
+    as_of = now_utc()
+    key: AggregateKey = (ticker, lookback_days, limit)
+    overall_score = sentiment_aggregates.overall_score(key, batch, as_of)
     return SentimentResponse(
         ticker=ticker,
-        as_of=now_utc().isoformat(),
+        as_of=as_of.isoformat(),
         lookback_days=lookback_days,
-        overall_score=calculate_overall_sentiment(items),
+        overall_score=overall_score,
         n_items=len(items),
         items=items,
+        news_fetched_at=news_fetched_at.isoformat() if news_fetched_at else None,
+        news_age_seconds=(
+            round(max(0.0, (as_of - news_fetched_at).total_seconds()), 1) if news_fetched_at else None
+        ),
     )
 
 
@@ -106,20 +155,42 @@ app = FastAPI(
 
 @app.on_event("startup")
 async def warm_startup():
-    """Warm up the sentiment model on startup."""
+    """Load and warm up the sentiment model in the background on startup."""
     async def load_model():
-        start_time = time.perf_counter()
         try:
-            from app.core.sentiment import _load_model
             loop = asyncio.get_running_loop()
-            # Load model in thread to avoid blocking startup
-            await loop.run_in_executor(None, _load_model)
-            logger.info("FinBERT model loaded in %.1fs", time.perf_counter() - start_time)
+            # Load on an inference worker so startup is not blocked
+            status = await loop.run_in_executor(get_inference_executor(), warm_up_model)
+            logger.info(
+                "Sentiment model ready: loaded in %.1fs, warmed up in %.1fs",
+                status["load_seconds"],
+                status["warmup_seconds"],
+            )
         except Exception as e:
-            logger.warning("Model warm-up skipped: %s", e)
+            logger.warning("Model warm-up failed: %s", e)
     
-    # Start model loading in background
-    asyncio.create_task(load_model())
+    # Process-wide torch setting, applied before any inference runs
+    configure_torch_threads()
+    
+    # Keep a reference so the task is not garbage collected
+    app.state.model_warmup = asyncio.create_task(load_model())
+    
+    if PREFETCH_ENABLED:
+        prefetcher.start()
+
+
+@app.on_event("shutdown")
+async def close_shared_clients():
+    """Stop prefetching and release pooled connections, inference workers and cache files."""
+    await prefetcher.stop()
+    await close_http_client()
+    await stop_micro_batcher()
+    # Waits for running forward passes; keep the event loop free meanwhile
+    await asyncio.to_thread(shutdown_inference_executor)
+    if sentiment_cache.store is not None:
+        sentiment_cache.store.close()
+    if seen_items.store is not None:
+        seen_items.store.close()
 
 
 # Configure CORS
@@ -142,17 +213,244 @@ async def health_check():
     }
 
 
+@app.get("/ready")
+async def readiness_check():
+    """Readiness check: 503 until the sentiment model is loaded and warm."""
+    status = get_model_status()
+    if not is_model_ready():
+        return JSONResponse(status_code=503, content={"status": "not_ready", "model": status})
+    return {"status": "ready", "model": status}
+
+
+@app.get("/metrics")
+async def get_metrics():
+    """Model, inference, batching and cache statistics for tuning."""
+    return {
+        "as_of": now_utc().isoformat(),
+        "model": get_model_status(),
+        "inference": get_inference_stats(),
+        "microbatch": get_micro_batcher().get_stats(),
+        "sentiment_cache": sentiment_cache.get_stats(),
+        "seen_items": seen_items.get_stats(),
+        "padding": padding_stats.snapshot(),
+        "response_cache": response_cache.get_stats(),
+        "aggregates": sentiment_aggregates.get_stats(),
+        "singleflight": sentiment_flights.get_stats(),
+        "feeds": get_conditional_stats(),
+        "feed_cache": get_feed_cache_stats(),
+        "feed_entries": get_feed_entry_stats(),
+        "dedup": get_dedup_stats(),
+        "canonical_urls": get_canonical_url_stats(),
+        "prefetch": prefetcher.get_stats(),
+    }
+
+
+def _normalize_prefetch_ticker(ticker: str) -> str:
+    """Normalize a ticker path parameter, rejecting malformed symbols."""
+    ticker = ticker.upper().strip()
+    if not _TICKER_PATTERN.match(ticker):
+        raise HTTPException(status_code=422, detail="Invalid ticker symbol")
+    return ticker
+
+
+@app.get("/prefetch/{ticker}")
+async def get_prefetch_state(ticker: str):
+    """Learned poll interval, feed change rates and boost state for a ticker."""
+    ticker = _normalize_prefetch_ticker(ticker)
+    return {"ticker": ticker, **prefetcher.get_ticker_stats(ticker)}
+
+
+@app.post("/prefetch/{ticker}/boost")
+async def boost_prefetch(
+    ticker: str,
+    minutes: float = Query(PREFETCH_BOOST_MINUTES, gt=0, le=7 * 24 * 60, description="Boost duration in minutes"),
+):
+    """Poll a ticker's feeds at the fastest interval for a while (e.g. on earnings day)."""
+    ticker = _normalize_prefetch_ticker(ticker)
+    prefetcher.boost(ticker, minutes)
+    return {"ticker": ticker, **prefetcher.get_ticker_stats(ticker)}
+
+
+async def fill_missing_rationales(batch: NewsBatch, ticker: str) -> None:
+    """
+    Generate rationales for the items that have none yet.
+    
+    Items hydrated from the seen-item index keep their stored rationale, so
+    only new items are materialized and sent to the rationale model.
+    Rule-based fallbacks are flagged so the seen-item index does not keep
+    them and a later poll asks the model again.
+    
+    Args:
+        batch: Analyzed news batch
+        ticker: Stock ticker symbol
+    """
+    missing = [position for position, rationale in enumerate(batch.rationales) if not rationale]
+    if not missing:
+        return
+    items = batch.to_items(np.asarray(missing, dtype=np.intp))
+    rationales, fallbacks = await generate_rationales(items, ticker)
+    for position, rationale, fallback in zip(missing, rationales, fallbacks):
+        batch.rationales[position] = rationale.strip()
+        batch.fallback_rationales[position] = fallback
+
+
+async def run_sentiment_pipeline(
+    ticker: str,
+    lookback_days: int,
+    limit: int,
+    include_rationales: bool,
+) -> Tuple[SentimentResponse, bool]:
+    """
+    Collect, analyze and explain news for a ticker.
+    
+    Args:
+        ticker: Normalized stock ticker symbol
+        lookback_days: Number of days to look back for news
+        limit: Maximum number of news items to analyze
+        include_rationales: Whether to include AI explanations
+        
+    Returns:
+        SentimentResponse with analysis results, and whether news collection
+        completed (responses built from failed collection must not be cached)
+    """
+    # Collect news articles
+    logger.info(f"Collecting news for {ticker}")
+    collected = await collect_news_with_age(ticker, limit=limit, lookback_days=lookback_days)
+    batch = collected.batch
+    
+    if not len(batch):
+        logger.warning(f"No news items found for {ticker}")
+        response = build_sentiment_response(ticker, batch, include_rationales, lookback_days, limit, collected.fetched_at)
+        return response, collected.complete
+    
+    # Analyze sentiment for items not seen on an earlier poll
+    new_positions = await seen_items.hydrate(ticker, batch)
+    logger.info(f"Analyzing sentiment for {len(new_positions)} new of {len(batch)} items")
+    await analyze_batch_async(batch, new_positions)
+    
+    # Generate rationales if requested
+    if include_rationales:
+        logger.info("Generating rationales")
+        await fill_missing_rationales(batch, ticker)
+    await asyncio.to_thread(seen_items.record, ticker, batch)
+    
+    # Build and return response
+    response = build_sentiment_response(ticker, batch, include_rationales, lookback_days, limit, collected.fetched_at)
+    return response, collected.complete
+
+
+# Cached /sentiment responses keyed by (ticker, lookback_days, limit, include_rationales)
+SentimentCacheKey = Tuple[str, int, int, bool]
+response_cache: ResponseCache[SentimentCacheKey, SentimentResponse] = ResponseCache(
+    RESPONSE_CACHE_SIZE, RESPONSE_CACHE_TTL_SECONDS, RESPONSE_CACHE_STALE_SECONDS
+)
+_background_tasks: Set[asyncio.Task] = set()
+
+# Concurrent requests for the same key share one pipeline run
+sentiment_flights: SingleFlight[SentimentCacheKey, CachedResponse] = SingleFlight()
+
+
+def _cache_response(key: SentimentCacheKey, response: SentimentResponse, complete: bool) -> CachedResponse:
+    """
+    Store a built response, unless news collection failed.
+    
+    A response from failed collection is returned in an uncached entry with
+    no TTL, so it is served once and the next request retries collection.
+    """
+    if not complete:
+        return CachedResponse(response, 0.0, 0.0)
+    return response_cache.put(key, response)
+
+
+async def _build_and_cache(key: SentimentCacheKey) -> CachedResponse:
+    """Run the pipeline for a key and store the result in the response cache."""
+    return _cache_response(key, *await run_sentiment_pipeline(*key))
+
+
+async def compute_cached_response(key: SentimentCacheKey) -> CachedResponse:
+    """
+    Build the response for a key, joining any identical build already in flight.
+    
+    The build keeps running if the requesting client disconnects, so other
+    waiters and the response cache still get its result.
+    
+    Args:
+        key: (ticker, lookback_days, limit, include_rationales)
+        
+    Returns:
+        Freshly cached response entry
+    """
+    return await sentiment_flights.run(key, lambda: _build_and_cache(key))
+
+
+async def warm_default_response(ticker: str) -> None:
+    """
+    Rebuild and cache a ticker's response for the default /sentiment options.
+    
+    Used by the prefetcher, so the request users make most often is served
+    from the response cache.
+    
+    Args:
+        ticker: Normalized stock ticker symbol
+    """
+    await compute_cached_response((ticker, DEFAULT_LOOKBACK_DAYS, DEFAULT_RESPONSE_LIMIT, True))
+
+
+prefetcher.warm_response = warm_default_response
+
+
+async def _refresh_cached_response(key: SentimentCacheKey) -> None:
+    """Rebuild a stale cached response in the background."""
+    try:
+        await compute_cached_response(key)
+    except Exception as e:
+        logger.warning(f"Background refresh failed for {key[0]}: {e}")
+    finally:
+        response_cache.end_refresh(key)
+
+
+def _run_in_background(coro) -> asyncio.Task:
+    """Run a coroutine as a task, keeping a reference so it is not garbage collected."""
+    task = asyncio.create_task(coro)
+    _background_tasks.add(task)
+    task.add_done_callback(_background_tasks.discard)
+    return task
+
+
+def _schedule_refresh(key: SentimentCacheKey) -> None:
+    """Start a background refresh for a key unless one is already running."""
+    if response_cache.try_begin_refresh(key):
+        _run_in_background(_refresh_cached_response(key))
+
+
+def _set_cache_headers(response: Response, entry: CachedResponse) -> None:
+    """Set Cache-Control and Age headers describing a cached entry's freshness."""
+    max_age = max(0, int(entry.ttl_seconds - entry.age))
+    cache_control = f"public, max-age={max_age}"
+    # Uncached responses (TTL 0) are never revalidated in the background
+    if entry.ttl_seconds > 0 and entry.stale_seconds > 0:
+        cache_control += f", stale-while-revalidate={int(entry.stale_seconds)}"
+    response.headers["Cache-Control"] = cache_control
+    response.headers["Age"] = str(int(entry.age))
+
+
 @app.get("/sentiment", response_model=SentimentResponse)
 async def get_sentiment_analysis(
+    response: Response,
     ticker: str = Query(..., min_length=1, max_length=10, description="Stock ticker symbol (e.g., TSLA)"),
-    lookback_days: int = Query(DEFAULT_LOOKBACK_DAYS, ge=1, le=14, description="Days to look back for news"),
+    lookback_days: int = Query(DEFAULT_LOOKBACK_DAYS, ge=1, le=MAX_LOOKBACK_DAYS, description="Days to look back for news"),
     include_rationales: bool = Query(True, description="Include AI-generated explanations"),
-    limit: int = Query(10, ge=1, le=50, description="Maximum number of news items to analyze"),
+    limit: int = Query(DEFAULT_RESPONSE_LIMIT, ge=1, le=50, description="Maximum number of news items to analyze"),
 ):
     """
     Analyze sentiment for a stock ticker based on recent news.
     
+    Responses are cached for RESPONSE_CACHE_TTL_SECONDS. Stale responses are
+    served for up to RESPONSE_CACHE_STALE_SECONDS more while a background
+    refresh rebuilds them.
+    
     Args:
+        response: Outgoing response, used to set cache headers
         ticker: Stock ticker symbol to analyze
         lookback_days: Number of days to look back for news
         include_rationales: Whether to include AI explanations
@@ -163,34 +461,210 @@ async def get_sentiment_analysis(
     """
     # Normalize ticker
     ticker = ticker.upper().strip()
+    # Malformed symbols must not become prefetch candidates
+    if _TICKER_PATTERN.match(ticker):
+        prefetcher.record_request(ticker)
+    key: SentimentCacheKey = (ticker, lookback_days, limit, include_rationales)
+    
+    cached = response_cache.get(key)
+    if cached is not None:
+        if not cached.is_fresh:
+            _schedule_refresh(key)
+        _set_cache_headers(response, cached)
+        return cached.value
     
     try:
-        # Collect news articles
-        logger.info(f"Collecting news for {ticker}")
-        items = await collect_news(ticker, limit=limit, lookback_days=lookback_days)
-        
-        if not items:
-            logger.warning(f"No news items found for {ticker}")
-            return build_sentiment_response(ticker, [], None, lookback_days)
-        
-        # Analyze sentiment
-        logger.info(f"Analyzing sentiment for {len(items)} items")
-        analyzed_items = analyze_items(items)
-        
-        # Generate rationales if requested
-        rationales: List[str] | None = None
-        if include_rationales and analyzed_items:
-            logger.info("Generating rationales")
-            rationales = await chatgpt_rationales(analyzed_items, ticker)
-        
-        # Build and return response
-        return build_sentiment_response(ticker, analyzed_items, rationales, lookback_days)
+        entry = await compute_cached_response(key)
         
     except HTTPException:
         raise
+    except InferenceQueueFullError as e:
+        logger.warning(f"Rejecting sentiment request for {ticker}: {e}")
+        raise HTTPException(
+            status_code=503,
+            detail="Sentiment model is busy, please retry shortly",
+            headers={"Retry-After": "1"},
+        )
     except Exception as e:
         logger.error(f"Error processing sentiment for {ticker}: {e}")
         raise HTTPException(status_code=500, detail=f"Internal server error: {str(e)}")
+    
+    _set_cache_headers(response, entry)
+    return entry.value
+
+
+async def _collect_with_limit(
+    semaphore: asyncio.Semaphore,
+    ticker: str,
+    lookback_days: int,
+    limit: int,
+) -> CollectedNews:
+    """Collect news for one ticker while holding a global fetch slot."""
+    async with semaphore:
+        return await collect_news_with_age(ticker, limit=limit, lookback_days=lookback_days)
+
+
+async def _build_batch_entries(
+    flights: Dict[str, asyncio.Future],
+    lookback_days: int,
+    limit: int,
+    include_rationales: bool,
+) -> None:
+    """
+    Build and cache several tickers' responses together, resolving each ticker's flight.
+    
+    Feeds for all tickers are fetched concurrently under a global cap, and
+    every ticker's unseen items go through one shared analysis call so the
+    model runs full batches. If that call fails, tickers are analyzed
+    separately so only the affected ones fail.
+    
+    Args:
+        flights: Unresolved sentiment_flights futures led by a batch request, by ticker
+        lookback_days: Number of days to look back for news
+        limit: Maximum number of news items per ticker
+        include_rationales: Whether to include AI explanations
+    """
+    def resolve(ticker: str, outcome: CachedResponse | Exception) -> None:
+        future = flights[ticker]
+        if future.done():
+            return
+        if isinstance(outcome, Exception):
+            future.set_exception(outcome)
+        else:
+            future.set_result(outcome)
+    
+    try:
+        tickers = list(flights)
+        
+        # Fetch all feeds concurrently under the global cap
+        semaphore = asyncio.Semaphore(BATCH_FETCH_CONCURRENCY)
+        fetched = await asyncio.gather(
+            *(_collect_with_limit(semaphore, ticker, lookback_days, limit) for ticker in tickers),
+            return_exceptions=True,
+        )
+        collections: Dict[str, CollectedNews] = {}
+        for ticker, outcome in zip(tickers, fetched):
+            if isinstance(outcome, Exception):
+                logger.error(f"Error collecting news for {ticker}: {outcome}")
+                resolve(ticker, RuntimeError(f"News collection failed: {outcome}"))
+            else:
+                collections[ticker] = outcome
+        
+        # One analysis call across every ticker's unseen items so model batches are full
+        new_positions = await asyncio.gather(
+            *(seen_items.hydrate(ticker, collected.batch) for ticker, collected in collections.items())
+        )
+        selections = {
+            ticker: (collected.batch, positions)
+            for (ticker, collected), positions in zip(collections.items(), new_positions)
+        }
+        try:
+            await analyze_batches_async(list(selections.values()))
+        except Exception as e:
+            logger.warning(f"Shared batch analysis failed, analyzing tickers separately: {e}")
+            outcomes = await asyncio.gather(
+                *(analyze_batch_async(batch, positions) for batch, positions in selections.values()),
+                return_exceptions=True,
+            )
+            for ticker, outcome in zip(list(selections), outcomes):
+                if isinstance(outcome, Exception):
+                    logger.error(f"Error analyzing sentiment for {ticker}: {outcome}")
+                    resolve(ticker, outcome)
+                    del collections[ticker]
+        
+        # Rationales for new items per ticker, concurrently
+        if include_rationales:
+            rationale_outcomes = await asyncio.gather(
+                *(fill_missing_rationales(collected.batch, ticker) for ticker, collected in collections.items()),
+                return_exceptions=True,
+            )
+            for ticker, outcome in zip(collections, rationale_outcomes):
+                if isinstance(outcome, Exception):
+                    logger.warning(f"Rationales failed for {ticker}: {outcome}")
+        
+        for ticker, collected in collections.items():
+            await asyncio.to_thread(seen_items.record, ticker, collected.batch)
+            response = build_sentiment_response(
+                ticker, collected.batch, include_rationales, lookback_days, limit, collected.fetched_at
+            )
+            key: SentimentCacheKey = (ticker, lookback_days, limit, include_rationales)
+            resolve(ticker, _cache_response(key, response, collected.complete))
+    except Exception as e:
+        logger.error(f"Error processing batch sentiment: {e}")
+        for ticker in flights:
+            resolve(ticker, e)
+    finally:
+        # Never leave waiters hanging, e.g. if the build is cancelled at shutdown
+        for ticker in flights:
+            resolve(ticker, RuntimeError("Batch build did not complete"))
+
+
+@app.post("/sentiment/batch", response_model=BatchSentimentResponse)
+async def get_batch_sentiment_analysis(request: BatchSentimentRequest):
+    """
+    Analyze sentiment for several tickers in one call.
+    
+    Tickers with an identical /sentiment build already in flight join it.
+    The rest are built together, so their items share model batches, in a
+    background task that keeps running if the client disconnects. Each
+    ticker succeeds or fails on its own.
+    
+    Args:
+        request: Tickers and shared analysis options
+        
+    Returns:
+        BatchSentimentResponse with one result per unique ticker, in request order
+    """
+    tickers = list(dict.fromkeys(ticker.upper().strip() for ticker in request.tickers))
+    results: Dict[str, TickerSentimentResult] = {}
+    flights: Dict[str, asyncio.Future] = {}
+    led: Dict[str, asyncio.Future] = {}
+    loop = asyncio.get_running_loop()
+
+    def fail(ticker: str, error: str) -> None:
+        results[ticker] = TickerSentimentResult(ticker=ticker, status="error", error=error)
+
+    # Serve cached responses, reject malformed tickers and join or lead a flight per key
+    for ticker in tickers:
+        if not _TICKER_PATTERN.match(ticker):
+            fail(ticker, "Invalid ticker symbol")
+            continue
+        prefetcher.record_request(ticker)
+        key: SentimentCacheKey = (ticker, request.lookback_days, request.limit, request.include_rationales)
+        cached = response_cache.get(key)
+        if cached is not None:
+            if not cached.is_fresh:
+                _schedule_refresh(key)
+            results[ticker] = TickerSentimentResult(ticker=ticker, status="ok", response=cached.value)
+            continue
+        future = loop.create_future()
+        flights[ticker] = sentiment_flights.start(key, lambda future=future: future)
+        if flights[ticker] is future:
+            led[ticker] = future
+
+    if led:
+        _run_in_background(
+            _build_batch_entries(led, request.lookback_days, request.limit, request.include_rationales)
+        )
+
+    for ticker, flight in flights.items():
+        try:
+            entry = await asyncio.shield(flight)
+        except InferenceQueueFullError as e:
+            logger.warning(f"Rejecting batch sentiment for {ticker}: {e}")
+            fail(ticker, "Sentiment model is busy, please retry shortly")
+        except Exception as e:
+            fail(ticker, str(e))
+        else:
+            results[ticker] = TickerSentimentResult(ticker=ticker, status="ok", response=entry.value)
+
+    ordered = [results[ticker] for ticker in tickers]
+    return BatchSentimentResponse(
+        as_of=now_utc().isoformat(),
+        n_tickers=len(ordered),
+        n_failed=sum(1 for result in ordered if result.status == "error"),
+        results=ordered,
+    )
 
 
 if __name__ == "__main__":
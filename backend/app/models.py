@@ -7,11 +7,14 @@ from __future__ import annotations
 
 from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Optional, Tuple
 
 
 JsonDict = Dict[str, Any]
 
+# FinBERT output per text: (label, p_pos, p_neu, p_neg, score)
+SentimentResult = Tuple[str, float, float, float, float]
+
 
 @dataclass
 class NewsItem:
@@ -45,5 +48,19 @@ class NewsItem:
     weight: Optional[float] = None        # [0, 1]
     weighted_score: Optional[float] = None # weight * score
 
+    # Explanation (set by services/rationales)
+    rationale: str = ""
+
+
+@dataclass(frozen=True)
+class SeenItem:
+    """Analysis of a news item kept between polls; recency is recomputed on reuse."""
+
+    sentiment: SentimentResult
+    source_w: float
+    engage_w: float
+    rationale: str
+    published_ts: float  # epoch seconds, for retention
+
 
-__all__ = ["NewsItem", "JsonDict"]
+__all__ = ["NewsItem", "JsonDict", "SeenItem", "SentimentResult"]
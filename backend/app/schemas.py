@@ -3,6 +3,8 @@ from datetime import datetime
 from pydantic import BaseModel, Field, ConfigDict
 from typing import Literal, Optional, Dict, Any
 
+from app.config import BATCH_MAX_TICKERS, DEFAULT_LOOKBACK_DAYS, MAX_LOOKBACK_DAYS
+
 class NewsItem(BaseModel):
     model_config = ConfigDict(from_attributes=True)
 
@@ -28,4 +30,25 @@ class SentimentResponse(BaseModel):
     lookback_days: int
     overall_score: float
     n_items: int
-    items: list[NewsItem]
\ No newline at end of file
+    items: list[NewsItem]
+    news_fetched_at: Optional[str] = None   # when the oldest feed behind the items was downloaded
+    news_age_seconds: Optional[float] = None  # age of that feed data at as_of
+
+
+class BatchSentimentRequest(BaseModel):
+    tickers: list[str] = Field(..., min_length=1, max_length=BATCH_MAX_TICKERS)
+    lookback_days: int = Field(DEFAULT_LOOKBACK_DAYS, ge=1, le=MAX_LOOKBACK_DAYS)
+    include_rationales: bool = True
+    limit: int = Field(10, ge=1, le=50)
+
+class TickerSentimentResult(BaseModel):
+    ticker: str
+    status: Literal["ok", "error"]
+    response: Optional[SentimentResponse] = None   # set when status == "ok"
+    error: Optional[str] = None                     # set when status == "error"
+
+class BatchSentimentResponse(BaseModel):
+    as_of: str
+    n_tickers: int
+    n_failed: int
+    results: list[TickerSentimentResult]            # same order as the request tickers
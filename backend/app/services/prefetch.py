@@ -0,0 +1,475 @@
+"""
+Background prefetching of feeds and sentiment for popular tickers.
+
+A configurable watchlist plus the most-requested tickers are refreshed in the
+background, so their feed, sentiment and response caches are already warm
+when a request arrives. Refreshes run in priority order (popularity x staleness)
+under a small concurrency cap and pause while live requests are queued for
+the model.
+
+Each (ticker, source) feed has its own poll interval, learned from how often
+new item IDs appear in it: quiet feeds back off exponentially, busy feeds
+speed up, within fixed bounds. A ticker can be boosted to the fastest
+interval for a while, e.g. on an earnings day.
+"""
+from __future__ import annotations
+
+import asyncio
+import heapq
+import logging
+import random
+import time
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable, Dict, FrozenSet, Iterable, List, Optional, Tuple
+
+from app.config import (
+    DEFAULT_LOOKBACK_DAYS,
+    MAX_ITEMS,
+    PREFETCH_BACKOFF_FACTOR,
+    PREFETCH_BOOST_MINUTES,
+    PREFETCH_CONCURRENCY,
+    PREFETCH_INTERVAL_SECONDS,
+    PREFETCH_JITTER,
+    PREFETCH_MAX_INTERVAL_SECONDS,
+    PREFETCH_MAX_LEARNED,
+    PREFETCH_MIN_INTERVAL_SECONDS,
+    PREFETCH_POPULARITY_HALF_LIFE_SECONDS,
+    PREFETCH_SPEEDUP_FACTOR,
+    PREFETCH_WATCHLIST,
+)
+from app.core.seen_items import seen_items
+from app.core.sentiment import analyze_batch_async, get_micro_batcher
+from app.models import NewsItem
+from app.sources.collector import FEED_SOURCES, collect_news_with_age, refresh_feeds
+
+logger = logging.getLogger("uvicorn")
+
+# Weight of the latest observation in the new-items-per-hour moving average
+_CHANGE_RATE_ALPHA = 0.3
+
+# Builds and caches a ticker's /sentiment response for the default request options
+ResponseWarmer = Callable[[str], Awaitable[Any]]
+
+
+@dataclass
+class SourceActivity:
+    """Learned poll interval and change rate of one (ticker, source) feed."""
+
+    interval: float
+    next_due: float = 0.0
+    last_fetch: Optional[float] = None
+    last_ids: FrozenSet[str] = frozenset()
+    fetches: int = 0
+    new_items: int = 0
+    change_rate_per_hour: float = 0.0
+
+
+@dataclass
+class TickerActivity:
+    """Request popularity and refresh state of one ticker."""
+
+    popularity: float = 0.0
+    popularity_at: float = 0.0
+    last_refresh: Optional[float] = None
+    refreshes: int = 0
+    failures: int = 0
+    boost_until: float = 0.0
+    sources: Dict[str, SourceActivity] = field(default_factory=dict)
+
+
+class PrefetchScheduler:
+    """
+    Periodically refresh feeds and sentiment for watched and popular tickers.
+
+    Request popularity decays exponentially with a configurable half-life, so
+    the learned set follows what users are asking for now.
+    """
+
+    def __init__(
+        self,
+        watchlist: Iterable[str] = (),
+        interval_seconds: float = PREFETCH_INTERVAL_SECONDS,
+        jitter: float = PREFETCH_JITTER,
+        concurrency: int = PREFETCH_CONCURRENCY,
+        max_learned: int = PREFETCH_MAX_LEARNED,
+        half_life_seconds: float = PREFETCH_POPULARITY_HALF_LIFE_SECONDS,
+        min_interval_seconds: float = PREFETCH_MIN_INTERVAL_SECONDS,
+        max_interval_seconds: float = PREFETCH_MAX_INTERVAL_SECONDS,
+        backoff_factor: float = PREFETCH_BACKOFF_FACTOR,
+        speedup_factor: float = PREFETCH_SPEEDUP_FACTOR,
+        lookback_days: int = DEFAULT_LOOKBACK_DAYS,
+        limit: int = MAX_ITEMS,
+        warm_response: Optional[ResponseWarmer] = None,
+    ):
+        """
+        Args:
+            watchlist: Tickers that are always refreshed
+            interval_seconds: Starting poll interval of a new feed
+            jitter: Fractional +/- randomization of each interval
+            concurrency: Maximum refreshes in flight at once
+            max_learned: Maximum tickers added from request frequency
+            half_life_seconds: Half-life of request popularity
+            min_interval_seconds: Fastest allowed poll interval (also used by boosts)
+            max_interval_seconds: Slowest allowed poll interval
+            backoff_factor: Interval multiplier after a poll with no new items
+            speedup_factor: Interval divisor after a poll with new items
+            lookback_days: Lookback used when collecting news
+            limit: Maximum items collected per ticker
+            warm_response: Called after each ticker refresh to rebuild and
+                cache the response users actually request
+        """
+        self.watchlist = [ticker.upper().strip() for ticker in watchlist if ticker.strip()]
+        self.min_interval_seconds = min_interval_seconds
+        self.max_interval_seconds = max(min_interval_seconds, max_interval_seconds)
+        self.interval_seconds = min(self.max_interval_seconds, max(self.min_interval_seconds, interval_seconds))
+        self.jitter = jitter
+        self.concurrency = concurrency
+        self.max_learned = max_learned
+        self.half_life_seconds = half_life_seconds
+        self.backoff_factor = backoff_factor
+        self.speedup_factor = speedup_factor
+        self.lookback_days = lookback_days
+        self.limit = limit
+        self.warm_response = warm_response
+        self._activity: Dict[str, TickerActivity] = {}
+        self._task: Optional[asyncio.Task] = None
+        self.cycles = 0
+        self.deferred_cycles = 0
+
+    def _new_activity(self, now: float) -> TickerActivity:
+        """Fresh ticker state with every feed due immediately."""
+        return TickerActivity(
+            popularity_at=now,
+            sources={source: SourceActivity(self.interval_seconds, now) for source in FEED_SOURCES},
+        )
+
+    def _get_activity(self, ticker: str, now: float) -> TickerActivity:
+        """Get a ticker's state, creating it on first use."""
+        activity = self._activity.get(ticker)
+        if activity is None:
+            activity = self._activity[ticker] = self._new_activity(now)
+        return activity
+
+    def _interval_of(self, activity: TickerActivity, now: float) -> float:
+        """Shortest effective poll interval across a ticker's feeds."""
+        return min(self.source_interval(activity, source, now) for source in activity.sources.values())
+
+    def record_request(self, ticker: str) -> None:
+        """
+        Count a user request for a ticker towards its popularity.
+
+        Args:
+            ticker: Normalized ticker symbol
+        """
+        now = time.monotonic()
+        activity = self._get_activity(ticker, now)
+        activity.popularity = self._decayed_popularity(activity, now) + 1.0
+        activity.popularity_at = now
+        if len(self._activity) > len(self.watchlist) + 4 * max(self.max_learned, 25):
+            self._prune(now)
+
+    def boost(self, ticker: str, minutes: float = PREFETCH_BOOST_MINUTES) -> float:
+        """
+        Poll a ticker at the fastest interval for a while, starting now.
+
+        Boosted tickers are prefetched even if they are neither watched nor
+        popular.
+
+        Args:
+            ticker: Normalized ticker symbol
+            minutes: How long the boost lasts
+
+        Returns:
+            Seconds until the boost expires
+        """
+        now = time.monotonic()
+        activity = self._get_activity(ticker, now)
+        activity.boost_until = max(activity.boost_until, now + minutes * 60.0)
+        for source in activity.sources.values():
+            source.next_due = min(source.next_due, now)
+        return activity.boost_until - now
+
+    def _is_boosted(self, activity: TickerActivity, now: float) -> bool:
+        """Whether a ticker's boost is still active."""
+        return activity.boost_until > now
+
+    def _prune(self, now: float) -> None:
+        """Forget the least popular learned tickers so tracking stays bounded."""
+        learned = sorted(
+            (
+                ticker for ticker, activity in self._activity.items()
+                if ticker not in self.watchlist and not self._is_boosted(activity, now)
+            ),
+            key=lambda ticker: self._decayed_popularity(self._activity[ticker], now),
+        )
+        for ticker in learned[: len(learned) // 2]:
+            del self._activity[ticker]
+
+    def _decayed_popularity(self, activity: TickerActivity, now: float) -> float:
+        """Popularity of a ticker decayed to the given time."""
+        elapsed = max(0.0, now - activity.popularity_at)
+        return activity.popularity * 0.5 ** (elapsed / self.half_life_seconds)
+
+    def tracked_tickers(self) -> List[str]:
+        """
+        Get the tickers currently being prefetched.
+
+        Returns:
+            Watchlist and boosted tickers followed by the most popular learned tickers
+        """
+        now = time.monotonic()
+        boosted = [
+            ticker for ticker, activity in self._activity.items()
+            if ticker not in self.watchlist and self._is_boosted(activity, now)
+        ]
+        learned = sorted(
+            (
+                ticker for ticker in self._activity
+                if ticker not in self.watchlist and ticker not in boosted
+            ),
+            key=lambda ticker: self._decayed_popularity(self._activity[ticker], now),
+            reverse=True,
+        )
+        return self.watchlist + boosted + learned[: self.max_learned]
+
+    def source_interval(self, activity: TickerActivity, source: SourceActivity, now: float) -> float:
+        """Effective poll interval of a feed, accounting for an active boost."""
+        if self._is_boosted(activity, now):
+            return self.min_interval_seconds
+        return source.interval
+
+    def ticker_interval(self, ticker: str) -> float:
+        """
+        Get a ticker's current poll interval.
+
+        Args:
+            ticker: Normalized ticker symbol
+
+        Returns:
+            Shortest effective interval across the ticker's feeds, in seconds
+        """
+        now = time.monotonic()
+        return self._interval_of(self._activity.get(ticker) or self._new_activity(now), now)
+
+    def _jittered(self, interval: float) -> float:
+        """Interval with random jitter so feeds do not refresh in lockstep."""
+        return interval * (1.0 + random.uniform(-self.jitter, self.jitter))
+
+    def _observe(self, ticker: str, source_name: str, items: List[NewsItem], now: float) -> None:
+        """
+        Adapt a feed's poll interval from the items of one poll.
+
+        New item IDs since the previous poll divide the interval by the
+        speed-up factor; none multiply it by the back-off factor. An empty
+        result (refresh_feeds reports failed fetches as []) leaves the
+        interval unchanged.
+        """
+        activity = self._get_activity(ticker, now)
+        source = activity.sources[source_name]
+        source.fetches += 1
+
+        if items:
+            ids = frozenset(item.id for item in items)
+            if source.last_fetch is not None:
+                new_count = len(ids - source.last_ids)
+                source.new_items += new_count
+                hours = max(now - source.last_fetch, 1.0) / 3600.0
+                source.change_rate_per_hour = (
+                    _CHANGE_RATE_ALPHA * new_count / hours
+                    + (1.0 - _CHANGE_RATE_ALPHA) * source.change_rate_per_hour
+                )
+                if new_count:
+                    source.interval /= self.speedup_factor
+                else:
+                    source.interval *= self.backoff_factor
+                source.interval = min(self.max_interval_seconds, max(self.min_interval_seconds, source.interval))
+            source.last_ids = ids
+            source.last_fetch = now
+
+        source.next_due = now + self._jittered(self.source_interval(activity, source, now))
+
+    def _due_queue(self, now: float) -> List[Tuple[float, str]]:
+        """
+        Build the priority queue of tickers with at least one feed due.
+
+        Priority is popularity (every ticker counts at least 1) times
+        staleness in units of the ticker's poll interval; never-refreshed
+        tickers count as one full interval stale.
+        """
+        queue: List[Tuple[float, str]] = []
+        for ticker in self.tracked_tickers():
+            activity = self._get_activity(ticker, now)
+            if all(source.next_due > now for source in activity.sources.values()):
+                continue
+            popularity = 1.0 + self._decayed_popularity(activity, now)
+            if activity.last_refresh is None:
+                staleness = 1.0
+            else:
+                staleness = (now - activity.last_refresh) / self._interval_of(activity, now)
+            heapq.heappush(queue, (-popularity * staleness, ticker))
+        return queue
+
+    async def refresh_ticker(self, ticker: str) -> int:
+        """
+        Refetch a ticker's due feeds, score any new items and warm the response cache.
+
+        Feeds that are not due are read through the feed cache as usual.
+
+        Args:
+            ticker: Normalized ticker symbol
+
+        Returns:
+            Number of items collected
+        """
+        now = time.monotonic()
+        activity = self._get_activity(ticker, now)
+        due = [name for name, source in activity.sources.items() if source.next_due <= now]
+        feeds = await refresh_feeds(ticker, self.lookback_days, due or None)
+
+        now = time.monotonic()
+        for source_name, items in feeds.items():
+            self._observe(ticker, source_name, items, now)
+
+        collected = await collect_news_with_age(ticker, lookback_days=self.lookback_days, limit=self.limit)
+        batch = collected.batch
+        if len(batch):
+            await analyze_batch_async(batch, await seen_items.hydrate(ticker, batch))
+            await asyncio.to_thread(seen_items.record, ticker, batch)
+        if self.warm_response is not None:
+            # Built from the items just analyzed, so it costs no model calls
+            await self.warm_response(ticker)
+        return len(batch)
+
+    async def _refresh_slot(self, semaphore: asyncio.Semaphore, ticker: str) -> None:
+        """Refresh one ticker while holding a prefetch slot."""
+        async with semaphore:
+            activity = self._get_activity(ticker, time.monotonic())
+            try:
+                await self.refresh_ticker(ticker)
+                activity.refreshes += 1
+            except Exception as e:
+                activity.failures += 1
+                logger.warning(f"Prefetch failed for {ticker}: {e}")
+            now = time.monotonic()
+            activity.last_refresh = now
+            # Make sure a failed refresh is not retried in a tight loop
+            for source in activity.sources.values():
+                if source.next_due <= now:
+                    source.next_due = now + self._jittered(self.source_interval(activity, source, now))
+
+    async def run_once(self) -> int:
+        """
+        Refresh every due ticker in priority order.
+
+        The cycle is skipped while live requests are waiting for the model,
+        so prefetching only uses idle capacity.
+
+        Returns:
+            Number of tickers refreshed
+        """
+        if get_micro_batcher().queued_texts > 0:
+            self.deferred_cycles += 1
+            return 0
+
+        queue = self._due_queue(time.monotonic())
+        order = [heapq.heappop(queue)[1] for _ in range(len(queue))]
+        if order:
+            # Semaphore waiters are served FIFO, so tasks start in priority order
+            semaphore = asyncio.Semaphore(self.concurrency)
+            await asyncio.gather(*(self._refresh_slot(semaphore, ticker) for ticker in order))
+        self.cycles += 1
+        return len(order)
+
+    def _seconds_until_due(self) -> float:
+        """Time until the next tracked feed is due, capped at the fastest interval."""
+        now = time.monotonic()
+        due = [
+            source.next_due
+            for ticker in self.tracked_tickers()
+            for source in self._get_activity(ticker, now).sources.values()
+        ]
+        if not due:
+            return self.min_interval_seconds
+        return min(self.min_interval_seconds, max(1.0, min(due) - now))
+
+    async def _run(self) -> None:
+        """Scheduler loop: refresh due tickers, then sleep until the next is due."""
+        while True:
+            try:
+                await self.run_once()
+            except Exception as e:
+                logger.warning(f"Prefetch cycle failed: {e}")
+            await asyncio.sleep(self._seconds_until_due())
+
+    def start(self) -> None:
+        """Start the scheduler loop on the running event loop."""
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """Cancel the scheduler loop and wait for it to exit."""
+        task, self._task = self._task, None
+        if task is None:
+            return
+        task.cancel()
+        try:
+            await task
+        except asyncio.CancelledError:
+            pass
+
+    def get_ticker_stats(self, ticker: str) -> Dict[str, Any]:
+        """
+        Get the learned refresh state of one ticker.
+
+        Args:
+            ticker: Normalized ticker symbol
+
+        Returns:
+            Dictionary with popularity, boost, poll interval and per-source change rates
+        """
+        now = time.monotonic()
+        activity = self._activity.get(ticker) or self._new_activity(now)
+        return {
+            "watchlist": ticker in self.watchlist,
+            "popularity": round(self._decayed_popularity(activity, now), 3),
+            "boosted_for_seconds": round(max(0.0, activity.boost_until - now), 1),
+            "interval_seconds": round(self._interval_of(activity, now), 1),
+            "refreshes": activity.refreshes,
+            "failures": activity.failures,
+            "last_refresh_age_seconds": (
+                round(now - activity.last_refresh, 1) if activity.last_refresh is not None else None
+            ),
+            "sources": {
+                name: {
+                    "interval_seconds": round(self.source_interval(activity, source, now), 1),
+                    "learned_interval_seconds": round(source.interval, 1),
+                    "next_refresh_in_seconds": round(max(0.0, source.next_due - now), 1),
+                    "fetches": source.fetches,
+                    "new_items": source.new_items,
+                    "new_items_per_hour": round(source.change_rate_per_hour, 3),
+                }
+                for name, source in activity.sources.items()
+            },
+        }
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get scheduler state for the tracked tickers.
+
+        Returns:
+            Dictionary with cycle counts and per-ticker refresh state
+        """
+        return {
+            "running": self._task is not None and not self._task.done(),
+            "interval_bounds_seconds": [self.min_interval_seconds, self.max_interval_seconds],
+            "concurrency": self.concurrency,
+            "cycles": self.cycles,
+            "deferred_cycles": self.deferred_cycles,
+            "tickers": {ticker: self.get_ticker_stats(ticker) for ticker in self.tracked_tickers()},
+        }
+
+
+prefetcher = PrefetchScheduler(PREFETCH_WATCHLIST)
+
+
+__all__ = ["PrefetchScheduler", "SourceActivity", "TickerActivity", "prefetcher"]
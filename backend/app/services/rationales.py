@@ -6,7 +6,7 @@ from __future__ import annotations
 import json
 import os
 from textwrap import shorten
-from typing import List
+from typing import List, Tuple
 
 from app.schemas import NewsItem
 
@@ -63,13 +63,17 @@ def generate_fallback_rationales(items: List[NewsItem], ticker: str) -> List[str
     return rationales
 
 
-async def generate_ai_rationales(
+async def generate_rationales(
     items: List[NewsItem], 
     ticker: str, 
     model: str = "gpt-4o-mini"
-) -> List[str]:
+) -> Tuple[List[str], List[bool]]:
     """
-    Generate AI-powered rationales using OpenAI's API.
+    Generate AI-powered rationales using OpenAI's API, reporting fallbacks.
+    
+    Rule-based fallbacks fill in when OpenAI is unavailable, fails or leaves
+    an item empty. Callers must not persist them, so a later call can still
+    get the model's rationale.
     
     Args:
         items: List of NewsItem objects
@@ -77,12 +81,12 @@ async def generate_ai_rationales(
         model: OpenAI model to use
         
     Returns:
-        List of rationale strings (same length as items)
+        Rationale strings and whether each is a rule-based fallback (both same length as items)
     """
     # Get OpenAI client (returns None if not available)
     client = _get_openai_client()
     if not client:
-        return generate_fallback_rationales(items, ticker)
+        return generate_fallback_rationales(items, ticker), [True] * len(items)
 
     # Prepare compact data for AI processing
     compact_items = [
@@ -135,15 +139,37 @@ async def generate_ai_rationales(
         
         # Fill empty rationales with fallback
         fallback_rationales = generate_fallback_rationales(items, ticker)
-        data = [rationale if rationale.strip() else fallback_rationales[i] 
-                for i, rationale in enumerate(data)]
+        fallbacks = [not rationale.strip() for rationale in data]
+        data = [fallback_rationales[i] if fallback else rationale
+                for i, (rationale, fallback) in enumerate(zip(data, fallbacks))]
         
-        return data
+        return data, fallbacks
         
     except Exception as e:
         print(f"Error generating AI rationales: {e}")
         # Fallback to rule-based rationales
-        return generate_fallback_rationales(items, ticker)
+        return generate_fallback_rationales(items, ticker), [True] * len(items)
+
+
+async def generate_ai_rationales(
+    items: List[NewsItem], 
+    ticker: str, 
+    model: str = "gpt-4o-mini"
+) -> List[str]:
+    """
+    Generate AI-powered rationales using OpenAI's API.
+    
+    Args:
+        items: List of NewsItem objects
+        ticker: Stock ticker symbol
+        model: OpenAI model to use
+        
+    Returns:
+        List of rationale strings (same length as items), with rule-based
+        fallbacks where the model gave none
+    """
+    rationales, _ = await generate_rationales(items, ticker, model)
+    return rationales
 
 
 # Backward compatibility alias
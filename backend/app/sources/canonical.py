@@ -0,0 +1,175 @@
+"""
+Canonical article URLs for cross-source deduplication.
+
+The same story reaches us under different URLs: wrapped in a Google News
+redirect, with tracking parameters, as an AMP page or with and without
+``www``. canonicalize_url maps these to one form without any network calls.
+"""
+from __future__ import annotations
+
+import base64
+import binascii
+import re
+from typing import Dict, Optional
+from urllib.parse import parse_qsl, unquote, urlencode, urlsplit, urlunsplit
+
+from app.config import CANONICAL_URL_CACHE_SIZE
+from app.core.cache import LRUCache
+
+# Query parameters that only track the click, never select the content
+_TRACKING_PARAMS = frozenset({
+    "cmpid", "fbclid", "gclid", "guccounter", "guce_referrer", "guce_referrer_sig", "mc_cid",
+    "mc_eid", "mod", "ncid", "ocid", "soc_src", "soc_trk", "taid", "tsrc", ".tsrc",
+    "yptr", "smid", "sr_share", "sref", "feedtype", "rss", "amp", "outputtype",
+})
+_TRACKING_PREFIXES = ("utm_", "mbid", "__")
+
+# host -> query parameter carrying the target URL
+_QUERY_REDIRECTORS = {
+    "google.com": ("url", "q"),
+    "news.google.com": ("url",),
+    "l.facebook.com": ("u",),
+    "lm.facebook.com": ("u",),
+    "out.reddit.com": ("url",),
+    "t.umblr.com": ("z",),
+}
+
+_AMP_PATH = re.compile(r"(?:/amp/?$|/amp(?=/)|\.amp(?=\.html?$)|/amp\.html?$)", re.IGNORECASE)
+_YAHOO_REDIRECT = re.compile(r"/RU=([^/]+)/R[KS]=")
+
+# Google News article IDs starting with these bytes embed the article URL
+_GOOGLE_ARTICLE_PREFIX = b"\x08\x13\x22"
+
+_canonical_urls: LRUCache[str, str] = LRUCache(CANONICAL_URL_CACHE_SIZE)
+_canonical_stats: Dict[str, int] = {"hits": 0, "misses": 0, "unwrapped": 0}
+
+
+def _decode_google_news_article(path: str) -> Optional[str]:
+    """
+    Recover the publisher URL embedded in a Google News article ID.
+
+    Older IDs are base64 protobuf holding the URL as a length-prefixed field;
+    newer opaque IDs can only be resolved over the network and return None.
+    """
+    article_id = path.rstrip("/").rsplit("/", 1)[-1]
+    try:
+        data = base64.urlsafe_b64decode(article_id + "=" * (-len(article_id) % 4))
+    except (binascii.Error, ValueError):
+        return None
+    if not data.startswith(_GOOGLE_ARTICLE_PREFIX):
+        return None
+
+    # Varint length of the URL field
+    position, length, shift = len(_GOOGLE_ARTICLE_PREFIX), 0, 0
+    while position < len(data):
+        byte = data[position]
+        position += 1
+        length |= (byte & 0x7F) << shift
+        shift += 7
+        if not byte & 0x80:
+            break
+    url = data[position:position + length].decode("utf-8", "ignore")
+    return url if url.startswith(("http://", "https://")) else None
+
+
+def _unwrap_redirect(url: str) -> Optional[str]:
+    """Get the target of a known redirector URL, or None if it is not one."""
+    parts = urlsplit(url)
+    host = parts.netloc.lower().split(":")[0]
+    if host.startswith("www."):
+        host = host[4:]
+
+    if host == "news.google.com" and "/articles/" in parts.path:
+        target = _decode_google_news_article(parts.path)
+        if target:
+            return target
+
+    if host.endswith("search.yahoo.com"):
+        match = _YAHOO_REDIRECT.search(parts.path)
+        if match:
+            return unquote(match.group(1))
+
+    for param in _QUERY_REDIRECTORS.get(host, ()):
+        for key, value in parse_qsl(parts.query):
+            if key == param and value.startswith(("http://", "https://")):
+                return value
+    return None
+
+
+def _normalize(url: str) -> str:
+    """Normalize host, path and query of an unwrapped URL."""
+    parts = urlsplit(url.strip())
+    scheme = "https" if parts.scheme in ("http", "https", "") else parts.scheme.lower()
+
+    host = parts.hostname or ""
+    for prefix in ("www.", "amp.", "m."):
+        if host.startswith(prefix) and host.count(".") > 1:
+            host = host[len(prefix):]
+    if parts.port and parts.port not in (80, 443):
+        host = f"{host}:{parts.port}"
+
+    path = _AMP_PATH.sub("", parts.path) or "/"
+    if len(path) > 1:
+        path = path.rstrip("/")
+
+    query = urlencode(sorted(
+        (key, value)
+        for key, value in parse_qsl(parts.query, keep_blank_values=True)
+        if key.lower() not in _TRACKING_PARAMS and not key.lower().startswith(_TRACKING_PREFIXES)
+    ))
+    return urlunsplit((scheme, host, path, query, ""))
+
+
+def canonicalize_url(url: str) -> str:
+    """
+    Get the canonical form of an article URL.
+
+    Known redirectors (Google News article links, google.com/url, Yahoo search
+    redirects and similar) are unwrapped, then tracking parameters, the
+    fragment, AMP path markers and ``www.``/``m.``/``amp.`` host prefixes are
+    removed and the remaining parameters sorted. Results are kept in a
+    bounded LRU.
+
+    Args:
+        url: Article URL as found in a feed
+
+    Returns:
+        Canonical URL, or "" for an empty input
+    """
+    if not url:
+        return ""
+    canonical = _canonical_urls.get(url)
+    if canonical is not None:
+        _canonical_stats["hits"] += 1
+        return canonical
+
+    _canonical_stats["misses"] += 1
+    target = url
+    # Redirectors can be nested (a Google redirect to a Yahoo redirect)
+    for _ in range(3):
+        unwrapped = _unwrap_redirect(target)
+        if unwrapped is None:
+            break
+        target = unwrapped
+    if target != url:
+        _canonical_stats["unwrapped"] += 1
+
+    try:
+        canonical = _normalize(target)
+    except ValueError:
+        canonical = target
+    _canonical_urls.put(url, canonical)
+    return canonical
+
+
+def get_canonical_url_stats() -> Dict[str, int]:
+    """
+    Get canonical URL cache counters.
+
+    Returns:
+        Dictionary with cache hits, misses, unwrapped redirects and size
+    """
+    return {**_canonical_stats, "cached": len(_canonical_urls)}
+
+
+__all__ = ["canonicalize_url", "get_canonical_url_stats"]
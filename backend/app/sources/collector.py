@@ -4,31 +4,63 @@ News collection coordinator that aggregates from multiple sources.
 from __future__ import annotations
 
 import asyncio
-from typing import List, Iterable
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from typing import Dict, List, Iterable, Tuple
 
+from app.core.batch import NewsBatch
+from app.core.cache import CachedResponse, ResponseCache
+from app.core.dedup import cluster_near_duplicates, text_tokens
+from app.core.singleflight import SingleFlight
 from app.models import NewsItem
+from app.sources.canonical import canonicalize_url
+from app.sources.common import copy_news_items, lookback_cutoff
 from app.sources.google_news import GoogleNewsFetcher
 from app.sources.yfinance import YahooFinanceFetcher
-from app.config import MAX_ITEMS, SOURCE_BASE_WEIGHTS, DEFAULT_SOURCE_WEIGHT
+from app.config import (
+    DEDUP_LSH_BANDS,
+    DEDUP_MINHASH_PERMUTATIONS,
+    DEDUP_SIMILARITY_THRESHOLD,
+    DEFAULT_SOURCE_WEIGHT,
+    FEED_CACHE_SIZE,
+    MAX_ITEMS,
+    MAX_LOOKBACK_DAYS,
+    SOURCE_BASE_WEIGHTS,
+)
 
 
-def deduplicate_news_items(items: Iterable[NewsItem]) -> List[NewsItem]:
+_dedup_stats: Dict[str, int] = {"input": 0, "exact_duplicates": 0, "near_duplicates": 0}
+
+
+def deduplicate_news_items(
+    items: Iterable[NewsItem],
+    similarity_threshold: float = DEDUP_SIMILARITY_THRESHOLD,
+) -> List[NewsItem]:
     """
-    Remove duplicate news items based on URL and title.
+    Remove duplicate news items based on URL, title and near-identical text.
+    
+    Exact repeats of a canonical URL (redirects unwrapped, tracking
+    parameters stripped) or title are dropped first, keeping the first
+    occurrence. Items whose title and summary are near-duplicates are then
+    clustered, and only the most credible source of each cluster is kept.
     
     Args:
         items: Iterable of NewsItem objects
+        similarity_threshold: Jaccard similarity at which two stories are
+            near-duplicates; 1.0 disables the near-duplicate stage
         
     Returns:
-        List of unique NewsItem objects
+        List of unique NewsItem objects, in input order
     """
     seen_urls: set[str] = set()
     seen_titles: set[str] = set()
     unique_items: List[NewsItem] = []
+    total = 0
     
     for item in items:
-        # Normalize URL by removing query parameters
-        url_key = (item.url or "").split("?")[0]
+        total += 1
+        # Same article under a redirect, AMP or tracking variant of its URL
+        url_key = canonicalize_url(item.url)
         
         # Skip if URL already seen
         if url_key and url_key in seen_urls:
@@ -44,7 +76,53 @@ def deduplicate_news_items(items: Iterable[NewsItem]) -> List[NewsItem]:
         seen_titles.add(title)
         unique_items.append(item)
     
-    return unique_items
+    _dedup_stats["input"] += total
+    _dedup_stats["exact_duplicates"] += total - len(unique_items)
+    if similarity_threshold >= 1.0 or len(unique_items) < 2:
+        return unique_items
+    
+    clusters = cluster_near_duplicates(
+        [text_tokens(item.title, item.text) for item in unique_items],
+        similarity_threshold,
+        DEDUP_MINHASH_PERMUTATIONS,
+        DEDUP_LSH_BANDS,
+    )
+    
+    # Most credible member of each cluster; ties keep the earliest
+    best: Dict[int, int] = {}
+    for index, cluster in enumerate(clusters):
+        current = best.get(cluster)
+        if current is None or (
+            source_credibility(unique_items[index].source) > source_credibility(unique_items[current].source)
+        ):
+            best[cluster] = index
+    
+    kept = [item for index, item in enumerate(unique_items) if best[clusters[index]] == index]
+    _dedup_stats["near_duplicates"] += len(unique_items) - len(kept)
+    return kept
+
+
+def get_dedup_stats() -> Dict[str, int]:
+    """
+    Get counts of items seen and dropped by deduplicate_news_items.
+    
+    Returns:
+        Dictionary with input, exact-duplicate and near-duplicate counts
+    """
+    return dict(_dedup_stats)
+
+
+def source_credibility(domain: str) -> float:
+    """
+    Get the credibility weight of a news source.
+    
+    Args:
+        domain: News source domain
+        
+    Returns:
+        Configured weight, or DEFAULT_SOURCE_WEIGHT for unknown sources
+    """
+    return SOURCE_BASE_WEIGHTS.get(domain, DEFAULT_SOURCE_WEIGHT)
 
 
 def is_trusted_source(domain: str) -> bool:
@@ -57,13 +135,72 @@ def is_trusted_source(domain: str) -> bool:
     Returns:
         True if source is trusted (weight >= 0.6)
     """
-    weight = SOURCE_BASE_WEIGHTS.get(domain, DEFAULT_SOURCE_WEIGHT)
-    return weight >= 0.6
+    return source_credibility(domain) >= 0.6
 
 
-async def collect_news(ticker: str, lookback_days: int, limit: int | None = None) -> List[NewsItem]:
+# Fetchers are stateless, so one instance of each is shared
+_FETCHERS = (GoogleNewsFetcher(), YahooFinanceFetcher())
+FEED_SOURCES: Tuple[str, ...] = tuple(fetcher.SOURCE_NAME for fetcher in _FETCHERS)
+
+# Parsed NewsItem lists per (source, ticker), each source with its own TTL. Feeds
+# are parsed with the longest allowed lookback so one entry serves every
+# request; shorter lookbacks are cut after the cache.
+_feed_caches: Dict[str, ResponseCache[str, List[NewsItem]]] = {
+    fetcher.SOURCE_NAME: ResponseCache(FEED_CACHE_SIZE, fetcher.CACHE_TTL_SECONDS, 0.0)
+    for fetcher in _FETCHERS
+}
+_feed_flights: SingleFlight[Tuple[str, str], CachedResponse[List[NewsItem]]] = SingleFlight()
+
+
+@dataclass
+class CollectedNews:
+    """Collected news batch plus how fresh the underlying feed data is."""
+
+    batch: NewsBatch
+    fetched_at: datetime  # when the oldest feed used was downloaded
+    complete: bool = True  # False if any source failed; the batch may be empty or partial
+
+    @property
+    def items(self) -> List[NewsItem]:
+        """The collected items as new NewsItem objects."""
+        return self.batch.to_items()
+
+    @property
+    def age_seconds(self) -> float:
+        """Seconds since the oldest feed used was downloaded."""
+        return max(0.0, (datetime.now(timezone.utc) - self.fetched_at).total_seconds())
+
+
+async def _fetch_source_cached(
+    fetcher,
+    ticker: str,
+    force_refresh: bool = False,
+) -> CachedResponse[List[NewsItem]]:
     """
-    Collect news articles from multiple sources for a given ticker.
+    Read one source's items for a ticker through the parsed-feed cache.
+    
+    Concurrent misses for the same (source, ticker) share one fetch. A failed
+    fetch raises and caches nothing, so a partly downloaded feed is never
+    served for the source's TTL.
+    """
+    cache = _feed_caches[fetcher.SOURCE_NAME]
+    entry = None if force_refresh else cache.get(ticker)
+    if entry is not None:
+        return entry
+
+    async def fetch() -> CachedResponse[List[NewsItem]]:
+        return cache.put(ticker, await fetcher.fetch(ticker, MAX_LOOKBACK_DAYS))
+
+    return await _feed_flights.run((fetcher.SOURCE_NAME, ticker), fetch)
+
+
+async def collect_news_with_age(
+    ticker: str,
+    lookback_days: int,
+    limit: int | None = None,
+) -> CollectedNews:
+    """
+    Collect news articles from multiple sources, reporting feed freshness.
     
     Args:
         ticker: Stock ticker symbol (e.g., 'TSLA', 'AAPL')
@@ -71,27 +208,33 @@ async def collect_news(ticker: str, lookback_days: int, limit: int | None = None
         limit: Maximum number of items to return (defaults to MAX_ITEMS)
         
     Returns:
-        List of NewsItem objects, sorted by publication date (newest first)
+        CollectedNews with a batch of items sorted newest first and the feed
+        fetch time, flagged incomplete if any source failed
     """
-    # Initialize fetchers
-    google_fetcher = GoogleNewsFetcher()
-    yahoo_fetcher = YahooFinanceFetcher()
-    
-    # Fetch from all sources concurrently
-    try:
-        google_items, yahoo_items = await asyncio.gather(
-            google_fetcher.fetch(ticker, lookback_days),
-            yahoo_fetcher.fetch(ticker, lookback_days),
-        )
-    except Exception as e:
-        print(f"Error fetching news for {ticker}: {e}")
-        return []
-
-    # Combine all items
-    all_items = [*google_items, *yahoo_items]
+    # Fetch from all sources concurrently, reading through the feed cache
+    outcomes = await asyncio.gather(
+        *(_fetch_source_cached(fetcher, ticker) for fetcher in _FETCHERS),
+        return_exceptions=True,
+    )
+    entries = []
+    for fetcher, outcome in zip(_FETCHERS, outcomes):
+        if isinstance(outcome, Exception):
+            print(f"Error fetching {fetcher.SOURCE_NAME} news for {ticker}: {outcome}")
+        else:
+            entries.append(outcome)
+    complete = len(entries) == len(_FETCHERS)
+    if not entries:
+        return CollectedNews(NewsBatch.from_items([]), datetime.now(timezone.utc), complete=False)
 
-    # Filter to trusted sources only
-    trusted_items = [item for item in all_items if is_trusted_source(item.source)]
+    # Keep items inside the lookback window from trusted sources only
+    cutoff = lookback_cutoff(lookback_days)
+    trusted_items = [
+        item
+        for entry in entries
+        for item in entry.value
+        if item.published_at >= cutoff and is_trusted_source(item.source)
+    ]
+    fetched_at = datetime.now(timezone.utc) - timedelta(seconds=max(entry.age for entry in entries))
 
     # Sort by publication date (newest first)
     trusted_items.sort(key=lambda item: item.published_at, reverse=True)
@@ -99,6 +242,65 @@ async def collect_news(ticker: str, lookback_days: int, limit: int | None = None
     # Remove duplicates
     unique_items = deduplicate_news_items(trusted_items)
 
-    # Apply limit
+    # Apply limit; the batch references the cached items' fields, and analysis
+    # writes only to its own columns
     max_items = min(limit or MAX_ITEMS, len(unique_items))
-    return unique_items[:max_items]
\ No newline at end of file
+    return CollectedNews(NewsBatch.from_items(unique_items[:max_items]), fetched_at, complete)
+
+
+async def refresh_feeds(
+    ticker: str,
+    lookback_days: int,
+    sources: Iterable[str] | None = None,
+) -> Dict[str, List[NewsItem]]:
+    """
+    Refetch feeds for a ticker, bypassing fresh cached copies.
+    
+    The refreshed items replace the cached ones, so later collects see them.
+    
+    Args:
+        ticker: Stock ticker symbol
+        lookback_days: Number of days to look back
+        sources: Source names to refresh (defaults to all of FEED_SOURCES)
+        
+    Returns:
+        Mapping of source name to its freshly fetched items (empty on failure)
+    """
+    wanted = set(FEED_SOURCES if sources is None else sources)
+    fetchers = [fetcher for fetcher in _FETCHERS if fetcher.SOURCE_NAME in wanted]
+    entries = await asyncio.gather(
+        *(_fetch_source_cached(fetcher, ticker, force_refresh=True) for fetcher in fetchers),
+        return_exceptions=True,
+    )
+    cutoff = lookback_cutoff(lookback_days)
+    return {
+        fetcher.SOURCE_NAME: [] if isinstance(entry, BaseException) else copy_news_items(
+            item for item in entry.value if item.published_at >= cutoff
+        )
+        for fetcher, entry in zip(fetchers, entries)
+    }
+
+
+async def collect_news(ticker: str, lookback_days: int, limit: int | None = None) -> List[NewsItem]:
+    """
+    Collect news articles from multiple sources for a given ticker.
+    
+    Args:
+        ticker: Stock ticker symbol (e.g., 'TSLA', 'AAPL')
+        lookback_days: Number of days to look back
+        limit: Maximum number of items to return (defaults to MAX_ITEMS)
+        
+    Returns:
+        List of NewsItem objects, sorted by publication date (newest first)
+    """
+    return (await collect_news_with_age(ticker, lookback_days, limit)).items
+
+
+def get_feed_cache_stats() -> Dict[str, Dict[str, float]]:
+    """
+    Get parsed-feed cache statistics per source.
+    
+    Returns:
+        Mapping of source name to cache statistics
+    """
+    return {name: cache.get_stats() for name, cache in _feed_caches.items()}
@@ -3,12 +3,18 @@ Common utilities for news source fetchers.
 """
 from __future__ import annotations
 
+import dataclasses
+import functools
 import hashlib
-from datetime import datetime, timezone
-from typing import Optional
+import re
+from datetime import datetime, timedelta, timezone
+from email.utils import parsedate_to_datetime
+from typing import Dict, Iterable, List, Optional
 
 from dateutil import parser as dateparser
 
+from app.models import NewsItem
+
 
 def make_news_id(url: str, title: str, published_at: datetime) -> str:
     """
@@ -26,6 +32,54 @@ def make_news_id(url: str, title: str, published_at: datetime) -> str:
     return hashlib.blake2b(key, digest_size=8).hexdigest()
 
 
+def copy_news_items(items: Iterable[NewsItem]) -> List[NewsItem]:
+    """
+    Copy news items so callers can mutate them without affecting cached originals.
+    
+    Args:
+        items: NewsItem objects to copy
+        
+    Returns:
+        List of independent NewsItem copies
+    """
+    return [dataclasses.replace(item, raw=dict(item.raw)) for item in items]
+
+
+# "Wed, 15 Oct 2025 14:32:00 GMT"; email.utils also accepts looser strings it
+# misreads (it drops "PM"), so only strings of this shape take that path
+_RFC822_PATTERN = re.compile(
+    r"^\s*(?:[A-Za-z]{3},\s*)?\d{1,2}\s+[A-Za-z]{3}\s+\d{2,4}\s+"
+    r"\d{1,2}:\d{2}(?::\d{2})?\s*(?:[+-]\d{4}|[A-Za-z]{1,5})?\s*$"
+)
+
+
+@functools.lru_cache(maxsize=1024)
+def _parse_date_string(date_string: str) -> datetime:
+    """
+    Parse a non-empty date string to UTC, memoizing recent strings.
+    
+    RSS dates are RFC 822, which email.utils parses far faster than dateutil;
+    ISO 8601 (Atom) goes through datetime.fromisoformat. dateutil only sees
+    strings neither of them understands.
+    """
+    parsed_date = None
+    if _RFC822_PATTERN.match(date_string):
+        try:
+            parsed_date = parsedate_to_datetime(date_string)
+        except (TypeError, ValueError, IndexError):
+            parsed_date = None
+    if parsed_date is None:
+        try:
+            parsed_date = datetime.fromisoformat(date_string.strip().replace("Z", "+00:00"))
+        except ValueError:
+            parsed_date = dateparser.parse(date_string)
+
+    if parsed_date.tzinfo:
+        return parsed_date.astimezone(timezone.utc)
+    else:
+        return parsed_date.replace(tzinfo=timezone.utc)
+
+
 def parse_utc_datetime(date_string: Optional[str]) -> datetime:
     """
     Parse a date string and convert to UTC datetime.
@@ -39,11 +93,52 @@ def parse_utc_datetime(date_string: Optional[str]) -> datetime:
     if not date_string:
         return datetime.now(timezone.utc)
     
-    parsed_date = dateparser.parse(date_string)
-    if parsed_date.tzinfo:
-        return parsed_date.astimezone(timezone.utc)
-    else:
-        return parsed_date.replace(tzinfo=timezone.utc)
+    return _parse_date_string(date_string)
+
+
+def lookback_cutoff(lookback_days: int) -> datetime:
+    """
+    Get the oldest publication time within a lookback window.
+    
+    Args:
+        lookback_days: Number of days to look back
+        
+    Returns:
+        UTC datetime; items published before it are out of range
+    """
+    return datetime.now(timezone.utc) - timedelta(days=lookback_days)
+
+
+# Feed entries turned into items versus skipped as older than the cutoff, per
+# source; feeds that stopped early never parse (or download) their remaining entries
+_entry_stats: Dict[str, Dict[str, int]] = {}
+
+
+def record_feed_entries(source: str, parsed: int, skipped: int, stopped_early: bool = False) -> None:
+    """
+    Count the entries of one parsed feed.
+    
+    Args:
+        source: Fetcher source name
+        parsed: Entries turned into NewsItems
+        skipped: Entries skipped as older than the lookback cutoff
+        stopped_early: Whether parsing stopped at the first old entry
+    """
+    stats = _entry_stats.setdefault(source, {"feeds": 0, "parsed": 0, "skipped_old": 0, "stopped_early": 0})
+    stats["feeds"] += 1
+    stats["parsed"] += parsed
+    stats["skipped_old"] += skipped
+    stats["stopped_early"] += int(stopped_early)
+
+
+def get_feed_entry_stats() -> Dict[str, Dict[str, int]]:
+    """
+    Get parsed and skipped entry counters per source.
+    
+    Returns:
+        Mapping of source name to entry counters
+    """
+    return {source: dict(stats) for source, stats in _entry_stats.items()}
 
 
 def clean_text(text: Optional[str]) -> str:
@@ -4,13 +4,14 @@ Google News fetcher with publisher domain mapping.
 from __future__ import annotations
 
 import re
+from datetime import datetime
 from typing import List, Optional
 from urllib.parse import urlencode
 
-import feedparser
-
+from app.config import GOOGLE_NEWS_CACHE_TTL_SECONDS
 from app.models import NewsItem
-from app.sources.common import clean_text, make_news_id, parse_utc_datetime
+from app.sources.common import clean_text, make_news_id
+from app.sources.rss_stream import FeedEntry, fetch_feed_items
 
 
 # Publisher name to domain mapping
@@ -93,74 +94,91 @@ class GoogleNewsFetcher:
     
     BASE_URL = "https://news.google.com/rss/search"
     DEFAULT_DOMAIN = "google.com"
+    SOURCE_NAME = "google_news"
+    CACHE_TTL_SECONDS = GOOGLE_NEWS_CACHE_TTL_SECONDS
+    # Search results are ranked by relevance, not date
+    DATE_ORDERED = False
 
-    async def fetch(self, ticker: str, lookback_days: int) -> List[NewsItem]:
+    def feed_url(self, ticker: str, lookback_days: int) -> str:
         """
-        Fetch news articles for a given ticker.
+        Build the RSS search URL for a ticker.
         
         Args:
-            ticker: Stock ticker symbol (e.g., 'TSLA', 'AAPL')
-            lookback_days: Number of days to look back (not used in RSS)
+            ticker: Stock ticker symbol
+            lookback_days: Number of days to look back
             
         Returns:
-            List of NewsItem objects
+            Feed URL
         """
         params = urlencode({
-            "q": f"{ticker} stock",
+            # when:Nd asks Google to drop older results before they are sent
+            "q": f"{ticker} stock when:{lookback_days}d",
             "hl": "en-US",
             "gl": "US",
             "ceid": "US:en"
         })
-        url = f"{self.BASE_URL}?{params}"
-
-        try:
-            feed = feedparser.parse(url)
-        except Exception as e:
-            # Log error and return empty list
-            print(f"Error fetching Google News feed for {ticker}: {e}")
-            return []
-
-        items: List[NewsItem] = []
-
-        for entry in feed.entries:
-            try:
-                # Extract and clean data from RSS entry
-                title = clean_text(entry.get("title"))
-                link = clean_text(entry.get("link"))
-                summary = clean_text(entry.get("summary"))
-                published_at = parse_utc_datetime(entry.get("published"))
-
-                # Skip if essential data is missing
-                if not title or not link:
-                    continue
-
-                # Extract publisher and map to domain
-                publisher = extract_publisher_from_entry(entry)
-                domain = map_publisher_to_domain(publisher)
-
-                # Generate unique ID
-                news_id = make_news_id(link, title, published_at)
-
-                # Create NewsItem
-                news_item = NewsItem(
-                    id=news_id,
-                    source=domain,
-                    title=title,
-                    url=link,
-                    published_at=published_at,
-                    text=summary,
-                    raw={
-                        "publisher": publisher,
-                        "google_rss": True,
-                        "ticker": ticker
-                    },
-                )
-                
-                items.append(news_item)
-                
-            except Exception as e:
-                # Skip malformed entries
-                print(f"Error processing Google News entry: {e}")
-                continue
-
-        return items
\ No newline at end of file
+        return f"{self.BASE_URL}?{params}"
+
+    def build_item(self, entry: FeedEntry, ticker: str, published_at: datetime) -> Optional[NewsItem]:
+        """
+        Build a NewsItem from an RSS entry.
+        
+        Args:
+            entry: Feed entry
+            ticker: Stock ticker symbol the feed was fetched for
+            published_at: Already parsed publication time
+            
+        Returns:
+            NewsItem, or None if the entry lacks a title or link
+        """
+        # Extract and clean data from RSS entry
+        title = clean_text(entry.get("title"))
+        link = clean_text(entry.get("link"))
+        summary = clean_text(entry.get("summary"))
+
+        # Skip if essential data is missing
+        if not title or not link:
+            return None
+
+        # Extract publisher and map to domain
+        publisher = extract_publisher_from_entry(entry)
+        domain = map_publisher_to_domain(publisher)
+
+        # Generate unique ID
+        news_id = make_news_id(link, title, published_at)
+
+        return NewsItem(
+            id=news_id,
+            source=domain,
+            title=title,
+            url=link,
+            published_at=published_at,
+            text=summary,
+            raw={
+                "publisher": publisher,
+                "google_rss": True,
+                "ticker": ticker
+            },
+        )
+
+    async def fetch(self, ticker: str, lookback_days: int) -> List[NewsItem]:
+        """
+        Fetch news articles for a given ticker.
+        
+        Args:
+            ticker: Stock ticker symbol (e.g., 'TSLA', 'AAPL')
+            lookback_days: Number of days to look back; older entries are skipped
+            
+        Returns:
+            List of NewsItem objects
+            
+        Raises:
+            httpx.HTTPError: If the feed could not be downloaded in full
+        """
+        return await fetch_feed_items(
+            self.SOURCE_NAME,
+            self.feed_url(ticker, lookback_days),
+            lookback_days,
+            self.DATE_ORDERED,
+            lambda entry, published_at: self.build_item(entry, ticker, published_at),
+        )
@@ -0,0 +1,173 @@
+"""
+Shared async HTTP client used by all news source fetchers.
+
+One pooled ``httpx.AsyncClient`` lives for the lifetime of the app so feed
+requests reuse keep-alive connections instead of opening a new one per call.
+Feed URLs are revalidated with conditional GETs, so an unchanged feed costs a
+304 instead of a full download and parse.
+"""
+from __future__ import annotations
+
+import asyncio
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, field
+from typing import AsyncIterator, Dict, List, Optional
+from urllib.parse import urlsplit
+
+import httpx
+
+from app.config import (
+    FEED_VALIDATOR_CACHE_SIZE,
+    HTTP_HEADERS,
+    HTTP_KEEPALIVE_EXPIRY_SECONDS,
+    HTTP_MAX_CONNECTIONS,
+    HTTP_MAX_CONNECTIONS_PER_HOST,
+    HTTP_MAX_KEEPALIVE_CONNECTIONS,
+    HTTP_TIMEOUT_SECONDS,
+)
+from app.core.cache import LRUCache
+from app.models import NewsItem
+from app.sources.common import copy_news_items
+
+# HTTP/2 needs the optional h2 package
+try:
+    import h2  # noqa: F401
+    _has_http2 = True
+except ImportError:
+    _has_http2 = False
+
+
+_client: Optional[httpx.AsyncClient] = None
+_host_semaphores: Dict[str, asyncio.Semaphore] = {}
+
+
+@dataclass
+class CachedFeed:
+    """Validators and parsed items from the last full download of a feed URL."""
+
+    etag: Optional[str]
+    last_modified: Optional[str]
+    items: List[NewsItem] = field(default_factory=list)
+
+
+# Per-URL validators for conditional GET (If-None-Match / If-Modified-Since)
+feed_validators: LRUCache[str, CachedFeed] = LRUCache(FEED_VALIDATOR_CACHE_SIZE)
+_conditional_stats: Dict[str, int] = {"requests": 0, "revalidated": 0, "not_modified": 0}
+
+
+def get_http_client() -> httpx.AsyncClient:
+    """
+    Get the shared HTTP client, creating it on first use.
+
+    Returns:
+        Pooled httpx.AsyncClient instance
+    """
+    global _client
+    if _client is None or _client.is_closed:
+        _client = httpx.AsyncClient(
+            headers=HTTP_HEADERS,
+            timeout=httpx.Timeout(HTTP_TIMEOUT_SECONDS),
+            limits=httpx.Limits(
+                max_connections=HTTP_MAX_CONNECTIONS,
+                max_keepalive_connections=HTTP_MAX_KEEPALIVE_CONNECTIONS,
+                keepalive_expiry=HTTP_KEEPALIVE_EXPIRY_SECONDS,
+            ),
+            http2=_has_http2,
+            follow_redirects=True,
+        )
+    return _client
+
+
+async def close_http_client() -> None:
+    """Close the shared HTTP client and release pooled connections."""
+    global _client
+    if _client is not None:
+        await _client.aclose()
+        _client = None
+    _host_semaphores.clear()
+
+
+def _get_host_semaphore(url: str) -> asyncio.Semaphore:
+    """Get the semaphore capping concurrent requests to the URL's host."""
+    host = urlsplit(url).netloc.lower()
+    semaphore = _host_semaphores.get(host)
+    if semaphore is None:
+        semaphore = asyncio.Semaphore(max(1, HTTP_MAX_CONNECTIONS_PER_HOST))
+        _host_semaphores[host] = semaphore
+    return semaphore
+
+
+def _validator_headers(cached: Optional[CachedFeed]) -> Dict[str, str]:
+    """Build If-None-Match / If-Modified-Since headers from a previous response."""
+    headers: Dict[str, str] = {}
+    if cached is not None:
+        if cached.etag:
+            headers["If-None-Match"] = cached.etag
+        if cached.last_modified:
+            headers["If-Modified-Since"] = cached.last_modified
+    return headers
+
+
+def _is_not_modified(response: httpx.Response, headers: Dict[str, str], cached: Optional[CachedFeed]) -> bool:
+    """Count a conditional response and report whether it was a usable 304."""
+    _conditional_stats["requests"] += 1
+    if headers:
+        _conditional_stats["revalidated"] += 1
+    if response.status_code == 304 and cached is not None:
+        _conditional_stats["not_modified"] += 1
+        return True
+    return False
+
+
+@asynccontextmanager
+async def stream_conditional(url: str, cached: Optional[CachedFeed]) -> AsyncIterator[Optional[httpx.Response]]:
+    """
+    Open a streaming download of a URL, revalidating against a previous response's validators.
+
+    The body is read by iterating the response; leaving the block early
+    closes the connection without downloading the rest.
+
+    Args:
+        url: URL to fetch
+        cached: Previous CachedFeed for the URL, if any
+
+    Yields:
+        The streaming response, or None if the server answered 304 Not Modified
+
+    Raises:
+        httpx.HTTPError: On network failure or non-2xx status
+    """
+    headers = _validator_headers(cached)
+    async with _get_host_semaphore(url):
+        async with get_http_client().stream("GET", url, headers=headers) as response:
+            if _is_not_modified(response, headers, cached):
+                yield None
+                return
+            response.raise_for_status()
+            yield response
+
+
+def remember_feed(url: str, response: httpx.Response, items: List[NewsItem]) -> None:
+    """
+    Store a response's validators and parsed items for later conditional GETs.
+
+    Args:
+        url: Feed URL
+        response: Full (200) response the items were parsed from
+        items: Parsed items; a copy is stored
+    """
+    etag = response.headers.get("ETag")
+    last_modified = response.headers.get("Last-Modified")
+    if not etag and not last_modified:
+        return
+    feed_validators.put(url, CachedFeed(etag, last_modified, copy_news_items(items)))
+
+
+def get_conditional_stats() -> Dict[str, int]:
+    """
+    Get conditional GET counters.
+
+    Returns:
+        Dictionary with request, revalidation and 304 counts
+    """
+    return {**_conditional_stats, "tracked_urls": len(feed_validators)}
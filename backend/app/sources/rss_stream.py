@@ -0,0 +1,212 @@
+"""
+Incremental RSS parsing over a streaming HTTP response.
+
+Items are parsed as each <item> element completes, so a date-ordered feed
+can be closed at its first entry older than the lookback window without
+downloading the rest, and finished elements are dropped from the tree so it
+never holds more than one item. The body is not kept: documents the strict
+XML parser rejects (e.g. HTML entities such as &nbsp;) are downloaded again
+and parsed with feedparser, which holds that one document in memory.
+"""
+from __future__ import annotations
+
+import logging
+from contextlib import aclosing
+from datetime import datetime
+from typing import Any, AsyncIterator, Callable, Dict, List, Optional
+from xml.etree.ElementTree import Element, ParseError, XMLPullParser
+
+import feedparser
+import httpx
+
+from app.config import FEED_STREAMING
+from app.models import NewsItem
+from app.sources.common import (
+    copy_news_items,
+    lookback_cutoff,
+    parse_utc_datetime,
+    record_feed_entries,
+)
+from app.sources.http_client import feed_validators, get_http_client, remember_feed, stream_conditional
+
+logger = logging.getLogger(__name__)
+
+# Entry dicts use feedparser's key names so fetchers handle both parsers alike
+FeedEntry = Dict[str, Any]
+
+# RSS element name -> feedparser entry key
+_ENTRY_FIELDS = {
+    "title": "title",
+    "link": "link",
+    "description": "summary",
+    "pubDate": "published",
+    "guid": "id",
+}
+
+
+def _entry_from_element(element: Element) -> FeedEntry:
+    """Convert a completed <item> element to a feedparser-style entry dict."""
+    entry: FeedEntry = {}
+    for child in element:
+        key = _ENTRY_FIELDS.get(child.tag)
+        if key is not None:
+            entry[key] = child.text or ""
+        elif child.tag == "source":
+            entry["source"] = {"title": child.text or "", "href": child.get("url")}
+    return entry
+
+
+class RssItemParser:
+    """Push parser that turns fed RSS bytes into entries as each <item> closes."""
+
+    def __init__(self):
+        self._parser = XMLPullParser(events=("start", "end"))
+        self._stack: List[Element] = []
+
+    def feed(self, data: bytes) -> List[FeedEntry]:
+        """
+        Parse the next chunk of the document.
+
+        Args:
+            data: Raw bytes, split anywhere
+
+        Returns:
+            Entries for the <item> elements completed by this chunk
+
+        Raises:
+            xml.etree.ElementTree.ParseError: If the document is malformed
+        """
+        self._parser.feed(data)
+        return self._read_entries()
+
+    def close(self) -> List[FeedEntry]:
+        """Finish the document and return any entries completed at its end."""
+        self._parser.close()
+        return self._read_entries()
+
+    def _read_entries(self) -> List[FeedEntry]:
+        entries: List[FeedEntry] = []
+        for event, element in self._parser.read_events():
+            if event == "start":
+                self._stack.append(element)
+                continue
+            self._stack.pop()
+            if element.tag == "item":
+                entries.append(_entry_from_element(element))
+                # Drop the finished item so the tree never holds more than one
+                if self._stack:
+                    self._stack[-1].remove(element)
+        return entries
+
+
+async def iter_feed_entries(response: httpx.Response) -> AsyncIterator[FeedEntry]:
+    """
+    Yield the entries of an RSS response.
+
+    With FEED_STREAMING the body is parsed incrementally as it arrives and
+    only the current item is held in memory; otherwise it is read in full and
+    parsed with feedparser. If the strict incremental parser fails, the
+    stream is closed and the feed is downloaded again in full for feedparser,
+    resuming after the entries already yielded.
+
+    Args:
+        response: Open streaming response
+
+    Yields:
+        Feed entries in document order
+
+    Raises:
+        httpx.HTTPError: If the fallback download fails
+    """
+    if not FEED_STREAMING:
+        for entry in feedparser.parse(await response.aread()).entries:
+            yield entry
+        return
+
+    parser = RssItemParser()
+    yielded = 0
+    try:
+        async for chunk in response.aiter_bytes():
+            for entry in parser.feed(chunk):
+                yielded += 1
+                yield entry
+        remaining = parser.close()
+    except ParseError:
+        # Release the streaming connection first; the refetch then reuses
+        # the caller's per-host slot
+        await response.aclose()
+        refetched = await get_http_client().get(response.url)
+        refetched.raise_for_status()
+        remaining = feedparser.parse(refetched.content).entries[yielded:]
+    for entry in remaining:
+        yield entry
+
+
+async def fetch_feed_items(
+    source_name: str,
+    url: str,
+    lookback_days: int,
+    date_ordered: bool,
+    build_item: Callable[[FeedEntry, datetime], Optional[NewsItem]],
+) -> List[NewsItem]:
+    """
+    Download a feed and build NewsItems from its entries as they are parsed.
+
+    Entries older than the lookback cutoff are skipped before any other work;
+    on a date-ordered feed the first one closes the download.
+
+    Args:
+        source_name: Fetcher source name, for logs and entry counters
+        url: Feed URL
+        lookback_days: Number of days to look back
+        date_ordered: Whether the feed lists entries newest first
+        build_item: Builds a NewsItem from an entry and its parsed date, or
+            returns None to skip the entry
+
+    Returns:
+        NewsItem objects in feed order
+
+    Raises:
+        httpx.HTTPError: On network failure or non-2xx status, even after some
+            entries were parsed, so a partial feed is never cached as complete
+    """
+    cached = feed_validators.get(url)
+    cutoff = lookback_cutoff(lookback_days)
+    items: List[NewsItem] = []
+    skipped = 0
+    stopped_early = False
+
+    async with stream_conditional(url, cached) as response:
+        if response is None:
+            # 304 Not Modified: reuse the items parsed from the last download
+            return copy_news_items(cached.items)
+
+        async with aclosing(iter_feed_entries(response)) as entries:
+            async for entry in entries:
+                try:
+                    # Check the date first so old entries cost no further work
+                    published_at = parse_utc_datetime(entry.get("published"))
+                    if published_at < cutoff:
+                        skipped += 1
+                        if date_ordered:
+                            # Everything after this entry is older still
+                            stopped_early = True
+                            break
+                        continue
+
+                    item = build_item(entry, published_at)
+                except Exception as e:
+                    # Skip malformed entries
+                    logger.warning("Error processing %s entry: %s", source_name, e, exc_info=True)
+                    continue
+
+                if item is not None:
+                    items.append(item)
+
+        remember_feed(url, response, items)
+
+    record_feed_entries(source_name, len(items), skipped, stopped_early)
+    return items
+
+
+__all__ = ["FeedEntry", "RssItemParser", "fetch_feed_items", "iter_feed_entries"]
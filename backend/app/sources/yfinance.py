@@ -3,13 +3,14 @@ Yahoo Finance news fetcher.
 """
 from __future__ import annotations
 
-from typing import List
+from datetime import datetime
+from typing import List, Optional
 from urllib.parse import urlencode
 
-import feedparser
-
+from app.config import YAHOO_FINANCE_CACHE_TTL_SECONDS
 from app.models import NewsItem
-from app.sources.common import clean_text, make_news_id, parse_utc_datetime
+from app.sources.common import clean_text, make_news_id
+from app.sources.rss_stream import FeedEntry, fetch_feed_items
 
 
 class YahooFinanceFetcher:
@@ -17,65 +18,83 @@ class YahooFinanceFetcher:
     
     BASE_URL = "https://feeds.finance.yahoo.com/rss/2.0/headline"
     SOURCE_DOMAIN = "finance.yahoo.com"
+    SOURCE_NAME = "yahoo_finance"
+    CACHE_TTL_SECONDS = YAHOO_FINANCE_CACHE_TTL_SECONDS
+    # Headlines are listed newest first
+    DATE_ORDERED = True
 
-    async def fetch(self, ticker: str, lookback_days: int) -> List[NewsItem]:
+    def feed_url(self, ticker: str) -> str:
         """
-        Fetch news articles for a given ticker.
+        Build the RSS headline URL for a ticker.
         
         Args:
-            ticker: Stock ticker symbol (e.g., 'TSLA', 'AAPL')
-            lookback_days: Number of days to look back (not used in RSS)
+            ticker: Stock ticker symbol
             
         Returns:
-            List of NewsItem objects
+            Feed URL
         """
         params = urlencode({
             "s": ticker,
             "region": "US", 
             "lang": "en-US"
         })
-        url = f"{self.BASE_URL}?{params}"
-
-        try:
-            feed = feedparser.parse(url)
-        except Exception as e:
-            # Log error and return empty list
-            print(f"Error fetching Yahoo Finance feed for {ticker}: {e}")
-            return []
-
-        items: List[NewsItem] = []
+        return f"{self.BASE_URL}?{params}"
 
-        for entry in feed.entries:
-            try:
-                # Extract and clean data from RSS entry
-                title = clean_text(entry.get("title"))
-                link = clean_text(entry.get("link"))
-                summary = clean_text(entry.get("summary"))
-                published_at = parse_utc_datetime(entry.get("published"))
+    def build_item(self, entry: FeedEntry, ticker: str, published_at: datetime) -> Optional[NewsItem]:
+        """
+        Build a NewsItem from an RSS entry.
+        
+        Args:
+            entry: Feed entry
+            ticker: Stock ticker symbol the feed was fetched for
+            published_at: Already parsed publication time
+            
+        Returns:
+            NewsItem, or None if the entry lacks a title or link
+        """
+        # Extract and clean data from RSS entry
+        title = clean_text(entry.get("title"))
+        link = clean_text(entry.get("link"))
+        summary = clean_text(entry.get("summary"))
 
-                # Skip if essential data is missing
-                if not title or not link:
-                    continue
+        # Skip if essential data is missing
+        if not title or not link:
+            return None
 
-                # Generate unique ID
-                news_id = make_news_id(link, title, published_at)
+        # Generate unique ID
+        news_id = make_news_id(link, title, published_at)
 
-                # Create NewsItem
-                news_item = NewsItem(
-                    id=news_id,
-                    source=self.SOURCE_DOMAIN,
-                    title=title,
-                    url=link,
-                    published_at=published_at,
-                    text=summary,
-                    raw={"yahoo_rss": True, "ticker": ticker},
-                )
-                
-                items.append(news_item)
-                
-            except Exception as e:
-                # Skip malformed entries
-                print(f"Error processing Yahoo Finance entry: {e}")
-                continue
+        return NewsItem(
+            id=news_id,
+            source=self.SOURCE_DOMAIN,
+            title=title,
+            url=link,
+            published_at=published_at,
+            text=summary,
+            raw={"yahoo_rss": True, "ticker": ticker},
+        )
 
-        return items
\ No newline at end of file
+    async def fetch(self, ticker: str, lookback_days: int) -> List[NewsItem]:
+        """
+        Fetch news articles for a given ticker.
+        
+        Parsing stops at the first entry older than the lookback window,
+        without downloading the rest of the feed.
+        
+        Args:
+            ticker: Stock ticker symbol (e.g., 'TSLA', 'AAPL')
+            lookback_days: Number of days to look back; older entries are skipped
+            
+        Returns:
+            List of NewsItem objects
+            
+        Raises:
+            httpx.HTTPError: If the feed could not be downloaded in full
+        """
+        return await fetch_feed_items(
+            self.SOURCE_NAME,
+            self.feed_url(ticker),
+            lookback_days,
+            self.DATE_ORDERED,
+            lambda entry, published_at: self.build_item(entry, ticker, published_at),
+        )
@@ -0,0 +1,99 @@
+"""
+Parity check and latency benchmark for the torch and ONNX sentiment backends.
+
+Requires an exported ONNX model (python -m scripts.export_onnx).
+
+Usage (from the backend directory):
+    python -m scripts.benchmark_backends [--repeats 20] [--tolerance 1e-3]
+
+Exits non-zero if ONNX probabilities differ from torch by more than the tolerance.
+"""
+from __future__ import annotations
+
+import argparse
+import statistics
+import sys
+import time
+from typing import Dict, List
+
+from app.core.sentiment import _PROBABILITY_BACKENDS
+from scripts.headlines import SAMPLE_HEADLINES
+
+BATCH_SIZES = (1, 8, 16, 32)
+
+
+def check_parity(texts: List[str], tolerance: float) -> bool:
+    """
+    Compare torch and ONNX probabilities on the same texts.
+
+    Args:
+        texts: Texts to score with both backends
+        tolerance: Maximum allowed absolute probability difference
+
+    Returns:
+        True if every probability is within tolerance and all labels agree
+    """
+    torch_probs = _PROBABILITY_BACKENDS["torch"](texts)
+    onnx_probs = _PROBABILITY_BACKENDS["onnx"](texts)
+
+    max_diff = float(abs(torch_probs - onnx_probs).max())
+    label_agreement = float((torch_probs.argmax(axis=-1) == onnx_probs.argmax(axis=-1)).mean())
+
+    print(f"Parity over {len(texts)} texts: max |Δp| = {max_diff:.2e}, label agreement = {label_agreement:.1%}")
+    return max_diff <= tolerance and label_agreement == 1.0
+
+
+def benchmark_backend(backend: str, repeats: int) -> Dict[int, List[float]]:
+    """
+    Measure forward-pass latency for one backend at several batch sizes.
+
+    Args:
+        backend: Backend name, "torch" or "onnx"
+        repeats: Timed runs per batch size
+
+    Returns:
+        Mapping of batch size to per-run latencies in milliseconds
+    """
+    predict = _PROBABILITY_BACKENDS[backend]
+    predict(SAMPLE_HEADLINES[:1])  # load model and prime kernels
+
+    timings: Dict[int, List[float]] = {}
+    for batch_size in BATCH_SIZES:
+        batch = (SAMPLE_HEADLINES * (batch_size // len(SAMPLE_HEADLINES) + 1))[:batch_size]
+        runs = []
+        for _ in range(repeats):
+            start = time.perf_counter()
+            predict(batch)
+            runs.append((time.perf_counter() - start) * 1000.0)
+        timings[batch_size] = runs
+    return timings
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Compare torch and ONNX sentiment backends")
+    parser.add_argument("--repeats", type=int, default=20, help="Timed runs per batch size")
+    parser.add_argument("--tolerance", type=float, default=1e-3, help="Max allowed probability difference")
+    args = parser.parse_args()
+
+    parity_ok = check_parity(SAMPLE_HEADLINES, args.tolerance)
+
+    results = {backend: benchmark_backend(backend, args.repeats) for backend in ("torch", "onnx")}
+
+    print(f"\n{'batch':>5} {'backend':>8} {'mean ms':>9} {'p50 ms':>8} {'p95 ms':>8} {'ms/text':>8}")
+    for batch_size in BATCH_SIZES:
+        for backend, timings in results.items():
+            runs = sorted(timings[batch_size])
+            mean = statistics.fmean(runs)
+            p95 = runs[min(len(runs) - 1, int(0.95 * len(runs)))]
+            print(
+                f"{batch_size:>5} {backend:>8} {mean:>9.2f} {statistics.median(runs):>8.2f} "
+                f"{p95:>8.2f} {mean / batch_size:>8.2f}"
+            )
+
+    if not parity_ok:
+        print("\nParity check FAILED", file=sys.stderr)
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,115 @@
+"""
+Microbenchmark of feed date parsing: dateutil versus parse_utc_datetime.
+
+The corpus mirrors the `published` strings seen in the Google News and Yahoo
+Finance feeds, plus the ISO 8601 and free-form strings that take the slower
+fallbacks. --feed adds the dates of a live feed to the corpus.
+
+Usage (from the backend directory):
+    python -m scripts.benchmark_dates [--repeats 20] [--feed URL ...]
+
+Agreement with dateutil is asserted in tests/test_dates.py.
+"""
+from __future__ import annotations
+
+import argparse
+import time
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime
+from typing import Callable, List
+
+from dateutil import parser as dateparser
+
+from app.sources.common import _parse_date_string, parse_utc_datetime
+
+# Shapes of the `published` values in the feeds the app reads
+SAMPLE_DATES: List[str] = [
+    "Wed, 15 Oct 2025 14:32:00 GMT",        # Google News
+    "Wed, 15 Oct 2025 14:32:07 +0000",      # Yahoo Finance
+    "Tue, 14 Oct 2025 21:05:00 -0400",
+    "Mon, 13 Oct 2025 09:00:00 EDT",
+    "Fri, 10 Oct 2025 16:45:12 Z",
+    "2025-10-15T14:32:00Z",                 # Atom / ISO 8601
+    "2025-10-15T14:32:00.123+02:00",
+    "October 15, 2025 2:32 PM",             # free-form, dateutil fallback
+]
+
+def build_corpus(size: int) -> List[str]:
+    """
+    Build a corpus of realistic RFC 822 feed dates with recurring values.
+
+    Feeds repeat most of their entries between polls, so about half the
+    strings recur, as they do in production.
+    """
+    now = datetime.now(timezone.utc).replace(microsecond=0)
+    corpus = list(SAMPLE_DATES)
+    for i in range(size - len(corpus)):
+        stamp = now - timedelta(minutes=37 * (i % (size // 2 or 1)))
+        if i % 2:
+            corpus.append(format_datetime(stamp, usegmt=True))
+        else:
+            corpus.append(format_datetime(stamp))
+    return corpus
+
+
+def load_feed_dates(urls: List[str]) -> List[str]:
+    """Get the published strings of live feeds."""
+    import feedparser
+
+    dates: List[str] = []
+    for url in urls:
+        feed = feedparser.parse(url)
+        dates.extend(entry.get("published") for entry in feed.entries if entry.get("published"))
+        print(f"Loaded {len(feed.entries)} entries from {url}")
+    return dates
+
+
+def dateutil_utc(date_string: str) -> datetime:
+    """The previous implementation of parse_utc_datetime."""
+    parsed_date = dateparser.parse(date_string)
+    if parsed_date.tzinfo:
+        return parsed_date.astimezone(timezone.utc)
+    return parsed_date.replace(tzinfo=timezone.utc)
+
+
+def time_parser(parse: Callable[[str], datetime], corpus: List[str], repeats: int) -> float:
+    """
+    Time a parser over the corpus.
+
+    Returns:
+        Mean microseconds per parsed string
+    """
+    start = time.perf_counter()
+    for _ in range(repeats):
+        for date_string in corpus:
+            parse(date_string)
+    return (time.perf_counter() - start) / (repeats * len(corpus)) * 1e6
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark feed date parsing")
+    parser.add_argument("--repeats", type=int, default=20, help="Passes over the corpus")
+    parser.add_argument("--size", type=int, default=2000, help="Corpus size")
+    parser.add_argument("--feed", nargs="*", default=[], help="Feed URLs whose dates join the corpus")
+    args = parser.parse_args()
+
+    corpus = build_corpus(args.size) + load_feed_dates(args.feed)
+    print(f"Corpus: {len(corpus)} date strings, {len(set(corpus))} distinct")
+
+    uncached = _parse_date_string.__wrapped__
+    results = {
+        "dateutil": time_parser(dateutil_utc, corpus, args.repeats),
+        "fast (no memo)": time_parser(uncached, corpus, args.repeats),
+    }
+    _parse_date_string.cache_clear()
+    results["fast (memo)"] = time_parser(parse_utc_datetime, corpus, args.repeats)
+
+    baseline = results["dateutil"]
+    print(f"\n{'parser':<16} {'us/date':>9} {'speedup':>8}")
+    for name, micros in results.items():
+        print(f"{name:<16} {micros:>9.2f} {baseline / micros:>7.1f}x")
+    print(f"\nMemo: {_parse_date_string.cache_info()}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,95 @@
+"""
+Benchmark of item weighting: per-item functions versus the columnar engine.
+
+Builds synthetic analyzed items (news domains plus Reddit posts with
+engagement counts) and times the per-item recency/source/engagement loop
+against app.core.weighting.apply_batch_weights over a NewsBatch.
+
+Usage (from the backend directory):
+    python -m scripts.benchmark_weighting [--sizes 10000 100000] [--repeats 5]
+
+Agreement of the two paths is asserted in tests/test_weighting.py.
+"""
+from __future__ import annotations
+
+import argparse
+import random
+import time
+from datetime import datetime, timedelta, timezone
+from typing import Callable, List, Sequence
+
+from app.core.sentiment import (
+    calculate_engagement_weight,
+    calculate_recency_weight,
+    calculate_source_weight,
+    combine_weights,
+)
+from app.core.batch import NewsBatch
+from app.core.weighting import apply_batch_weights
+from app.models import NewsItem
+
+DOMAINS = ("reuters.com", "bloomberg.com", "finance.yahoo.com", "cnbc.com", "example-blog.net", "reddit.com")
+
+def build_items(size: int, seed: int = 7) -> List[NewsItem]:
+    """Build analyzed items published over the last two weeks, at whole seconds as batches store them."""
+    rng = random.Random(seed)
+    now = datetime.now(timezone.utc).replace(microsecond=0)
+    items = []
+    for i in range(size):
+        source = rng.choice(DOMAINS)
+        raw = {"ups": rng.randint(0, 50000), "num_comments": rng.randint(0, 3000)} if source == "reddit.com" else {}
+        items.append(NewsItem(
+            id=f"{i:016x}",
+            source=source,
+            title=f"Headline {i}",
+            url=f"https://{source}/story/{i}",
+            published_at=now - timedelta(seconds=rng.randint(0, 14 * 24 * 3600)),
+            text="",
+            raw=raw,
+            label="neutral",
+            score=rng.uniform(-1.0, 1.0),
+        ))
+    return items
+
+
+def weight_per_item(items: Sequence[NewsItem]) -> None:
+    """The previous per-item weighting loop."""
+    for item in items:
+        item.recency_w = calculate_recency_weight(item.published_at)
+        item.source_w = calculate_source_weight(item.source)
+        item.engage_w = calculate_engagement_weight(item)
+        item.weight = combine_weights(item.recency_w, item.source_w, item.engage_w)
+        item.weighted_score = item.weight * item.score
+
+
+def time_weighting(weigh: Callable[[], object], repeats: int) -> float:
+    """
+    Time a weighting run.
+
+    Returns:
+        Best wall time in milliseconds
+    """
+    best = float("inf")
+    for _ in range(repeats):
+        start = time.perf_counter()
+        weigh()
+        best = min(best, time.perf_counter() - start)
+    return best * 1000.0
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark item weighting")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10_000, 100_000], help="Item counts")
+    parser.add_argument("--repeats", type=int, default=5, help="Timed runs per size (best is reported)")
+    args = parser.parse_args()
+
+    print(f"{'items':>8} {'per-item ms':>12} {'columnar ms':>12} {'speedup':>8}")
+    for size in args.sizes:
+        items = build_items(size)
+        batch = NewsBatch.from_items(items)
+        loop_ms = time_weighting(lambda: weight_per_item(items), args.repeats)
+        columnar_ms = time_weighting(lambda: apply_batch_weights(batch), args.repeats)
+        print(f"{size:>8} {loop_ms:>12.1f} {columnar_ms:>12.1f} {loop_ms / columnar_ms:>7.1f}x")
+
+if __name__ == "__main__":
+    main()
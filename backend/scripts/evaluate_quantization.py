@@ -0,0 +1,112 @@
+"""
+Accuracy-drift report and throughput benchmark for int8 dynamic quantization.
+
+Compares the fp32 torch model against its int8 dynamically quantized version
+on the fixed labelled headline set.
+
+Usage (from the backend directory):
+    python -m scripts.evaluate_quantization [--repeats 10] [--save models/finbert-int8.pt]
+
+--save writes the quantized model's state_dict so SENTIMENT_QUANTIZED_PATH can
+load it (tensors only, with weights_only=True) without re-quantizing the fp32
+weights at startup.
+"""
+from __future__ import annotations
+
+import argparse
+import io
+import os
+import time
+from typing import Dict
+
+import numpy as np
+
+from app.core.sentiment import _load_sentiment_model, _to_sentiment_result, _torch_probabilities
+from scripts.headlines import LABELLED_HEADLINES, SAMPLE_HEADLINES
+
+BATCH_SIZES = (1, 16, 32)
+
+
+def model_size_mb(quantized: bool) -> float:
+    """Serialized state_dict size of the fp32 or int8 model in megabytes."""
+    import torch
+
+    _, model = _load_sentiment_model(quantized)
+    buffer = io.BytesIO()
+    torch.save(model.state_dict(), buffer)
+    return buffer.getbuffer().nbytes / 1e6
+
+
+def measure_throughput(quantized: bool, repeats: int) -> Dict[int, float]:
+    """
+    Measure texts per second at several batch sizes.
+
+    Args:
+        quantized: Benchmark the int8 model instead of fp32
+        repeats: Timed runs per batch size
+
+    Returns:
+        Mapping of batch size to texts per second
+    """
+    _torch_probabilities(SAMPLE_HEADLINES[:1], quantized)  # prime kernels
+
+    throughput: Dict[int, float] = {}
+    for batch_size in BATCH_SIZES:
+        batch = (SAMPLE_HEADLINES * (batch_size // len(SAMPLE_HEADLINES) + 1))[:batch_size]
+        start = time.perf_counter()
+        for _ in range(repeats):
+            _torch_probabilities(batch, quantized)
+        throughput[batch_size] = batch_size * repeats / (time.perf_counter() - start)
+    return throughput
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Evaluate int8 dynamic quantization of FinBERT")
+    parser.add_argument("--repeats", type=int, default=10, help="Timed runs per batch size")
+    parser.add_argument("--save", default="", help="Write the quantized state_dict to this path")
+    args = parser.parse_args()
+
+    expected = [label for _, label in LABELLED_HEADLINES]
+    fp32_probs = _torch_probabilities(SAMPLE_HEADLINES, quantized=False)
+    int8_probs = _torch_probabilities(SAMPLE_HEADLINES, quantized=True)
+
+    fp32_results = [_to_sentiment_result(prob) for prob in fp32_probs]
+    int8_results = [_to_sentiment_result(prob) for prob in int8_probs]
+
+    fp32_accuracy = np.mean([r[0] == label for r, label in zip(fp32_results, expected)])
+    int8_accuracy = np.mean([r[0] == label for r, label in zip(int8_results, expected)])
+    agreement = np.mean([a[0] == b[0] for a, b in zip(fp32_results, int8_results)])
+    score_drift = np.abs(np.array([r[4] for r in fp32_results]) - np.array([r[4] for r in int8_results]))
+    prob_drift = np.abs(fp32_probs - int8_probs)
+
+    print(f"Accuracy drift over {len(expected)} labelled headlines")
+    print(f"  fp32 accuracy:           {fp32_accuracy:.1%}")
+    print(f"  int8 accuracy:           {int8_accuracy:.1%}")
+    print(f"  fp32/int8 label match:   {agreement:.1%}")
+    print(f"  |Δscore| mean / max:     {score_drift.mean():.4f} / {score_drift.max():.4f}")
+    print(f"  |Δp| mean / max:         {prob_drift.mean():.4f} / {prob_drift.max():.4f}")
+
+    for i, (a, b) in enumerate(zip(fp32_results, int8_results)):
+        if a[0] != b[0]:
+            print(f"  label flip: {a[0]} -> {b[0]}: {SAMPLE_HEADLINES[i]}")
+
+    print(f"\nModel size: fp32 {model_size_mb(False):.1f} MB, int8 {model_size_mb(True):.1f} MB")
+
+    fp32_throughput = measure_throughput(False, args.repeats)
+    int8_throughput = measure_throughput(True, args.repeats)
+    print(f"\n{'batch':>5} {'fp32 texts/s':>13} {'int8 texts/s':>13} {'speedup':>8}")
+    for batch_size in BATCH_SIZES:
+        fp32_rate, int8_rate = fp32_throughput[batch_size], int8_throughput[batch_size]
+        print(f"{batch_size:>5} {fp32_rate:>13.1f} {int8_rate:>13.1f} {int8_rate / fp32_rate:>7.2f}x")
+
+    if args.save:
+        import torch
+
+        _, model = _load_sentiment_model(True)
+        os.makedirs(os.path.dirname(args.save) or ".", exist_ok=True)
+        torch.save(model.state_dict(), args.save)
+        print(f"\nSaved quantized model to {args.save}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,71 @@
+"""
+Offline export of the FinBERT model to ONNX for the onnxruntime backend.
+
+Usage (from the backend directory):
+    python -m scripts.export_onnx [--output models/finbert-onnx] [--opset 17]
+"""
+from __future__ import annotations
+
+import argparse
+import os
+
+from app.config import SENTIMENT_ONNX_DIR
+from app.core.sentiment import MAX_SEQUENCE_LENGTH, ONNX_INPUT_NAMES, _load_sentiment_model
+
+
+def export_onnx(output_dir: str, opset: int = 17) -> str:
+    """
+    Export the PyTorch FinBERT model and its tokenizer.
+
+    Args:
+        output_dir: Directory to write model.onnx and tokenizer files into
+        opset: ONNX opset version
+
+    Returns:
+        Path of the exported model.onnx
+    """
+    import torch
+
+    tokenizer, model = _load_sentiment_model(quantized=False)
+    sample = tokenizer(
+        ["Tesla shares rise after record quarterly deliveries"],
+        padding=True,
+        truncation=True,
+        max_length=MAX_SEQUENCE_LENGTH,
+        return_tensors="pt",
+    )
+    input_names = [name for name in ONNX_INPUT_NAMES if name in sample]
+
+    # Batch and sequence dimensions stay dynamic so any batch shape can run
+    dynamic_axes = {name: {0: "batch", 1: "sequence"} for name in input_names}
+    dynamic_axes["logits"] = {0: "batch"}
+
+    os.makedirs(output_dir, exist_ok=True)
+    model_path = os.path.join(output_dir, "model.onnx")
+    with torch.no_grad():
+        torch.onnx.export(
+            model,
+            tuple(sample[name] for name in input_names),
+            model_path,
+            input_names=input_names,
+            output_names=["logits"],
+            dynamic_axes=dynamic_axes,
+            opset_version=opset,
+        )
+    tokenizer.save_pretrained(output_dir)
+
+    return model_path
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Export FinBERT to ONNX")
+    parser.add_argument("--output", default=SENTIMENT_ONNX_DIR, help="Output directory")
+    parser.add_argument("--opset", type=int, default=17, help="ONNX opset version")
+    args = parser.parse_args()
+
+    model_path = export_onnx(args.output, args.opset)
+    print(f"Exported ONNX model to {model_path}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,47 @@
+"""
+Fixed, hand-labelled financial headline corpus used by the offline model scripts.
+"""
+from __future__ import annotations
+
+from typing import List, Tuple
+
+# (headline, expected label) pairs; labels are hand-assigned for drift reports
+LABELLED_HEADLINES: List[Tuple[str, str]] = [
+    ("Tesla shares rise after record quarterly deliveries beat estimates", "positive"),
+    ("Apple cuts iPhone production forecast amid weak demand in China", "negative"),
+    ("Microsoft to hold annual shareholder meeting on December 5", "neutral"),
+    ("Nvidia posts blowout earnings as data center revenue triples", "positive"),
+    ("Boeing shares slump after FAA grounds 737 MAX 9 jets", "negative"),
+    ("Amazon announces new distribution center in Ohio", "neutral"),
+    ("Meta beats revenue expectations and raises full-year guidance", "positive"),
+    ("Intel warns of lower margins as foundry losses widen", "negative"),
+    ("Alphabet declares first-ever quarterly dividend and $70 billion buyback", "positive"),
+    ("Ford recalls 1.9 million vehicles over faulty rearview cameras", "negative"),
+    ("JPMorgan reports quarterly results in line with analyst estimates", "neutral"),
+    ("Netflix subscriber growth slows, stock tumbles in after-hours trading", "negative"),
+    ("Pfizer lowers 2024 outlook on declining COVID product sales", "negative"),
+    ("Walmart raises annual forecast as shoppers seek bargains", "positive"),
+    ("AMD unveils new data center chips at annual developer conference", "neutral"),
+    ("Disney names new chief financial officer effective next month", "neutral"),
+    ("Exxon Mobil profit falls 25% on lower natural gas prices", "negative"),
+    ("Coinbase shares jump as bitcoin ETF approval boosts trading volumes", "positive"),
+    ("Starbucks same-store sales miss estimates as traffic declines", "negative"),
+    ("Goldman Sachs upgrades Caterpillar to buy, citing infrastructure demand", "positive"),
+    ("Zoom Video to cut about 15% of its workforce", "negative"),
+    ("Visa and Mastercard agree to $30 billion settlement with merchants", "neutral"),
+    ("Salesforce shares little changed after investor day presentation", "neutral"),
+    ("Rivian misses delivery targets and slashes production outlook", "negative"),
+    ("Costco reports steady membership renewal rates in latest quarter", "neutral"),
+    ("Oracle stock soars on surging cloud infrastructure backlog", "positive"),
+    ("PayPal faces SEC subpoena over stablecoin, shares slip", "negative"),
+    ("Berkshire Hathaway files quarterly 13F holdings report", "neutral"),
+    ("Uber posts first full-year operating profit since IPO", "positive"),
+    ("Nike lowers sales forecast and announces $2 billion cost-cutting plan", "negative"),
+    ("Shopify to move listing of shares to Nasdaq", "neutral"),
+    ("Moderna stock falls after vaccine trial fails to meet primary endpoint", "negative"),
+]
+
+SAMPLE_HEADLINES: List[str] = [text for text, _ in LABELLED_HEADLINES]
+
+
+__all__ = ["LABELLED_HEADLINES", "SAMPLE_HEADLINES"]
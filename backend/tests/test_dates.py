@@ -0,0 +1,39 @@
+"""
+Agreement of the fast feed date parser with dateutil.
+
+Timing stays in scripts/benchmark_dates.py.
+"""
+from __future__ import annotations
+
+from datetime import datetime, timezone
+
+import pytest
+
+from app.sources.common import _parse_date_string, parse_utc_datetime
+from scripts.benchmark_dates import SAMPLE_DATES, build_corpus, dateutil_utc
+
+# dateutil ignores named US zones (treating them as UTC); email.utils applies them
+KNOWN_DIFFERENCES = {"Mon, 13 Oct 2025 09:00:00 EDT": datetime(2025, 10, 13, 13, 0, tzinfo=timezone.utc)}
+
+
+@pytest.mark.parametrize("date_string", [date for date in SAMPLE_DATES if date not in KNOWN_DIFFERENCES])
+def test_sample_dates_match_dateutil(date_string):
+    assert parse_utc_datetime(date_string) == dateutil_utc(date_string)
+
+
+@pytest.mark.parametrize("date_string, expected", KNOWN_DIFFERENCES.items())
+def test_named_zones_are_applied(date_string, expected):
+    assert parse_utc_datetime(date_string) == expected
+
+
+def test_feed_corpus_matches_dateutil():
+    corpus = [date for date in build_corpus(500) if date not in KNOWN_DIFFERENCES]
+    mismatches = [date for date in corpus if parse_utc_datetime(date) != dateutil_utc(date)]
+    assert not mismatches
+
+
+def test_memo_returns_the_uncached_result():
+    _parse_date_string.cache_clear()
+    for date_string in SAMPLE_DATES:
+        assert parse_utc_datetime(date_string) == _parse_date_string.__wrapped__(date_string)
+        assert parse_utc_datetime(date_string) == _parse_date_string.__wrapped__(date_string)
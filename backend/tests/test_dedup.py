@@ -0,0 +1,49 @@
+"""
+Near-duplicate headline decisions at the configured threshold.
+
+Each pair is a syndicated rewrite of one story, which must be merged, or two
+different stories, which must not be. Opposite-direction headlines share
+almost every word and are the case a bag-of-words similarity gets wrong.
+"""
+from __future__ import annotations
+
+from typing import List, Tuple
+
+import pytest
+
+from app.config import DEDUP_SIMILARITY_THRESHOLD
+from app.core.dedup import is_near_duplicate, text_tokens
+
+# (title, title, same story?)
+PAIRS: List[Tuple[str, str, bool]] = [
+    # Opposite directions: different stories
+    (
+        "Nvidia stock jumps 10% on strong AI chip demand from data centers",
+        "Nvidia stock falls 10% on strong AI chip demand from data centers",
+        False,
+    ),
+    ("Apple stock rises ahead of iPhone launch event", "Apple stock falls ahead of iPhone launch event", False),
+    ("Tesla shares climb after delivery report", "Tesla shares slide after delivery report", False),
+    ("Oil prices move higher as OPEC cuts output", "Oil prices move lower as OPEC cuts output", False),
+    # Same story from different sources
+    ("Tesla shares jump after record quarterly deliveries", "Tesla stock soars after record quarterly deliveries", True),
+    ("Amazon shares slide as cloud growth slows", "Amazon stock slides as cloud growth slows", True),
+    (
+        "Microsoft to acquire Activision Blizzard for $68.7 billion",
+        "Microsoft to acquire Activision Blizzard in $68.7 billion deal",
+        True,
+    ),
+    (
+        "Meta beats earnings estimates, stock surges in after-hours trading",
+        "Meta beats earnings estimates; shares surge in after-hours trading",
+        True,
+    ),
+    # Related but different stories
+    ("Apple unveils new iPhone at launch event", "Apple stock falls ahead of iPhone launch event", False),
+]
+
+
+@pytest.mark.parametrize("first, second, same_story", PAIRS)
+def test_merge_decision(first, second, same_story):
+    merged = is_near_duplicate(text_tokens(first), text_tokens(second), DEDUP_SIMILARITY_THRESHOLD)
+    assert merged == same_story
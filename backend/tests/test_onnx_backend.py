@@ -0,0 +1,36 @@
+"""
+Parity of the ONNX Runtime backend with the torch backend.
+
+Needs an exported model (python -m scripts.export_onnx); latency stays in
+scripts/benchmark_backends.py.
+"""
+from __future__ import annotations
+
+import os
+
+import numpy as np
+import pytest
+
+pytest.importorskip("onnxruntime")
+pytest.importorskip("torch")
+pytest.importorskip("transformers")
+
+from app.config import SENTIMENT_ONNX_DIR  # noqa: E402
+from app.core.sentiment import _PROBABILITY_BACKENDS  # noqa: E402
+from scripts.headlines import SAMPLE_HEADLINES  # noqa: E402
+
+# Largest allowed absolute difference of any class probability
+TOLERANCE = 1e-3
+
+pytestmark = pytest.mark.skipif(
+    not os.path.exists(os.path.join(SENTIMENT_ONNX_DIR, "model.onnx")),
+    reason=f"no exported ONNX model in {SENTIMENT_ONNX_DIR}",
+)
+
+
+def test_onnx_matches_torch():
+    torch_probs = _PROBABILITY_BACKENDS["torch"](SAMPLE_HEADLINES)
+    onnx_probs = _PROBABILITY_BACKENDS["onnx"](SAMPLE_HEADLINES)
+
+    assert float(np.abs(torch_probs - onnx_probs).max()) <= TOLERANCE
+    assert (torch_probs.argmax(axis=-1) == onnx_probs.argmax(axis=-1)).all()
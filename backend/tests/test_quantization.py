@@ -0,0 +1,42 @@
+"""
+Accuracy drift of the int8 dynamically quantized model against fp32 FinBERT.
+
+Runs on the fixed labelled headline set; throughput stays in
+scripts/evaluate_quantization.py.
+"""
+from __future__ import annotations
+
+import numpy as np
+import pytest
+
+pytest.importorskip("torch")
+pytest.importorskip("transformers")
+
+from app.core.sentiment import _torch_probabilities  # noqa: E402
+from scripts.headlines import SAMPLE_HEADLINES  # noqa: E402
+
+# Largest allowed absolute difference of any class probability
+MAX_PROBABILITY_DRIFT = 0.1
+
+# Smallest allowed share of headlines given the same label by both models
+MIN_LABEL_AGREEMENT = 0.9
+
+
+@pytest.fixture(scope="module")
+def probabilities():
+    """fp32 and int8 class probabilities of the headline set."""
+    return (
+        _torch_probabilities(SAMPLE_HEADLINES, quantized=False),
+        _torch_probabilities(SAMPLE_HEADLINES, quantized=True),
+    )
+
+
+def test_probability_drift_is_bounded(probabilities):
+    fp32_probs, int8_probs = probabilities
+    assert float(np.abs(fp32_probs - int8_probs).max()) <= MAX_PROBABILITY_DRIFT
+
+
+def test_labels_agree(probabilities):
+    fp32_probs, int8_probs = probabilities
+    agreement = float((fp32_probs.argmax(axis=-1) == int8_probs.argmax(axis=-1)).mean())
+    assert agreement >= MIN_LABEL_AGREEMENT
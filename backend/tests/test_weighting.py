@@ -0,0 +1,48 @@
+"""
+Agreement of the columnar weighting engine with the per-item weight functions.
+
+Timing stays in scripts/benchmark_weighting.py.
+"""
+from __future__ import annotations
+
+import numpy as np
+
+from app.core.batch import NewsBatch
+from app.core.sentiment import combine_weights
+from app.core.weighting import apply_batch_weights, combine_weight_arrays
+from scripts.benchmark_weighting import build_items, weight_per_item
+
+# The per-item loop reads the clock for every item, so its recency weights
+# drift slightly from the engine's single `now`; scores are float32 columns
+TOLERANCE = 1e-5
+
+
+def test_batch_weights_match_per_item_weights():
+    items = build_items(2000)
+    batch = NewsBatch.from_items(items)
+
+    weight_per_item(items)
+    apply_batch_weights(batch)
+
+    for column, field in (
+        (batch.recency_w, "recency_w"),
+        (batch.source_w, "source_w"),
+        (batch.engage_w, "engage_w"),
+        (batch.weight, "weight"),
+        (batch.weighted_score, "weighted_score"),
+    ):
+        expected = np.array([getattr(item, field) for item in items])
+        assert float(np.abs(column - expected).max()) <= TOLERANCE, field
+
+
+def test_combined_weight_is_shared_and_bounded():
+    recency = np.array([0.0, 0.5, 1.0, 1.0])
+    source = np.array([0.0, 0.9, 1.0, 0.2])
+    engagement = np.array([0.0, 0.5, 1.0, 0.0])
+
+    combined = combine_weight_arrays(recency, source, engagement)
+
+    assert combined.tolist() == [
+        combine_weights(r, s, e) for r, s, e in zip(recency.tolist(), source.tolist(), engagement.tolist())
+    ]
+    assert ((combined >= 0.0) & (combined <= 1.0)).all()